@@ -0,0 +1,64 @@
+""" Compares the body size and throughput of MessagePack and CBOR responses against JSONResponse
+
+Usage:
+    python -m benchmarks.bench_binary [--quick]
+"""
+from benchmarks.harness import measure
+from respond import JSONResponse, MsgpackResponse, CBORResponse, OrjsonEncoder
+from respond.binary_encoders import MsgpackEncoder, PureMsgpackEncoder, CBOREncoder, PureCBOREncoder
+
+from flask import Flask
+
+from typing import Any, Dict, List, Type
+import argparse
+import random
+
+
+def _records(count: int) -> List[dict]:
+    rng: random.Random = random.Random(0)
+    return [{"id": i, "name": f"user-{i}", "score": rng.random() * 100, "active": i % 2 == 0,
+             "tags": ["a", "b", "c"][:i % 4], "counts": [rng.randrange(1000) for _ in range(5)]}
+            for i in range(count)]
+
+
+PAYLOADS: Dict[str, Any] = {
+    "small": {"id": 1, "name": "respond", "tags": ["a", "b", "c"]},
+    "medium": _records(100),
+    "large": _records(10000),
+}
+
+
+def candidates() -> Dict[str, Type]:
+    """ Returns each response class to compare, skipping those whose library is not installed """
+    classes: Dict[str, Type] = {"json (jsonify)": JSONResponse}
+    if OrjsonEncoder.available:
+        classes["json (orjson)"] = JSONResponse.with_encoder(OrjsonEncoder())
+    if MsgpackEncoder.available:
+        classes["msgpack"] = MsgpackResponse.with_encoder(MsgpackEncoder())
+    classes["msgpack (pure Python)"] = MsgpackResponse.with_encoder(PureMsgpackEncoder())
+    if CBOREncoder.available:
+        classes["cbor"] = CBORResponse.with_encoder(CBOREncoder())
+    classes["cbor (pure Python)"] = CBORResponse.with_encoder(PureCBOREncoder())
+    return classes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Shorter runs, for a quick but noisier comparison")
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    with app.test_request_context("/"):
+        for payload_name, payload in PAYLOADS.items():
+            print(f"{payload_name} payload")
+            baseline: float = 0.0
+            for name, response_class in candidates().items():
+                size: int = len(response_class.ok(payload).get_data())
+                result: dict = measure(lambda: response_class.ok(payload), min_time=0.1 if args.quick else 0.5)
+                baseline = baseline or result["ops_per_sec"]
+                print(f"    {name:<24} {size:>10} bytes  {result['mean_us']:>12.2f} us/call  "
+                      f"{result['ops_per_sec'] / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+""" Measures the memory TextResponse and XMLResponse copy while sending str, bytes, bytearray and memoryview bodies
+
+Usage:
+    python -m benchmarks.bench_buffers [--size MB] [--quick]
+
+Each call builds a response and sends it the way a WSGI server does, iterating its body, which must yield bytes. Copies
+are the peak memory allocated during the call, in multiples of the body size: 1.00 means one full copy of the body was
+held at once. Buffers other than bytes are copied out a chunk at a time as they are sent, so they stay near 0.
+"""
+from benchmarks.harness import measure
+from respond import TextResponse, XMLResponse
+from respond.wsgi import WSGIResponder
+
+from flask import Flask, make_response
+from werkzeug.test import create_environ
+
+from typing import Any, Callable, Dict
+import argparse
+
+
+def _send(response: Any, environ: dict) -> int:
+    """ Iterates a response's body as a WSGI server would, returning the number of bytes sent """
+    sent: int = 0
+    for chunk in response(environ, lambda status, headers, exc_info=None: None):
+        if type(chunk) is not bytes:
+            raise TypeError("WSGI servers only accept bytes")  # As PEP 3333, wsgiref and Werkzeug's server require
+        sent += len(chunk)
+    return sent
+
+
+def bodies(size: int) -> Dict[str, Any]:
+    text: str = ("<row>respond</row>" * (size // 18 + 1))[:size]
+    return {
+        "str": text,
+        "bytes": text.encode("utf-8"),
+        "bytearray": bytearray(text.encode("utf-8")),
+        "memoryview": memoryview(text.encode("utf-8")),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=float, default=8, help="Body size in MB")
+    parser.add_argument("--quick", action="store_true", help="Shorter runs, for a quick but noisier comparison")
+    args = parser.parse_args()
+
+    size: int = int(args.size * 1024 * 1024)
+    app = Flask(__name__)
+    environ: dict = create_environ("/")
+    candidates: Dict[str, Callable[[Any], Any]] = {
+        "make_response": lambda body: make_response(body),
+        "TextResponse": TextResponse.ok,
+        "XMLResponse": XMLResponse.ok,
+        "WSGIResponder.text": WSGIResponder.text.ok,
+    }
+    with app.test_request_context("/"):
+        for body_name, body in bodies(size).items():
+            print(f"{args.size:g} MB {body_name} body")
+            for name, respond in candidates.items():
+                def call(respond: Callable[[Any], Any] = respond, body: Any = body) -> int:
+                    return _send(respond(body), environ)
+
+                try:
+                    sent: int = call()
+                except (TypeError, AssertionError):
+                    sent = -1
+                if sent != size:
+                    print(f"    {name:<20} {'does not send this body':>30}")
+                    continue
+                result: dict = measure(call, min_time=0.1 if args.quick else 0.5, min_calls=3)
+                copies: float = result["peak_alloc_bytes"] / size
+                print(f"    {name:<20} {result['mean_us']:>12.2f} us/call  {copies:>6.2f} copies")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+""" Compares the throughput of error responses built from error dicts with jsonify and as problem details
+
+Usage:
+    python -m benchmarks.bench_errors [--quick]
+
+Error storms, such as failed logins or rate limiting, send many small error responses at once. Each case builds the
+same kind of error the usual way, an error dict passed to JSONResponse, and as a ProblemResponse, whose members shared
+by every response of a status are encoded once and reused.
+"""
+from benchmarks.harness import measure
+from respond import JSONResponse, ProblemResponse
+
+from flask import Flask
+
+from typing import Any, Callable, Dict, Tuple
+import argparse
+import functools
+
+
+def cases() -> Dict[str, Tuple[Callable[[], Any], Callable[[], Any]]]:
+    """ Returns each case's call with an error dict and with problem details """
+    errors: dict = {"detail": "Invalid order", "errors": [{"field": "quantity", "message": "Must be positive"}]}
+    return {
+        "401, no details": (
+            functools.partial(JSONResponse.unauthorized, {"error": "Unauthorized"}),
+            ProblemResponse.unauthorized,
+        ),
+        "429, detail": (
+            functools.partial(JSONResponse.too_many_requests, {"error": "Too Many Requests",
+                                                               "detail": "Try again in 30 seconds"}),
+            functools.partial(ProblemResponse.too_many_requests, "Try again in 30 seconds"),
+        ),
+        "429, detail and header": (
+            functools.partial(JSONResponse.too_many_requests, {"error": "Too Many Requests",
+                                                               "detail": "Try again in 30 seconds"},
+                              {"Retry-After": "30"}),
+            functools.partial(ProblemResponse.too_many_requests, "Try again in 30 seconds", {"Retry-After": "30"}),
+        ),
+        "422, members": (
+            functools.partial(JSONResponse.unprocessable_entity, dict(errors, error="Unprocessable Entity")),
+            functools.partial(ProblemResponse.unprocessable_entity, errors),
+        ),
+        "503, detail": (
+            functools.partial(JSONResponse.service_unavailable, {"error": "Service Unavailable",
+                                                                 "detail": "Down for maintenance"}),
+            functools.partial(ProblemResponse.service_unavailable, "Down for maintenance"),
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Shorter runs, for a quick but noisier comparison")
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    with app.test_request_context("/"):
+        for case, (error_dict, problem) in cases().items():
+            print(case)
+            baseline: float = 0.0
+            for name, call in (("error dict", error_dict), ("problem details", problem)):
+                call()
+                result: dict = measure(call, min_time=0.2 if args.quick else 1.0, min_calls=100)
+                baseline = baseline or result["ops_per_sec"]
+                print(f"    {name:<20} {result['mean_us']:>10.2f} us/call  {result['ops_per_sec']:>10.0f} ops/s  "
+                      f"{result['ops_per_sec'] / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
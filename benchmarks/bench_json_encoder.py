@@ -0,0 +1,43 @@
+""" Compares JSONResponse built with jsonify against JSONResponse built with each installed encoder
+
+Usage:
+    python -m benchmarks.bench_json_encoder [--number N]
+"""
+from respond import JSONResponse, StdlibJSONEncoder, OrjsonEncoder, UJSONEncoder
+
+from flask import Flask
+
+import argparse
+import timeit
+
+
+PAYLOADS: dict = {
+    "small": {"id": 1, "name": "respond", "tags": ["a", "b", "c"]},
+    "medium": [{"id": i, "name": f"user-{i}", "active": i % 2 == 0, "score": i * 1.5} for i in range(1000)],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    candidates: dict = {"jsonify": JSONResponse}
+    for encoder_class in (StdlibJSONEncoder, UJSONEncoder, OrjsonEncoder):
+        if encoder_class.available:
+            candidates[encoder_class.__name__] = JSONResponse.with_encoder(encoder_class())
+
+    with app.app_context():
+        for payload_name, payload in PAYLOADS.items():
+            print(f"{payload_name} payload, {args.number} calls")
+            baseline: float = 0.0
+            for name, response_class in candidates.items():
+                seconds: float = min(timeit.repeat(lambda: response_class.ok(payload), number=args.number, repeat=3))
+                baseline = baseline or seconds
+                per_call: float = seconds / args.number * 1e6
+                print(f"    {name:<20} {per_call:>10.2f} us/call  {baseline / seconds:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+""" Compares the peak memory of sending a page of database rows as a Page and as a list built up front
+
+Usage:
+    python -m benchmarks.bench_pagination [--rows N] [--quick]
+
+Each call queries an in-memory SQLite table, builds a JSON response holding one page of its rows and sends the body the
+way a WSGI server does. A Page reads rows with fetchmany as the body is sent, so its peak stays near one batch of rows
+and one chunk of output, however large the page.
+"""
+from benchmarks.harness import measure
+from respond import JSONResponse, Page
+
+from flask import Flask
+from werkzeug.test import create_environ
+
+from typing import Any, Callable, Dict
+import argparse
+import sqlite3
+
+
+def _send(response: Any, environ: dict) -> int:
+    """ Iterates a response's body as a WSGI server would, returning the number of bytes sent """
+    return sum(len(chunk) for chunk in response(environ, lambda status, headers, exc_info=None: None))
+
+
+def _as_dict(row: tuple) -> dict:
+    return {"id": row[0], "name": row[1], "email": row[2], "score": row[3]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000, help="Rows in the page")
+    parser.add_argument("--quick", action="store_true", help="Shorter runs, for a quick but noisier comparison")
+    args = parser.parse_args()
+
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT, score REAL)")
+    connection.executemany("INSERT INTO users VALUES (?, ?, ?, ?)",
+                           ((i, f"user-{i}", f"user-{i}@example.com", i * 0.5) for i in range(args.rows + 1)))
+    query: str = "SELECT id, name, email, score FROM users ORDER BY id LIMIT ?"
+
+    def materialized() -> Any:
+        rows: list = [_as_dict(row) for row in connection.execute(query, (args.rows + 1,))]
+        items: list = rows[:args.rows]
+        return JSONResponse.ok({"items": items, "next": items[-1]["id"] if len(rows) > args.rows else None})
+
+    def paged(batch_size: int) -> Callable[[], Any]:
+        def respond() -> Any:
+            cursor: sqlite3.Cursor = connection.execute(query, (args.rows + 1,))
+            return JSONResponse.ok(Page(cursor, lambda row: row[0], limit=args.rows, convert=_as_dict,
+                                        batch_size=batch_size))
+        return respond
+
+    candidates: Dict[str, Callable[[], Any]] = {
+        "list": materialized,
+        "Page, batch 100": paged(100),
+        "Page, batch 1000": paged(1000),
+    }
+    app = Flask(__name__)
+    environ: dict = create_environ("/")
+    print(f"{args.rows} rows")
+    with app.test_request_context("/"):
+        for name, respond in candidates.items():
+            def call(respond: Callable[[], Any] = respond) -> int:
+                return _send(respond(), environ)
+
+            result: dict = measure(call, min_time=0.2 if args.quick else 1.0, min_calls=3)
+            print(f"    {name:<20} {result['mean_us'] / 1000:>12.2f} ms/call  "
+                  f"{result['peak_alloc_bytes'] / 1024:>10.0f} KiB peak")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+""" Compares JSONResponse encoding lists of dataclasses and slotted records with compiled serializers and generically
+
+Usage:
+    python -m benchmarks.bench_records [--rows N] [--quick]
+"""
+from benchmarks.harness import measure
+from respond import JSONResponse, StdlibJSONEncoder, OrjsonEncoder
+
+from flask import Flask
+
+from typing import Any, Callable, Dict, List
+from dataclasses import dataclass
+import argparse
+import functools
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    score: float
+    active: bool
+
+
+class SlottedUser(object):
+    __slots__ = ("id", "name", "score", "active")
+
+    id: int
+    name: str
+    score: float
+    active: bool
+
+    def __init__(self, id: int, name: str, score: float, active: bool):
+        self.id = id
+        self.name = name
+        self.score = score
+        self.active = active
+
+
+def _generic(response_class: type) -> type:
+    """ Returns a subclass of `response_class` which encodes records as dicts, through `default` """
+    return type(response_class.__name__, (response_class,), {"compile_records": False})
+
+
+def candidates() -> Dict[str, type]:
+    stdlib: type = JSONResponse.with_encoder(StdlibJSONEncoder())
+    classes: Dict[str, type] = {
+        "jsonify": _generic(JSONResponse),
+        "jsonify, compiled": JSONResponse,
+        "stdlib": _generic(stdlib),
+        "stdlib, compiled": stdlib,
+    }
+    if OrjsonEncoder.available:
+        classes["orjson"] = JSONResponse.with_encoder(OrjsonEncoder())
+    return classes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--quick", action="store_true", help="Shorter runs, for a quick but noisier comparison")
+    args = parser.parse_args()
+
+    payloads: Dict[str, List[Any]] = {
+        "dataclasses": [User(i, f"user-{i}", i * 0.5, i % 2 == 0) for i in range(args.rows)],
+        "slotted records": [SlottedUser(i, f"user-{i}", i * 0.5, i % 2 == 0) for i in range(args.rows)],
+    }
+    app = Flask(__name__)
+    with app.test_request_context("/"):
+        for payload_name, payload in payloads.items():
+            print(f"{args.rows} {payload_name}")
+            baseline: float = 0.0
+            for name, response_class in candidates().items():
+                call: Callable[[], Any] = functools.partial(response_class.ok, payload)
+                try:
+                    call()
+                except TypeError:
+                    print(f"    {name:<20} {'cannot encode these records':>26}")
+                    continue
+                result: dict = measure(call, min_time=0.2 if args.quick else 1.0, min_calls=3)
+                baseline = baseline or result["ops_per_sec"]
+                print(f"    {name:<20} {result['mean_us'] / 1000:>12.2f} ms/call  "
+                      f"{result['ops_per_sec'] / baseline:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+""" Measures the import time of the respond package, and whether each entry point imports Flask
+
+Each statement runs in a fresh interpreter, so nothing is already imported.
+
+Usage:
+    python -m benchmarks.bench_startup [--repeat N]
+"""
+import argparse
+import subprocess
+import statistics
+import sys
+
+
+STATEMENTS: dict = {
+    "import flask": "import flask",
+    "import respond": "import respond",
+    "respond.metrics": "from respond.metrics import MetricsCollector",
+    "respond.wsgi": "from respond.wsgi import WSGIResponder",
+    "respond.asgi": "from respond.asgi import AsyncResponder",
+    "respond.Responder": "from respond import Responder",
+}
+
+_SCRIPT: str = """
+import sys, time
+started = time.perf_counter()
+{statement}
+print(time.perf_counter() - started, "flask" in sys.modules)
+"""
+
+
+def measure(statement: str) -> tuple:
+    """ Returns the seconds taken to run `statement` in a fresh interpreter, and whether it imported Flask """
+    output: str = subprocess.run(
+        [sys.executable, "-c", _SCRIPT.format(statement=statement)], stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, check=True
+    ).stdout
+    seconds, flask_imported = output.split()
+    return float(seconds), flask_imported == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"median of {args.repeat} fresh interpreters")
+    for name, statement in STATEMENTS.items():
+        runs: list = [measure(statement) for _ in range(args.repeat)]
+        median: float = statistics.median(seconds for seconds, _ in runs)
+        print(f"    {name:<20} {median * 1e3:>8.2f} ms  imports flask: {runs[0][1]}")
+
+
+if __name__ == "__main__":
+    main()
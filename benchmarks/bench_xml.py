@@ -0,0 +1,85 @@
+""" Compares building a whole XML document before responding against serializing data with XMLResponse
+
+Usage:
+    python -m benchmarks.bench_xml [--rows N] [--quick]
+"""
+from benchmarks.harness import measure
+from respond import Responder
+
+from flask import Flask
+
+from typing import Any, Callable, Iterator, List, Tuple
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+import argparse
+
+
+def _records(count: int) -> List[dict]:
+    return [{"id": i, "name": f"user-{i}", "email": f"user-{i}@example.com", "active": i % 2 == 0}
+            for i in range(count)]
+
+
+def _concatenated(records: List[dict]) -> str:
+    xml: str = '<?xml version="1.0" encoding="UTF-8"?><users>'
+    for r in records:
+        xml += (f'<user id="{r["id"]}"><name>{escape(r["name"])}</name><email>{escape(r["email"])}</email>'
+                f'<active>{str(r["active"]).lower()}</active></user>')
+    return xml + "</users>"
+
+
+def _element(record: dict) -> ElementTree.Element:
+    user: ElementTree.Element = ElementTree.Element("user", id=str(record["id"]))
+    for key in ("name", "email"):
+        ElementTree.SubElement(user, key).text = record[key]
+    ElementTree.SubElement(user, "active").text = str(record["active"]).lower()
+    return user
+
+
+def _tree(records: List[dict]) -> bytes:
+    root: ElementTree.Element = ElementTree.Element("users")
+    root.extend(_element(r) for r in records)
+    return ElementTree.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def _elements(records: List[dict]) -> Iterator[ElementTree.Element]:
+    return (_element(r) for r in records)
+
+
+def _dicts(records: List[dict]) -> List[dict]:
+    return [{"@id": r["id"], "name": r["name"], "email": r["email"], "active": r["active"]} for r in records]
+
+
+def _consume(response: Any) -> int:
+    """ Reads the whole body, as the server would, and returns its size """
+    return sum(len(chunk) for chunk in response.response)
+
+
+def scenarios(records: List[dict]) -> List[Tuple[str, Callable[[], Any]]]:
+    return [
+        ("string concatenation + xml.ok", lambda: _consume(Responder.xml.ok(_concatenated(records)))),
+        ("ElementTree.tostring + xml.ok", lambda: _consume(Responder.xml.ok(_tree(records)))),
+        ("xml.ok(dicts)", lambda: _consume(Responder.xml.ok({"user": _dicts(records)}, root="users"))),
+        ("xml.ok(dicts, stream=True)",
+         lambda: _consume(Responder.xml.ok({"user": _dicts(records)}, root="users", stream=True))),
+        ("xml.ok(element generator)", lambda: _consume(Responder.xml.ok(_elements(records), root="users"))),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--quick", action="store_true", help="Shorter runs, for a quick but noisier comparison")
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    records: List[dict] = _records(args.rows)
+    print(f"{args.rows} rows, peak memory is traced during a single response")
+    with app.test_request_context("/"):
+        for name, func in scenarios(records):
+            result: dict = measure(func, min_time=0.2 if args.quick else 1.0, min_calls=3, warmup=1)
+            print(f"    {name:<32} {result['mean_us'] / 1e3:>9.2f} ms  "
+                  f"peak {result['peak_alloc_bytes'] / 1024 / 1024:>7.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+""" Compares two result files written by `python -m benchmarks.suite --output`
+
+Usage:
+    python -m benchmarks.compare BASELINE.json CANDIDATE.json [--threshold PERCENT]
+
+Exits with status 1 if any benchmark's throughput dropped by more than the threshold.
+"""
+from typing import Dict
+import argparse
+import json
+import sys
+
+
+def _load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed throughput drop, in percent")
+    args = parser.parse_args()
+
+    baseline: dict = _load(args.baseline)
+    candidate: dict = _load(args.candidate)
+    print(f"baseline  {baseline['environment']['commit']}  candidate  {candidate['environment']['commit']}")
+
+    regressions: Dict[str, float] = {}
+    print(f"{'benchmark':<48} {'baseline ops/s':>15} {'candidate ops/s':>16} {'change':>8}")
+    for name, result in sorted(candidate["results"].items()):
+        previous: dict = baseline["results"].get(name)
+        if previous is None:
+            continue
+        change: float = (result["ops_per_sec"] / previous["ops_per_sec"] - 1) * 100
+        if change < -args.threshold:
+            regressions[name] = change
+        print(f"{name:<48} {previous['ops_per_sec']:>15.0f} {result['ops_per_sec']:>16.0f} {change:>+7.1f}%")
+
+    if regressions:
+        print(f"{len(regressions)} benchmarks regressed by more than {args.threshold}%:")
+        for name, change in regressions.items():
+            print(f"    {name} {change:+.1f}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+""" Measurement helpers shared by the benchmarks """
+from typing import Any, Callable, Dict, List
+import platform
+import subprocess
+import statistics
+import tracemalloc
+import time
+import gc
+import sys
+
+
+def _percentile(ordered: List[float], fraction: float) -> float:
+    index: int = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(func: Callable[[], Any], min_time: float = 0.2, min_calls: int = 5, max_calls: int = 100000,
+            warmup: int = 3) -> dict:
+    """ Calls `func` repeatedly and returns its throughput, latency percentiles and allocations per call
+
+    Calls are made until `min_time` seconds have passed and `min_calls` calls have been made, or until `max_calls`
+    calls have been made. The garbage collector is
+    disabled while timing, so collections triggered by earlier benchmarks do not land in the measurements.
+    """
+    for _ in range(warmup):
+        func()
+
+    latencies: List[float] = []
+    perf_counter: Callable[[], float] = time.perf_counter
+    gc.collect()
+    gc.disable()
+    try:
+        started: float = perf_counter()
+        deadline: float = started + min_time
+        while len(latencies) < max_calls:
+            call_started: float = perf_counter()
+            func()
+            finished: float = perf_counter()
+            latencies.append(finished - call_started)
+            if finished >= deadline and len(latencies) >= min_calls:
+                break
+        elapsed: float = perf_counter() - started
+    finally:
+        gc.enable()
+
+    latencies.sort()
+    result: Dict[str, Any] = {
+        "calls": len(latencies),
+        "ops_per_sec": len(latencies) / elapsed,
+        "mean_us": statistics.mean(latencies) * 1e6,
+        "p50_us": _percentile(latencies, 0.50) * 1e6,
+        "p90_us": _percentile(latencies, 0.90) * 1e6,
+        "p99_us": _percentile(latencies, 0.99) * 1e6,
+    }
+    result.update(measure_allocations(func))
+    return result
+
+
+def measure_allocations(func: Callable[[], Any], calls: int = 20) -> dict:
+    """ Returns the peak bytes traced during a single call, and the memory blocks still allocated afterwards """
+    gc.collect()
+    blocks_before: int = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        peaks: List[int] = []
+        for _ in range(calls):
+            if hasattr(tracemalloc, "reset_peak"):  # Python 3.9+
+                tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            result = func()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+            del result
+    finally:
+        tracemalloc.stop()
+    gc.collect()
+    return {
+        "peak_alloc_bytes": statistics.median(peaks),
+        "retained_blocks_per_call": max(0, sys.getallocatedblocks() - blocks_before) / calls,
+    }
+
+
+def environment() -> dict:
+    """ Describes the interpreter, platform and commit the results were measured with """
+    try:
+        commit: str = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            universal_newlines=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = "unknown"
+    try:
+        from importlib.metadata import version
+        flask_version: str = version("flask")
+    except Exception:  # pragma: no cover - Python 3.6/3.7, or Flask not installed as a distribution
+        flask_version = "unknown"
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "flask": flask_version,
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
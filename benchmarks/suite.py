@@ -0,0 +1,143 @@
+""" Benchmarks every response class against raw Flask, with small, medium and multi-MB payloads
+
+Usage:
+    python -m benchmarks.suite [--quick] [--filter SUBSTRING] [--output results.json] [--tolerance 0.9]
+
+Results are printed as a table, and written as JSON with --output so they can be compared across commits with
+`python -m benchmarks.compare`. The suite exits with status 1 if a response class is slower than the Flask call it
+wraps by more than the tolerance, see `GATES`.
+"""
+from respond import Responder
+from respond.abs_http_response import HTTPResponse
+from respond.wsgi import WSGIResponder
+
+from benchmarks.harness import measure, environment
+
+from flask import Flask, jsonify, make_response
+
+from typing import Any, Callable, Dict, List, Tuple
+import argparse
+import inspect
+import random
+import json
+import sys
+
+
+#: Number of records in each payload size, chosen so the large payloads serialize to a few MB
+SIZES: Dict[str, int] = {"small": 1, "medium": 500, "large": 40000}
+
+
+#: (benchmark, baseline) pairs where the benchmark must reach the baseline's ops/s, within the tolerance
+GATES: List[Tuple[str, str]] = [("json.ok/small", "flask.jsonify/small")]
+
+
+def _records(count: int) -> List[dict]:
+    rng: random.Random = random.Random(count)  # Seeded, so every run serializes the same bytes
+    return [
+        {"id": i, "name": f"user-{rng.randrange(10 ** 6)}", "active": rng.random() < 0.5, "score": rng.random() * 100}
+        for i in range(count)
+    ]
+
+
+def _xml(records: List[dict]) -> str:
+    rows: str = "".join(
+        f'<user id="{r["id"]}"><name>{r["name"]}</name><active>{r["active"]}</active><score>{r["score"]}</score></user>'
+        for r in records
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><users>{rows}</users>'
+
+
+def _text(records: List[dict]) -> str:
+    return "\n".join(f'{r["id"]}\t{r["name"]}\t{r["active"]}\t{r["score"]}' for r in records)
+
+
+def payload_scenarios() -> List[Tuple[str, Callable[[], Any]]]:
+    """ Returns (name, function) pairs for each response class, its raw WSGI variant, and the Flask call it wraps """
+    cases: List[Tuple[str, Callable[[], Any]]] = []
+    for size, count in SIZES.items():
+        records: List[dict] = _records(count)
+        xml: str = _xml(records)
+        text: str = _text(records)
+        cases += [
+            (f"flask.jsonify/{size}", lambda records=records: make_response(jsonify(records), 200)),
+            (f"json.ok/{size}", lambda records=records: Responder.json.ok(records)),
+            (f"wsgi.json.ok/{size}", lambda records=records: WSGIResponder.json.ok(records)),
+            (f"flask.make_response.xml/{size}", lambda xml=xml: make_response(xml, 200)),
+            (f"xml.ok/{size}", lambda xml=xml: Responder.xml.ok(xml)),
+            (f"wsgi.xml.ok/{size}", lambda xml=xml: WSGIResponder.xml.ok(xml)),
+            (f"flask.make_response.text/{size}", lambda text=text: make_response(text, 200)),
+            (f"text.ok/{size}", lambda text=text: Responder.text.ok(text)),
+            (f"wsgi.text.ok/{size}", lambda text=text: WSGIResponder.text.ok(text)),
+        ]
+    return cases
+
+
+def status_scenarios() -> List[Tuple[str, Callable[[], Any]]]:
+    """ Returns (name, function) pairs calling every status helper of every response class, with and without data """
+    cases: List[Tuple[str, Callable[[], Any]]] = []
+    small: List[dict] = _records(SIZES["small"])
+    helpers: List[str] = [
+        name for name, member in inspect.getmembers(HTTPResponse, inspect.ismethod)
+        if (member.__doc__ or "").strip().startswith("HTTP ")
+    ]
+    for format_name in ("json", "xml", "text"):
+        response_class = getattr(Responder, format_name)
+        data: Any = small if format_name == "json" else "respond"
+        for helper in helpers:
+            method: Callable[..., Any] = getattr(response_class, helper)
+            cases.append((f"{format_name}.{helper}/data", lambda method=method, data=data: method(data)))
+            cases.append((f"{format_name}.{helper}/empty", method))
+    return cases
+
+
+def check_gates(results: Dict[str, dict], tolerance: float) -> List[str]:
+    """ Returns a message for each gate whose benchmark ran slower than `tolerance` times its baseline's ops/s """
+    failures: List[str] = []
+    for name, baseline in GATES:
+        if name not in results or baseline not in results:
+            continue
+        ratio: float = results[name]["ops_per_sec"] / results[baseline]["ops_per_sec"]
+        if ratio < tolerance:
+            failures.append(f"{name} runs at {ratio:.0%} of {baseline}, below the {tolerance:.0%} tolerance")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Spend less time on each benchmark")
+    parser.add_argument("--filter", default="", help="Only run benchmarks whose name contains this")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.9,
+                        help="Fail if a gated benchmark reaches less than this fraction of its baseline's ops/s")
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    min_time: float = 0.05 if args.quick else 0.5
+    results: Dict[str, dict] = {}
+
+    print(f"{'benchmark':<48} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10} {'peak KiB':>10}")
+    with app.test_request_context("/"):
+        # Status helpers are cheap and numerous, so they get a shorter budget than the payload benchmarks
+        for cases, budget in ((payload_scenarios(), min_time), (status_scenarios(), min_time / 5)):
+            for name, func in cases:
+                if args.filter not in name:
+                    continue
+                result: dict = measure(func, min_time=budget)
+                results[name] = result
+                print(f"{name:<48} {result['ops_per_sec']:>12.0f} {result['p50_us']:>10.1f} "
+                      f"{result['p99_us']:>10.1f} {result['peak_alloc_bytes'] / 1024:>10.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({"environment": environment(), "results": results}, fh, indent=2, sort_keys=True)
+        print(f"Wrote {len(results)} results to {args.output}")
+
+    failures: List[str] = check_gates(results, args.tolerance)
+    for failure in failures:
+        print(f"Regression: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
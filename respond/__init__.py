@@ -1,4 +1,88 @@
-from .json_response import JSONResponse
-from .xml_response import XMLResponse
-from .text_response import TextResponse
-from .responder import Responder
+from typing import Dict, List, Any, TYPE_CHECKING
+import importlib
+import sys
+
+
+#: The module each public name is defined in. Modules are imported the first time one of their names is used, so
+#: importing the package, or only the parts of it that do not need Flask, does not import Flask
+_EXPORTS: Dict[str, str] = {
+    "JSONResponse": ".json_response",
+    "XMLResponse": ".xml_response",
+    "TextResponse": ".text_response",
+    "FileResponse": ".file_response",
+    "AutoResponse": ".auto_response",
+    "MsgpackResponse": ".binary_response",
+    "CBORResponse": ".binary_response",
+    "SSEResponse": ".sse",
+    "ProblemResponse": ".problem",
+    "Event": ".sse",
+    "Responder": ".responder",
+    "JSONEncoder": ".encoders",
+    "StdlibJSONEncoder": ".encoders",
+    "OrjsonEncoder": ".encoders",
+    "UJSONEncoder": ".encoders",
+    "fastest_encoder": ".encoders",
+    "RawJSON": ".encoders",
+    "BinaryEncoder": ".binary_encoders",
+    "MsgpackEncoder": ".binary_encoders",
+    "PureMsgpackEncoder": ".binary_encoders",
+    "CBOREncoder": ".binary_encoders",
+    "PureCBOREncoder": ".binary_encoders",
+    "ResponseTemplate": ".template",
+    "BodyCache": ".body_cache",
+    "SharedBodyCache": ".shared_cache",
+    "ResponseCache": ".response_cache",
+    "SingleFlight": ".single_flight",
+    "Page": ".pagination",
+    "Compression": ".compression",
+    "WSGIResponder": ".wsgi",
+    "RawResponse": ".wsgi",
+    "AsyncResponder": ".asgi",
+    "ASGIResponse": ".asgi",
+    "StatusInfo": ".status",
+    "STATUSES": ".status",
+    "MetricsCollector": ".metrics",
+    "set_collector": ".metrics",
+    "get_collector": ".metrics",
+}
+
+__all__: List[str] = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module: str = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups find the name directly, without calling __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if TYPE_CHECKING or sys.version_info < (3, 7):  # pragma: no cover
+    # Module __getattr__ needs Python 3.7, and type checkers need the names spelled out
+    from .json_response import JSONResponse
+    from .xml_response import XMLResponse
+    from .text_response import TextResponse
+    from .file_response import FileResponse
+    from .auto_response import AutoResponse
+    from .binary_response import MsgpackResponse, CBORResponse
+    from .sse import SSEResponse, Event
+    from .problem import ProblemResponse
+    from .responder import Responder
+    from .encoders import JSONEncoder, StdlibJSONEncoder, OrjsonEncoder, UJSONEncoder, fastest_encoder, RawJSON
+    from .binary_encoders import BinaryEncoder, MsgpackEncoder, PureMsgpackEncoder, CBOREncoder, PureCBOREncoder
+    from .template import ResponseTemplate
+    from .body_cache import BodyCache
+    from .shared_cache import SharedBodyCache
+    from .response_cache import ResponseCache
+    from .single_flight import SingleFlight
+    from .pagination import Page
+    from .compression import Compression
+    from .wsgi import WSGIResponder, RawResponse
+    from .asgi import AsyncResponder, ASGIResponse
+    from .status import StatusInfo, STATUSES
+    from .metrics import MetricsCollector, set_collector, get_collector
@@ -1,312 +1,431 @@
-from typing import Optional, Any
+from .template import ResponseTemplate
+from .body_cache import BodyCache
+from .status import STATUSES, StatusInfo, status_info, allows_body
+from . import metrics
+
+from typing import Optional, Any, Callable, Hashable, Union
 from http import HTTPStatus
+import inspect
+import time
 import abc
 
 
+#: Options which shape the headers rather than the body, kept for statuses which must not carry a body
+_HEADER_OPTIONS: tuple = ("etag", "weak_etag", "last_modified")
+
+
 class HTTPResponse(abc.ABC):
     """ HTTPResponse abstract base class """
 
+    #: When True, calls made without data, headers or options reuse a response built once per status
+    prebuild_empty: bool = False
+
+    #: Serialized bodies of calls which pass `cache_key`, shared by every response class unless a subclass sets its own
+    body_cache: BodyCache = BodyCache()
+
     @classmethod
     @abc.abstractmethod
     def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         raise NotImplementedError
-    
+
+    @classmethod
+    def template(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None,
+                 **kwargs) -> ResponseTemplate:
+        """ Returns a template which builds this response once, then stamps out copies of it
+
+        Templates are never compressed, as the frozen body is sent to every client whatever encodings it accepts.
+        """
+        kwargs["compress"] = False
+        if not allows_body(status):
+            return ResponseTemplate(lambda: cls._make_bodiless_response(status, headers, **kwargs))
+        return ResponseTemplate(lambda: cls._make_response(status, data, headers, **kwargs))
+
+    @classmethod
+    def _make_bodiless_response(cls, status: int, headers: Optional[dict] = None, **kwargs):
+        """ Returns a response to a status which must not carry a body, such as 205 Reset Content
+
+        Classes serialize None as a body of their own, such as "" in JSON, which is emptied here rather than sent.
+        """
+        response = cls._make_response(status, None, headers, **kwargs)
+        if getattr(response, "is_streamed", True) is False:
+            response.set_data(b"")
+        return response
+
+    @classmethod
+    def _cached_body(cls, cache_key: Optional[Hashable], encode: Callable[[], bytes]) -> Union[bytes, memoryview]:
+        """ Returns the body this class cached for `cache_key`, or `encode()` when there is none or no key
+
+        The key must identify the body, such as an id and a version: data passed with a cached key is not encoded.
+        Caches in shared memory return a memoryview of the body rather than a copy of it.
+        """
+        if cache_key is None:
+            return encode()
+        return cls.body_cache.get_or_set(cache_key, encode, cls)
+
+    @classmethod
+    def _renders(cls, data: Any) -> bool:
+        """ Returns whether `data` can be sent in this class's format, which AutoResponse asks before offering it """
+        return True
+
+    @classmethod
+    def _respond(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ Returns the response for a status method call, recording it if a metrics collector is registered """
+        collector: Optional[metrics.MetricsCollector] = metrics.collector
+        if collector is None:
+            return cls._build_response(status, data, headers, **kwargs)
+        started: float = time.perf_counter()
+        response = cls._build_response(status, data, headers, **kwargs)
+        if inspect.isawaitable(response):
+            return metrics.record_when_awaited(collector, cls.__name__, status, started, response)
+        collector.record(
+            cls.__name__, metrics.response_status(response, status), time.perf_counter() - started,
+            metrics.body_size(response)
+        )
+        return response
+
+    @classmethod
+    def _build_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ Returns a response from a prebuilt template if the call allows it, otherwise from `_make_response`
+
+        Data is dropped for statuses which must not carry a body, such as 204 and 304, so it is never serialized, and
+        the status's default headers are added under the caller's.
+        """
+        info: Optional[StatusInfo] = STATUSES.get(status)
+        if info is not None:
+            if not info.allows_body:
+                data = None
+                if kwargs:
+                    kwargs = {k: v for k, v in kwargs.items() if k in _HEADER_OPTIONS}
+            if info.headers:
+                headers = dict(info.headers, **headers) if headers else dict(info.headers)
+        if data is None and not headers and not kwargs and cls.prebuild_empty:
+            templates: Optional[dict] = cls.__dict__.get("_empty_templates")
+            if templates is None:
+                templates = {}
+                setattr(cls, "_empty_templates", templates)
+            template: Optional[ResponseTemplate] = templates.get(status)
+            if template is None:
+                template = templates.setdefault(status, cls.template(status))
+            return template()
+        if info is not None and not info.allows_body:
+            return cls._make_bodiless_response(status, headers, **kwargs)
+        return cls._make_response(status, data, headers, **kwargs)
+
+    @classmethod
+    def status(cls, code: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ Returns a response with any status code, such as one relayed from an upstream service
+
+        Example usage:
+            Responder.json.status(upstream.status_code, upstream.json())
+        """
+        return cls._respond(status_info(code).code, data, headers, **kwargs)
+
     @classmethod
     def continue_(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 100 CONTINUE """
-        return cls._make_response(HTTPStatus.CONTINUE, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.CONTINUE, data, headers, **kwargs)
 
     @classmethod
     def switching_protocols(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 101 SWITCHING_PROTOCOLS """
-        return cls._make_response(HTTPStatus.SWITCHING_PROTOCOLS, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.SWITCHING_PROTOCOLS, data, headers, **kwargs)
 
     @classmethod
     def processing(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 102 PROCESSING """
-        return cls._make_response(HTTPStatus.PROCESSING, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.PROCESSING, data, headers, **kwargs)
+
+    @classmethod
+    def early_hints(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ HTTP 103 EARLY_HINTS """
+        return cls._respond(103, data, headers, **kwargs)
 
     @classmethod
     def ok(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 200 OK """
-        return cls._make_response(HTTPStatus.OK, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.OK, data, headers, **kwargs)
 
     @classmethod
     def created(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 201 CREATED """
-        return cls._make_response(HTTPStatus.CREATED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.CREATED, data, headers, **kwargs)
 
     @classmethod
     def accepted(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 202 ACCEPTED """
-        return cls._make_response(HTTPStatus.ACCEPTED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.ACCEPTED, data, headers, **kwargs)
 
     @classmethod
     def non_authoritative_information(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 203 NON_AUTHORITATIVE_INFORMATION """
-        return cls._make_response(HTTPStatus.NON_AUTHORITATIVE_INFORMATION, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.NON_AUTHORITATIVE_INFORMATION, data, headers, **kwargs)
 
     @classmethod
     def no_content(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 204 NO_CONTENT """
-        return cls._make_response(HTTPStatus.NO_CONTENT, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.NO_CONTENT, data, headers, **kwargs)
 
     @classmethod
     def reset_content(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 205 RESET_CONTENT """
-        return cls._make_response(HTTPStatus.RESET_CONTENT, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.RESET_CONTENT, data, headers, **kwargs)
 
     @classmethod
     def partial_content(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 206 PARTIAL_CONTENT """
-        return cls._make_response(HTTPStatus.PARTIAL_CONTENT, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.PARTIAL_CONTENT, data, headers, **kwargs)
 
     @classmethod
     def multi_status(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 207 MULTI_STATUS """
-        return cls._make_response(HTTPStatus.MULTI_STATUS, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.MULTI_STATUS, data, headers, **kwargs)
 
     @classmethod
     def already_reported(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 208 ALREADY_REPORTED """
-        return cls._make_response(HTTPStatus.ALREADY_REPORTED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.ALREADY_REPORTED, data, headers, **kwargs)
 
     @classmethod
     def im_used(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 226 IM_USED """
-        return cls._make_response(HTTPStatus.IM_USED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.IM_USED, data, headers, **kwargs)
 
     @classmethod
     def multiple_choices(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 300 MULTIPLE_CHOICES """
-        return cls._make_response(HTTPStatus.MULTIPLE_CHOICES, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.MULTIPLE_CHOICES, data, headers, **kwargs)
 
     @classmethod
     def moved_permanently(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 301 MOVED_PERMANENTLY """
-        return cls._make_response(HTTPStatus.MOVED_PERMANENTLY, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.MOVED_PERMANENTLY, data, headers, **kwargs)
 
     @classmethod
     def found(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 302 FOUND """
-        return cls._make_response(HTTPStatus.FOUND, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.FOUND, data, headers, **kwargs)
 
     @classmethod
     def see_other(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 303 SEE_OTHER """
-        return cls._make_response(HTTPStatus.SEE_OTHER, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.SEE_OTHER, data, headers, **kwargs)
 
     @classmethod
     def not_modified(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 304 NOT_MODIFIED """
-        return cls._make_response(HTTPStatus.NOT_MODIFIED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.NOT_MODIFIED, data, headers, **kwargs)
 
     @classmethod
     def use_proxy(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 305 USE_PROXY """
-        return cls._make_response(HTTPStatus.USE_PROXY, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.USE_PROXY, data, headers, **kwargs)
 
     @classmethod
     def temporary_redirect(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 307 TEMPORARY_REDIRECT """
-        return cls._make_response(HTTPStatus.TEMPORARY_REDIRECT, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.TEMPORARY_REDIRECT, data, headers, **kwargs)
 
     @classmethod
     def permanent_redirect(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 308 PERMANENT_REDIRECT """
-        return cls._make_response(HTTPStatus.PERMANENT_REDIRECT, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.PERMANENT_REDIRECT, data, headers, **kwargs)
 
     @classmethod
     def bad_request(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 400 BAD_REQUEST """
-        return cls._make_response(HTTPStatus.BAD_REQUEST, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.BAD_REQUEST, data, headers, **kwargs)
 
     @classmethod
     def unauthorized(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 401 UNAUTHORIZED """
-        return cls._make_response(HTTPStatus.UNAUTHORIZED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.UNAUTHORIZED, data, headers, **kwargs)
 
     @classmethod
     def payment_required(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 402 PAYMENT_REQUIRED """
-        return cls._make_response(HTTPStatus.PAYMENT_REQUIRED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.PAYMENT_REQUIRED, data, headers, **kwargs)
 
     @classmethod
     def forbidden(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 403 FORBIDDEN """
-        return cls._make_response(HTTPStatus.FORBIDDEN, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.FORBIDDEN, data, headers, **kwargs)
 
     @classmethod
     def not_found(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 404 NOT_FOUND """
-        return cls._make_response(HTTPStatus.NOT_FOUND, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.NOT_FOUND, data, headers, **kwargs)
 
     @classmethod
     def method_not_allowed(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 405 METHOD_NOT_ALLOWED """
-        return cls._make_response(HTTPStatus.METHOD_NOT_ALLOWED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.METHOD_NOT_ALLOWED, data, headers, **kwargs)
 
     @classmethod
     def not_acceptable(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 406 NOT_ACCEPTABLE """
-        return cls._make_response(HTTPStatus.NOT_ACCEPTABLE, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.NOT_ACCEPTABLE, data, headers, **kwargs)
 
     @classmethod
     def proxy_authentication_required(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 407 PROXY_AUTHENTICATION_REQUIRED """
-        return cls._make_response(HTTPStatus.PROXY_AUTHENTICATION_REQUIRED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.PROXY_AUTHENTICATION_REQUIRED, data, headers, **kwargs)
 
     @classmethod
     def request_timeout(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 408 REQUEST_TIMEOUT """
-        return cls._make_response(HTTPStatus.REQUEST_TIMEOUT, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.REQUEST_TIMEOUT, data, headers, **kwargs)
 
     @classmethod
     def conflict(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 409 CONFLICT """
-        return cls._make_response(HTTPStatus.CONFLICT, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.CONFLICT, data, headers, **kwargs)
 
     @classmethod
     def gone(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 410 GONE """
-        return cls._make_response(HTTPStatus.GONE, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.GONE, data, headers, **kwargs)
 
     @classmethod
     def length_required(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 411 LENGTH_REQUIRED """
-        return cls._make_response(HTTPStatus.LENGTH_REQUIRED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.LENGTH_REQUIRED, data, headers, **kwargs)
 
     @classmethod
     def precondition_failed(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 412 PRECONDITION_FAILED """
-        return cls._make_response(HTTPStatus.PRECONDITION_FAILED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.PRECONDITION_FAILED, data, headers, **kwargs)
 
     @classmethod
     def request_entity_too_large(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 413 REQUEST_ENTITY_TOO_LARGE """
-        return cls._make_response(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, data, headers, **kwargs)
 
     @classmethod
     def request_uri_too_long(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 414 REQUEST_URI_TOO_LONG """
-        return cls._make_response(HTTPStatus.REQUEST_URI_TOO_LONG, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.REQUEST_URI_TOO_LONG, data, headers, **kwargs)
 
     @classmethod
     def unsupported_media_type(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 415 UNSUPPORTED_MEDIA_TYPE """
-        return cls._make_response(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, data, headers, **kwargs)
 
     @classmethod
     def requested_range_not_satisfiable(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 416 REQUESTED_RANGE_NOT_SATISFIABLE """
-        return cls._make_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, data, headers, **kwargs)
 
     @classmethod
     def expectation_failed(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 417 EXPECTATION_FAILED """
-        return cls._make_response(HTTPStatus.EXPECTATION_FAILED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.EXPECTATION_FAILED, data, headers, **kwargs)
 
     @classmethod
     def im_a_teapot(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 418 IM_A_TEAPOT """
-        return cls._make_response(418, data, headers, **kwargs)
+        return cls._respond(418, data, headers, **kwargs)
 
     @classmethod
     def misdirected_request(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 421 MISDIRECTED_REQUEST """
-        return cls._make_response(HTTPStatus.MISDIRECTED_REQUEST, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.MISDIRECTED_REQUEST, data, headers, **kwargs)
 
     @classmethod
     def unprocessable_entity(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 422 UNPROCESSABLE_ENTITY """
-        return cls._make_response(HTTPStatus.UNPROCESSABLE_ENTITY, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.UNPROCESSABLE_ENTITY, data, headers, **kwargs)
 
     @classmethod
     def locked(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 423 LOCKED """
-        return cls._make_response(HTTPStatus.LOCKED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.LOCKED, data, headers, **kwargs)
 
     @classmethod
     def failed_dependency(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 424 FAILED_DEPENDENCY """
-        return cls._make_response(HTTPStatus.FAILED_DEPENDENCY, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.FAILED_DEPENDENCY, data, headers, **kwargs)
+
+    @classmethod
+    def too_early(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ HTTP 425 TOO_EARLY """
+        return cls._respond(425, data, headers, **kwargs)
 
     @classmethod
     def upgrade_required(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 426 UPGRADE_REQUIRED """
-        return cls._make_response(HTTPStatus.UPGRADE_REQUIRED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.UPGRADE_REQUIRED, data, headers, **kwargs)
 
     @classmethod
     def precondition_required(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 428 PRECONDITION_REQUIRED """
-        return cls._make_response(HTTPStatus.PRECONDITION_REQUIRED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.PRECONDITION_REQUIRED, data, headers, **kwargs)
 
     @classmethod
     def too_many_requests(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 429 TOO_MANY_REQUESTS """
-        return cls._make_response(HTTPStatus.TOO_MANY_REQUESTS, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.TOO_MANY_REQUESTS, data, headers, **kwargs)
 
     @classmethod
     def request_header_fields_too_large(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 431 REQUEST_HEADER_FIELDS_TOO_LARGE """
-        return cls._make_response(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, data, headers, **kwargs)
 
     @classmethod
     def unavailable_for_legal_reasons(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 451 UNAVAILABLE_FOR_LEGAL_REASONS """
-        return cls._make_response(HTTPStatus.UNAVAILABLE_FOR_LEGAL_REASONS, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.UNAVAILABLE_FOR_LEGAL_REASONS, data, headers, **kwargs)
 
     @classmethod
     def internal_server_error(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 500 INTERNAL_SERVER_ERROR """
-        return cls._make_response(HTTPStatus.INTERNAL_SERVER_ERROR, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.INTERNAL_SERVER_ERROR, data, headers, **kwargs)
 
     @classmethod
     def not_implemented(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 501 NOT_IMPLEMENTED """
-        return cls._make_response(HTTPStatus.NOT_IMPLEMENTED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.NOT_IMPLEMENTED, data, headers, **kwargs)
 
     @classmethod
     def bad_gateway(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 502 BAD_GATEWAY """
-        return cls._make_response(HTTPStatus.BAD_GATEWAY, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.BAD_GATEWAY, data, headers, **kwargs)
 
     @classmethod
     def service_unavailable(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 503 SERVICE_UNAVAILABLE """
-        return cls._make_response(HTTPStatus.SERVICE_UNAVAILABLE, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.SERVICE_UNAVAILABLE, data, headers, **kwargs)
 
     @classmethod
     def gateway_timeout(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 504 GATEWAY_TIMEOUT """
-        return cls._make_response(HTTPStatus.GATEWAY_TIMEOUT, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.GATEWAY_TIMEOUT, data, headers, **kwargs)
 
     @classmethod
     def http_version_not_supported(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 505 HTTP_VERSION_NOT_SUPPORTED """
-        return cls._make_response(HTTPStatus.HTTP_VERSION_NOT_SUPPORTED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.HTTP_VERSION_NOT_SUPPORTED, data, headers, **kwargs)
 
     @classmethod
     def variant_also_negotiates(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 506 VARIANT_ALSO_NEGOTIATES """
-        return cls._make_response(HTTPStatus.VARIANT_ALSO_NEGOTIATES, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.VARIANT_ALSO_NEGOTIATES, data, headers, **kwargs)
 
     @classmethod
     def insufficient_storage(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 507 INSUFFICIENT_STORAGE """
-        return cls._make_response(HTTPStatus.INSUFFICIENT_STORAGE, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.INSUFFICIENT_STORAGE, data, headers, **kwargs)
 
     @classmethod
     def loop_detected(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 508 LOOP_DETECTED """
-        return cls._make_response(HTTPStatus.LOOP_DETECTED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.LOOP_DETECTED, data, headers, **kwargs)
 
     @classmethod
     def not_extended(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 510 NOT_EXTENDED """
-        return cls._make_response(HTTPStatus.NOT_EXTENDED, data, headers, **kwargs)
+        return cls._respond(HTTPStatus.NOT_EXTENDED, data, headers, **kwargs)
 
     @classmethod
     def network_authentication_required(cls, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
         """ HTTP 511 NETWORK_AUTHENTICATION_REQUIRED """
-        return cls._make_response(HTTPStatus.NETWORK_AUTHENTICATION_REQUIRED, data, headers, **kwargs)
\ No newline at end of file
+        return cls._respond(HTTPStatus.NETWORK_AUTHENTICATION_REQUIRED, data, headers, **kwargs)
@@ -0,0 +1,46 @@
+from .flask_module import flask_module
+
+from typing import Optional, Any
+import sys
+
+
+class AppSettings(object):
+    """ The respond settings of one Flask app, read from its config the first time it builds a response
+
+    Responses look the settings up once per call, from the app's `extensions`, rather than going through the
+    `current_app` proxy for each config value. Change `RESPOND_JSON_ENCODER` or `RESPOND_COMPRESSION` before the app
+    builds its first response, or call `reload` after changing them.
+    """
+
+    __slots__ = ("app", "encoder", "compress")
+
+    def __init__(self, app: Any):
+        self.app: Any = app
+        self.encoder: Any = None
+        self.compress: Any = None
+        self.reload()
+
+    def reload(self) -> None:
+        """ Reads the settings from the app's config again """
+        encoder: Any = self.app.config.get("RESPOND_JSON_ENCODER")
+        #: The app's encoder, or None if it has none or its library is not installed
+        self.encoder = encoder if encoder is not None and encoder.available else None
+        #: The app's `compress` option, which `compress` arguments override
+        self.compress = self.app.config.get("RESPOND_COMPRESSION")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.app!r}>"
+
+
+def app_settings() -> Optional[AppSettings]:
+    """ Returns the settings of the app in context, or None outside an app context """
+    if "flask" not in sys.modules:
+        return None  # There can be no app unless Flask was imported, so raw responses never import it
+    try:
+        app: Any = flask_module().current_app._get_current_object()
+    except RuntimeError:
+        return None
+    settings: Optional[AppSettings] = app.extensions.get("respond")
+    if settings is None:
+        settings = app.extensions.setdefault("respond", AppSettings(app))
+    return settings
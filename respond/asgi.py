@@ -0,0 +1,242 @@
+from .json_response import JSONResponse
+from .xml_response import XMLResponse
+from .text_response import TextResponse
+from .sse import SSEResponse
+from .encoders import StdlibJSONEncoder
+from .status import allows_body
+from .buffers import BUFFER_TYPES, buffer_length, wsgi_body
+from .pagination import Page, aiter_page
+from .single_flight import _running_loop
+from .streaming import aiter_json_array, aiter_ndjson, DEFAULT_CHUNK_SIZE, JSON_ARRAY, NDJSON
+
+from typing import Optional, Any, AsyncIterator, Callable, Iterable, Iterator, List, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import asyncio
+import threading
+
+
+#: Default size of the thread pool large payloads are serialized in
+DEFAULT_MAX_WORKERS: int = 4
+
+#: Payloads measured in characters or bytes when deciding whether to serialize them off the event loop
+_TEXT_TYPES: tuple = (str, bytes, bytearray, memoryview)
+
+#: Payloads measured in items, along with the items and text of the containers they hold
+_CONTAINER_TYPES: tuple = (list, tuple, dict, set, frozenset)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock: threading.Lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """ Returns the bounded thread pool that large payloads are serialized in, creating it on first use """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="respond")
+    return _executor
+
+
+def set_executor(executor: Optional[ThreadPoolExecutor]) -> None:
+    """ Replaces the thread pool large payloads are serialized in. Passing None restores the default pool """
+    global _executor
+    with _executor_lock:
+        _executor = executor
+
+
+async def _iterate_in_executor(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """ Pulls each chunk of a synchronous stream in the thread pool, so producing it never blocks the event loop """
+    loop: asyncio.AbstractEventLoop = _running_loop()
+    iterator: Iterator[bytes] = iter(chunks)
+    sentinel: object = object()
+    while True:
+        chunk = await loop.run_in_executor(get_executor(), next, iterator, sentinel)
+        if chunk is sentinel:
+            return
+        yield chunk
+
+
+async def _iterate_in_thread(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """ Pulls each chunk of a synchronous stream in a thread of its own
+
+    For streams which may wait indefinitely between chunks, such as event sources, and would otherwise hold one of the
+    few workers of the serialization pool for as long as they stay open.
+    """
+    loop: asyncio.AbstractEventLoop = _running_loop()
+    executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="respond-stream")
+    iterator: Iterator[bytes] = iter(chunks)
+    sentinel: object = object()
+    try:
+        while True:
+            chunk = await loop.run_in_executor(executor, next, iterator, sentinel)
+            if chunk is sentinel:
+                return
+            yield chunk
+    finally:
+        executor.shutdown(wait=False)
+
+
+class ASGIResponse(object):
+    """ A response record of a status, a header list and a body, which is also an ASGI application
+
+    Example usage:
+        async def app(scope, receive, send):
+            response = await AsyncResponder.json.ok({"message": "ok"})
+            await response(scope, receive, send)
+    """
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, headers: List[Tuple[bytes, bytes]],
+                 body: Union[bytes, AsyncIterator[bytes]] = b""):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        await send({"type": "http.response.start", "status": self.status, "headers": self.headers})
+        body: Union[bytes, AsyncIterator[bytes]] = self.body
+        if scope.get("method") == "HEAD":
+            body = b""
+        if isinstance(body, bytes):
+            await send({"type": "http.response.body", "body": body})
+            return
+        if isinstance(body, BUFFER_TYPES):
+            # The ASGI spec asks for bytes, so other buffers are copied out a chunk at a time as they are sent
+            for chunk in wsgi_body(body):
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        async for chunk in body:
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} [{self.status}]>"
+
+
+class AsyncResponseMixin(object):
+    """ Makes an HTTPResponse subclass's status methods coroutines which return ASGIResponse records
+
+    Payloads at least `offload_min_bytes` long, or containers of at least `offload_min_items` items, counting the
+    items and text of the containers they hold, are serialized in a bounded thread pool so they do not stall other
+    coroutines. Pass `offload=True` or `offload=False` to decide
+    per call. Synchronous streams are pulled in the thread pool chunk by chunk.
+    """
+
+    prebuild_empty: bool = False
+
+    #: Whether synchronous streams are pulled in a thread of their own rather than in the serialization pool
+    stream_in_own_thread: bool = False
+
+    offload_min_bytes: int = 1024 * 1024
+    offload_min_items: int = 256
+
+    @classmethod
+    def _should_offload(cls, data: Any, offload: Optional[bool] = None) -> bool:
+        if offload is not None:
+            return offload
+        if isinstance(data, _TEXT_TYPES):
+            return len(data) >= cls.offload_min_bytes
+        if not isinstance(data, _CONTAINER_TYPES):
+            return False
+        items: int = len(data)
+        if items >= cls.offload_min_items:
+            return True
+        # Envelopes such as {"items": rows} are small at the top, so their values are measured too. There are fewer
+        # than offload_min_items of them, which bounds the cost
+        text: int = 0
+        for value in (data.values() if isinstance(data, dict) else data):
+            if isinstance(value, _CONTAINER_TYPES):
+                items += len(value)
+            elif isinstance(value, _TEXT_TYPES):
+                text += len(value)
+            if items >= cls.offload_min_items or text >= cls.offload_min_bytes:
+                return True
+        return False
+
+    @classmethod
+    async def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None,
+                             **kwargs) -> ASGIResponse:
+        """ Returns an ASGIResponse record """
+        header_list: List[Tuple[bytes, bytes]] = []
+        body: Any = b""
+        if allows_body(status):
+            if cls._should_offload(data, kwargs.get("offload")):
+                loop: asyncio.AbstractEventLoop = _running_loop()
+                body, content_type = await loop.run_in_executor(
+                    get_executor(), functools.partial(cls._encode, data, **kwargs)
+                )
+            else:
+                body, content_type = cls._encode(data, **kwargs)
+
+            header_list.append((b"content-type", content_type.encode("latin-1")))
+            if isinstance(body, BUFFER_TYPES):
+                header_list.append((b"content-length", str(buffer_length(body)).encode("latin-1")))
+            elif not hasattr(body, "__aiter__"):
+                body = _iterate_in_thread(body) if cls.stream_in_own_thread else _iterate_in_executor(body)
+        if headers:
+            names: set = {k.lower().encode("latin-1") for k in headers}
+            header_list = [h for h in header_list if h[0] not in names]
+            header_list.extend((k.lower().encode("latin-1"), str(v).encode("latin-1")) for k, v in headers.items())
+        return ASGIResponse(int(status), header_list, body)
+
+
+class AsyncJSONResponse(AsyncResponseMixin, JSONResponse):
+    """ JSONResponse for async frameworks, which also streams async iterables and pages of them """
+
+    @classmethod
+    def _encode(cls, data: Optional[Any] = None, **kwargs) -> Tuple[Union[bytes, Iterable[bytes]], str]:
+        if hasattr(data, "__aiter__") or (isinstance(data, Page) and hasattr(data.rows, "__aiter__")):
+            dumps: Callable[[Any], bytes] = (cls._get_encoder() or StdlibJSONEncoder()).dumps
+            chunk_size: int = kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE)
+            if isinstance(data, Page):
+                return aiter_page(data, dumps, chunk_size), cls.content_type
+            stream: str = kwargs.get("stream") or JSON_ARRAY
+            if stream == NDJSON:
+                return aiter_ndjson(data, dumps, chunk_size), "application/x-ndjson"
+            if stream == JSON_ARRAY:
+                return aiter_json_array(data, dumps, chunk_size), cls.content_type
+            raise ValueError(f"Unknown stream format {stream!r}, expected {JSON_ARRAY!r} or {NDJSON!r}")
+        return super()._encode(data, **kwargs)
+
+
+class AsyncXMLResponse(AsyncResponseMixin, XMLResponse):
+    """ XMLResponse for async frameworks """
+
+
+class AsyncTextResponse(AsyncResponseMixin, TextResponse):
+    """ TextResponse for async frameworks """
+
+
+class AsyncSSEResponse(AsyncResponseMixin, SSEResponse):
+    """ SSEResponse for async frameworks. Async sources are awaited on the server's own event loop
+
+    Synchronous sources are pulled in a thread per subscriber, so idle subscribers never hold the workers large
+    payloads are serialized in. Prefer async sources, for which an idle subscriber costs no thread at all.
+    """
+
+    stream_in_own_thread: bool = True
+
+    @classmethod
+    async def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None,
+                             **kwargs) -> ASGIResponse:
+        if allows_body(status):
+            headers = dict(cls.stream_headers, **headers) if headers else dict(cls.stream_headers)
+        return await super()._make_response(status, data, headers, **kwargs)
+
+
+class AsyncResponder(object):
+    """ Responder for ASGI applications, whose status methods are coroutines
+
+    Example usage:
+        response = await AsyncResponder.json.ok(["some", "json", "data"])
+        await response(scope, receive, send)
+    """
+
+    json: AsyncJSONResponse = AsyncJSONResponse
+    xml: AsyncXMLResponse = AsyncXMLResponse
+    text: AsyncTextResponse = AsyncTextResponse
+    sse: AsyncSSEResponse = AsyncSSEResponse
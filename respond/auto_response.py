@@ -0,0 +1,103 @@
+from .abs_http_response import HTTPResponse
+from .json_response import JSONResponse
+from .xml_response import XMLResponse
+from .text_response import TextResponse
+from .flask_module import flask_module
+
+from typing import Optional, Any, List, Tuple, Type
+from types import ModuleType
+import functools
+
+
+#: Number of distinct Accept headers whose negotiation result is remembered
+ACCEPT_CACHE_SIZE: int = 256
+
+
+def parse_accept(header: str) -> List[Tuple[str, str, float]]:
+    """ Parses an Accept header into (type, subtype, q) tuples, skipping malformed media ranges """
+    ranges: List[Tuple[str, str, float]] = []
+    for media_range in header.split(","):
+        media_type, *params = media_range.split(";")
+        main_type, _, sub_type = media_type.strip().lower().partition("/")
+        if not main_type or not sub_type:
+            continue
+        q: float = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    q = 0.0
+        ranges.append((main_type, sub_type, q))
+    return ranges
+
+
+@functools.lru_cache(maxsize=ACCEPT_CACHE_SIZE)
+def best_match(header: str, offered: Tuple[str, ...]) -> Optional[int]:
+    """ Returns the index of the offered media type the client prefers, or None if it accepts none of them
+
+    Each offered type takes the q-value of the most specific media range matching it. Ties go to the type offered
+    first. Results are kept in a bounded LRU cache, as clients send only a few distinct Accept headers.
+    """
+    ranges: List[Tuple[str, str, float]] = parse_accept(header)
+    best: Optional[int] = None
+    best_q: float = 0.0
+    for index, media_type in enumerate(offered):
+        main_type, _, sub_type = media_type.partition("/")
+        specificity: int = -1
+        q: float = 0.0
+        for range_main, range_sub, range_q in ranges:
+            if range_main == main_type and range_sub == sub_type:
+                match: int = 2
+            elif range_main == main_type and range_sub == "*":
+                match = 1
+            elif range_main == "*" and range_sub == "*":
+                match = 0
+            else:
+                continue
+            if match > specificity:
+                specificity, q = match, range_q
+        if q > best_q:
+            best, best_q = index, q
+    return best
+
+
+class AutoResponse(HTTPResponse):
+    """ Picks a JSON, XML or text response from the request's Accept header
+
+    Only the types whose response class can render the data are offered, so a dict is never sent as text nor a plain
+    string as XML. Requests without an Accept header, or which accept none of the types offered, get the first of them.
+
+    Example usage:
+        Responder.auto.ok({"message": "ok"})
+    """
+
+    #: Media types offered, in order of preference, and the response class which produces each
+    offered: Tuple[Tuple[str, Type[HTTPResponse]], ...] = (
+        ("application/json", JSONResponse),
+        ("application/xml", XMLResponse),
+        ("text/xml", XMLResponse),
+        ("text/plain", TextResponse),
+    )
+
+    @classmethod
+    def _negotiate(cls, data: Optional[Any] = None) -> Type[HTTPResponse]:
+        """ Returns the response class the client prefers, of those which can render `data` """
+        offered: Tuple[Tuple[str, Type[HTTPResponse]], ...] = tuple(
+            (media_type, response_class) for media_type, response_class in cls.offered
+            if response_class._renders(data)
+        ) or cls.offered
+        flask: ModuleType = flask_module()
+        header: Optional[str] = flask.request.headers.get("Accept") if flask.has_request_context() else None
+        if not header:
+            return offered[0][1]
+        index: Optional[int] = best_match(header, tuple(media_type for media_type, _ in offered))
+        return offered[index or 0][1]
+
+    @classmethod
+    def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ Returns a response in the format the client prefers """
+        response = cls._negotiate(data)._build_response(status, data, headers, **kwargs)
+        response.vary.add("Accept")
+        return response
@@ -0,0 +1,295 @@
+from .encoders import default
+
+from typing import Optional, Any, Callable, Dict
+from datetime import date, datetime, timezone
+import decimal
+import struct
+import uuid
+import math
+import abc
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover - optional dependency
+    cbor2 = None
+
+
+class BinaryEncoder(abc.ABC):
+    """ BinaryEncoder abstract base class
+
+    An encoder turns a Python object into the bytes of a MessagePack or CBOR document. Types the format has no
+    representation for are converted with `default`, as JSONEncoder converts them.
+    """
+
+    #: False when the library backing the encoder is not installed
+    available: bool = True
+
+    def __init__(self, default: Optional[Callable[[Any], Any]] = default):
+        self.default = default
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class MsgpackEncoder(BinaryEncoder):
+    """ Encodes MessagePack with the msgpack library """
+
+    available: bool = msgpack is not None
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(obj, default=self.default, use_bin_type=True)
+
+
+class PureMsgpackEncoder(BinaryEncoder):
+    """ Encodes the same MessagePack bytes as MsgpackEncoder, in pure Python """
+
+    def dumps(self, obj: Any) -> bytes:
+        out: bytearray = bytearray()
+        self._pack(out, obj, 0)
+        return bytes(out)
+
+    def _pack(self, out: bytearray, obj: Any, depth: int) -> None:
+        if depth > _MAX_DEPTH:
+            raise ValueError("Maximum nesting depth exceeded")
+        if obj is None:
+            out.append(0xc0)
+        elif obj is True or obj is False:
+            out.append(0xc3 if obj else 0xc2)
+        elif isinstance(obj, str):
+            data: bytes = obj.encode("utf-8")
+            if len(data) <= 31:
+                out.append(0xa0 | len(data))
+            else:
+                _pack_header(out, len(data), 0xa0, 31, _STR)
+            out += data
+        elif isinstance(obj, int):
+            if 0 <= obj <= 0x7f:
+                out.append(obj)
+            else:
+                _pack_msgpack_int(out, obj)
+        elif isinstance(obj, float):
+            out += _DOUBLE.pack(0xcb, obj)
+        elif isinstance(obj, (bytes, bytearray, memoryview)):
+            data = bytes(obj)
+            _pack_header(out, len(data), None, -1, _BIN)
+            out += data
+        elif isinstance(obj, (list, tuple)):
+            _pack_header(out, len(obj), 0x90, 15, _ARRAY)
+            for item in obj:
+                self._pack(out, item, depth + 1)
+        elif isinstance(obj, dict):
+            _pack_header(out, len(obj), 0x80, 15, _MAP)
+            for k, v in obj.items():
+                self._pack(out, k, depth + 1)
+                self._pack(out, v, depth + 1)
+        elif self.default is not None:
+            self._pack(out, self.default(obj), depth + 1)
+        else:
+            raise TypeError(f"Object of type {type(obj).__name__} is not MessagePack serializable")
+
+
+class CBOREncoder(BinaryEncoder):
+    """ Encodes CBOR with the cbor2 library. Naive datetimes are taken to be UTC, as they are for JSON """
+
+    available: bool = cbor2 is not None
+
+    def dumps(self, obj: Any) -> bytes:
+        return cbor2.dumps(obj, default=self._default, timezone=timezone.utc)
+
+    def _default(self, encoder: Any, obj: Any) -> None:
+        if self.default is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not CBOR serializable")
+        encoder.encode(self.default(obj))
+
+
+class PureCBOREncoder(BinaryEncoder):
+    """ Encodes the same CBOR bytes as CBOREncoder, in pure Python
+
+    Datetimes, dates, decimals, UUIDs and sets are encoded with their standard CBOR tags, as cbor2 encodes them. Sets
+    are written in iteration order, so they match cbor2's bytes for the same set object.
+    """
+
+    def dumps(self, obj: Any) -> bytes:
+        out: bytearray = bytearray()
+        self._encode(out, obj, 0)
+        return bytes(out)
+
+    def _encode(self, out: bytearray, obj: Any, depth: int) -> None:
+        if depth > _MAX_DEPTH:
+            raise ValueError("Maximum nesting depth exceeded")
+        if obj is None:
+            out.append(0xf6)
+        elif obj is True or obj is False:
+            out.append(0xf5 if obj else 0xf4)
+        elif isinstance(obj, str):
+            data: bytes = obj.encode("utf-8")
+            if len(data) < 24:
+                out.append(0x60 | len(data))
+            else:
+                _encode_cbor_head(out, 3, len(data))
+            out += data
+        elif isinstance(obj, int):
+            if 0 <= obj < 24:
+                out.append(obj)
+            elif obj >= 0:
+                _encode_cbor_uint(out, obj, 0, 2)
+            else:
+                _encode_cbor_uint(out, -1 - obj, 1, 3)
+        elif isinstance(obj, float):
+            _encode_cbor_float(out, obj)
+        elif isinstance(obj, (bytes, bytearray, memoryview)):
+            data = bytes(obj)
+            _encode_cbor_head(out, 2, len(data))
+            out += data
+        elif isinstance(obj, (list, tuple)):
+            _encode_cbor_head(out, 4, len(obj))
+            for item in obj:
+                self._encode(out, item, depth + 1)
+        elif isinstance(obj, (set, frozenset)):
+            _encode_cbor_head(out, 6, 258)
+            _encode_cbor_head(out, 4, len(obj))
+            for item in obj:
+                self._encode(out, item, depth + 1)
+        elif isinstance(obj, dict):
+            _encode_cbor_head(out, 5, len(obj))
+            for k, v in obj.items():
+                self._encode(out, k, depth + 1)
+                self._encode(out, v, depth + 1)
+        elif isinstance(obj, datetime):
+            if obj.tzinfo is None:
+                obj = obj.replace(tzinfo=timezone.utc)
+            _encode_cbor_head(out, 6, 0)
+            self._encode(out, obj.isoformat().replace("+00:00", "Z"), depth + 1)
+        elif isinstance(obj, date):
+            _encode_cbor_head(out, 6, 1004)
+            self._encode(out, obj.isoformat(), depth + 1)
+        elif isinstance(obj, decimal.Decimal):
+            if not obj.is_finite():
+                _encode_cbor_float(out, float(obj))
+                return
+            sign, digits, exponent = obj.as_tuple()
+            mantissa: int = int("".join(map(str, digits))) * (-1 if sign else 1)
+            _encode_cbor_head(out, 6, 4)
+            self._encode(out, [exponent, mantissa], depth + 1)
+        elif isinstance(obj, uuid.UUID):
+            _encode_cbor_head(out, 6, 37)
+            self._encode(out, obj.bytes, depth + 1)
+        elif self.default is not None:
+            self._encode(out, self.default(obj), depth + 1)
+        else:
+            raise TypeError(f"Object of type {type(obj).__name__} is not CBOR serializable")
+
+
+#: Containers nested deeper than this raise ValueError, rather than overflowing the stack
+_MAX_DEPTH: int = 512
+
+_DOUBLE: struct.Struct = struct.Struct(">Bd")
+
+#: MessagePack type bytes of the 8, 16 and 32 bit length forms
+_STR: tuple = (0xd9, 0xda, 0xdb)
+_BIN: tuple = (0xc4, 0xc5, 0xc6)
+_ARRAY: tuple = (None, 0xdc, 0xdd)
+_MAP: tuple = (None, 0xde, 0xdf)
+
+_UINT_FORMATS: Dict[int, struct.Struct] = {1: struct.Struct(">BB"), 2: struct.Struct(">BH"), 4: struct.Struct(">BI"),
+                                           8: struct.Struct(">BQ")}
+
+
+def _pack_header(out: bytearray, length: int, fix: Optional[int], fix_max: int, formats: tuple) -> None:
+    """ Packs a MessagePack str, bin, array or map header, in its fix form if it has one and `length` fits
+
+    `formats` holds the type bytes of the 8 bit (str and bin only, None otherwise), 16 bit and 32 bit forms.
+    """
+    if length <= fix_max:
+        out.append(fix | length)
+    elif length <= 0xff and formats[0] is not None:
+        out += _UINT_FORMATS[1].pack(formats[0], length)
+    elif length <= 0xffff:
+        out += _UINT_FORMATS[2].pack(formats[1], length)
+    elif length <= 0xffffffff:
+        out += _UINT_FORMATS[4].pack(formats[2], length)
+    else:
+        raise ValueError("Too large to pack as MessagePack")
+
+
+def _pack_msgpack_int(out: bytearray, value: int) -> None:
+    """ Packs an integer in the smallest form, unsigned if it is positive, as msgpack does """
+    if value >= 0:
+        if value <= 0x7f:
+            out.append(value)
+        elif value <= 0xff:
+            out += _UINT_FORMATS[1].pack(0xcc, value)
+        elif value <= 0xffff:
+            out += _UINT_FORMATS[2].pack(0xcd, value)
+        elif value <= 0xffffffff:
+            out += _UINT_FORMATS[4].pack(0xce, value)
+        elif value <= 0xffffffffffffffff:
+            out += _UINT_FORMATS[8].pack(0xcf, value)
+        else:
+            raise OverflowError("Integer value out of range")
+    elif value >= -32:
+        out.append(value & 0xff)
+    elif value >= -0x80:
+        out += struct.pack(">Bb", 0xd0, value)
+    elif value >= -0x8000:
+        out += struct.pack(">Bh", 0xd1, value)
+    elif value >= -0x80000000:
+        out += struct.pack(">Bi", 0xd2, value)
+    elif value >= -0x8000000000000000:
+        out += struct.pack(">Bq", 0xd3, value)
+    else:
+        raise OverflowError("Integer value out of range")
+
+
+def _encode_cbor_head(out: bytearray, major: int, value: int) -> None:
+    """ Encodes a CBOR major type with its argument in the fewest bytes """
+    major <<= 5
+    if value < 24:
+        out.append(major | value)
+    elif value <= 0xff:
+        out += _UINT_FORMATS[1].pack(major | 24, value)
+    elif value <= 0xffff:
+        out += _UINT_FORMATS[2].pack(major | 25, value)
+    elif value <= 0xffffffff:
+        out += _UINT_FORMATS[4].pack(major | 26, value)
+    else:
+        out += _UINT_FORMATS[8].pack(major | 27, value)
+
+
+def _encode_cbor_uint(out: bytearray, value: int, major: int, bignum_tag: int) -> None:
+    """ Encodes a non-negative integer, or a bignum if it does not fit in 64 bits """
+    if value <= 0xffffffffffffffff:
+        _encode_cbor_head(out, major, value)
+        return
+    data: bytes = value.to_bytes((value.bit_length() + 7) // 8, "big")
+    _encode_cbor_head(out, 6, bignum_tag)
+    _encode_cbor_head(out, 2, len(data))
+    out += data
+
+
+def _encode_cbor_float(out: bytearray, value: float) -> None:
+    if math.isnan(value):
+        out += b"\xf9\x7e\x00"
+    elif math.isinf(value):
+        out += b"\xf9\x7c\x00" if value > 0 else b"\xf9\xfc\x00"
+    else:
+        out += _DOUBLE.pack(0xfb, value)
+
+
+def msgpack_encoder() -> BinaryEncoder:
+    """ Returns the compiled MessagePack encoder if msgpack is installed, otherwise the pure Python one """
+    return MsgpackEncoder() if MsgpackEncoder.available else PureMsgpackEncoder()
+
+
+def cbor_encoder() -> BinaryEncoder:
+    """ Returns the compiled CBOR encoder if cbor2 is installed, otherwise the pure Python one """
+    return CBOREncoder() if CBOREncoder.available else PureCBOREncoder()
@@ -0,0 +1,76 @@
+from .abs_http_response import HTTPResponse
+from .buffers import buffer_response
+from .binary_encoders import BinaryEncoder, msgpack_encoder, cbor_encoder
+from .compression import compress_response
+from .conditional import not_modified_response, conditional_response
+
+from typing import Optional, Any, Type, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
+
+
+class BinaryResponse(HTTPResponse):
+    """ Base class of the MessagePack and CBOR responses, which encode data with a BinaryEncoder """
+
+    prebuild_empty: bool = True
+
+    content_type: str = "application/octet-stream"
+
+    encoder: BinaryEncoder
+
+    @classmethod
+    def with_encoder(cls, encoder: BinaryEncoder) -> Type["BinaryResponse"]:
+        """ Returns a subclass of this class that encodes with the given encoder
+
+        Example usage:
+            class APIResponder(Responder):
+                msgpack = MsgpackResponse.with_encoder(PureMsgpackEncoder())
+        """
+        return type(cls.__name__, (cls,), {"encoder": encoder})
+
+    @classmethod
+    def _encode(cls, data: Optional[Any] = None, **kwargs) -> Tuple[Union[bytes, memoryview], str]:
+        """ Returns the body and content type of the response, without needing Flask """
+        return cls._cached_body(kwargs.get("cache_key"), lambda: cls.encoder.dumps(data)), cls.content_type
+
+    @classmethod
+    def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ Returns a response holding the encoded data. None is encoded as the format's null value
+
+        Pass `cache_key` to reuse the body encoded by an earlier call with the same key.
+        """
+        not_modified: Optional["Response"] = not_modified_response(status, headers, kwargs)
+        if not_modified is not None:
+            return not_modified
+        body, content_type = cls._encode(data, **kwargs)
+        response: "Response" = buffer_response(body, status, content_type)
+        if headers:
+            for k, v in headers.items():
+                response.headers.set(k, v)
+        response = conditional_response(response, headers, kwargs)
+        return compress_response(response, kwargs.get("compress"))
+
+
+class MsgpackResponse(BinaryResponse):
+    """ Encodes data as MessagePack, with msgpack if it is installed and in pure Python otherwise
+
+    Example usage:
+        Responder.msgpack.ok({"id": 1, "tags": ["a", "b"]})
+    """
+
+    content_type: str = "application/msgpack"
+
+    encoder: BinaryEncoder = msgpack_encoder()
+
+
+class CBORResponse(BinaryResponse):
+    """ Encodes data as CBOR, with cbor2 if it is installed and in pure Python otherwise
+
+    Example usage:
+        Responder.cbor.ok({"id": 1, "tags": ["a", "b"]})
+    """
+
+    content_type: str = "application/cbor"
+
+    encoder: BinaryEncoder = cbor_encoder()
@@ -0,0 +1,129 @@
+from .single_flight import SingleFlight
+
+from typing import Optional, Callable, Dict, Hashable, Tuple
+from collections import OrderedDict
+import threading
+import time
+
+
+#: Default number of bodies a cache holds
+DEFAULT_MAXSIZE: int = 1024
+
+#: Default number of body bytes a cache holds
+DEFAULT_MAX_BYTES: int = 64 * 1024 * 1024
+
+
+class BodyCache(object):
+    """ A thread-safe LRU cache of serialized response bodies, keyed by a caller-provided key
+
+    Bodies are evicted least recently used first once the cache holds `maxsize` bodies or `max_bytes` bytes, and
+    expire `ttl` seconds after they are stored, if `ttl` is set. Bodies larger than `max_bytes` are never stored.
+
+    Example usage:
+        Responder.json.ok(report, cache_key=("report", report_version))
+        ...
+        JSONResponse.body_cache.invalidate(("report", report_version))
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl: Optional[float] = None):
+        self.maxsize: int = maxsize
+        self.max_bytes: int = max_bytes
+        self.ttl: Optional[float] = ttl
+        self._lock: threading.Lock = threading.Lock()
+        #: (namespace, key) to (body, expiry time or None)
+        self._entries: "OrderedDict[Tuple[Hashable, Hashable], Tuple[bytes, Optional[float]]]" = OrderedDict()
+        self._bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self._flights: SingleFlight = SingleFlight()
+
+    def get(self, key: Hashable, namespace: Hashable = None) -> Optional[bytes]:
+        """ Returns the body stored for `key`, or None if there is none or it has expired """
+        entry_key: Tuple[Hashable, Hashable] = (namespace, key)
+        with self._lock:
+            entry: Optional[Tuple[bytes, Optional[float]]] = self._entries.get(entry_key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                self._remove(entry_key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(entry_key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, body: bytes, namespace: Hashable = None) -> None:
+        """ Stores a body, evicting the least recently used bodies to make room for it """
+        size: int = self._sizeof(body)
+        if size > self.max_bytes or self.maxsize <= 0:
+            return
+        entry_key: Tuple[Hashable, Hashable] = (namespace, key)
+        expires: Optional[float] = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if entry_key in self._entries:
+                self._remove(entry_key)
+            while self._entries and (len(self._entries) >= self.maxsize or self._bytes + size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            self._entries[entry_key] = (body, expires)
+            self._bytes += size
+
+    def get_or_set(self, key: Hashable, encode: Callable[[], bytes], namespace: Hashable = None) -> bytes:
+        """ Returns the body stored for `key`, or encodes, stores and returns it if there is none
+
+        Encoding runs outside the lock. Threads missing the same key while it is being encoded wait for that body
+        rather than encoding it again, and raise the same exception if encoding fails.
+        """
+        body: Optional[bytes] = self.get(key, namespace)
+        if body is None:
+            body = self._flights.do((namespace, key), lambda: self._encode_and_set(key, encode, namespace))
+        return body
+
+    def _encode_and_set(self, key: Hashable, encode: Callable[[], bytes], namespace: Hashable) -> bytes:
+        body: bytes = encode()
+        self.set(key, body, namespace)
+        return body
+
+    def invalidate(self, key: Hashable) -> int:
+        """ Removes the bodies stored for `key` by every response class, returning how many were removed """
+        return self._remove_where(lambda entry_key: entry_key[1] == key)
+
+    def clear(self) -> None:
+        """ Removes every body, keeping the counters """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """ Returns the hit, miss and eviction counters, the number of misses which waited for another thread's value
+        rather than making their own, and the number of bodies and bytes held
+        """
+        with self._lock:
+            return {
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "coalesced": self._flights.shared, "size": len(self._entries), "bytes": self._bytes,
+            }
+
+    def _sizeof(self, body: bytes) -> int:
+        """ Returns the number of bytes a stored value counts towards `max_bytes` """
+        return len(body)
+
+    def _remove(self, entry_key: Tuple[Hashable, Hashable]) -> None:
+        body, _ = self._entries.pop(entry_key)
+        self._bytes -= self._sizeof(body)
+
+    def _remove_where(self, predicate: Callable[[Tuple[Hashable, Hashable]], bool]) -> int:
+        """ Removes the values whose (namespace, key) pair matches `predicate`, returning how many were removed """
+        with self._lock:
+            entry_keys: list = [k for k in self._entries if predicate(k)]
+            for entry_key in entry_keys:
+                self._remove(entry_key)
+            return len(entry_keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(maxsize={self.maxsize}, max_bytes={self.max_bytes}, ttl={self.ttl})"
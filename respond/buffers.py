@@ -0,0 +1,88 @@
+from .streaming import DEFAULT_CHUNK_SIZE
+from .flask_module import flask_module
+
+from typing import Optional, Any, Iterator, Union, TYPE_CHECKING
+from types import ModuleType
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
+
+
+def as_buffer(data: Any) -> Optional[Union[bytes, memoryview, "BufferBody"]]:
+    """ Returns a body as bytes or a byte-format memoryview, or None if it is neither a string nor a buffer
+
+    Strings are encoded to UTF-8, once. Bytes are returned as they are, and other objects supporting the buffer
+    protocol, such as bytearrays, memoryviews and arrays, as a view of their memory rather than a copy of it. The
+    memory must not change until the response is sent.
+    """
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    if isinstance(data, (bytes, BufferBody)):
+        return data
+    try:
+        view: memoryview = data if isinstance(data, memoryview) else memoryview(data)
+    except TypeError:
+        return None
+    if view.format == "B" and view.ndim == 1:
+        return view
+    if view.c_contiguous:
+        return view.cast("B")
+    return view.tobytes()
+
+
+def buffer_length(body: Union[bytes, bytearray, memoryview, "BufferBody"]) -> int:
+    """ Returns the number of bytes in a buffer, which for a memoryview of wider items is more than its length """
+    if isinstance(body, BufferBody):
+        return body.view.nbytes
+    return body.nbytes if isinstance(body, memoryview) else len(body)
+
+
+class BufferBody(object):
+    """ A WSGI response body which sends a buffer as bytes chunks of at most `chunk_size` bytes
+
+    PEP 3333 servers only accept bytes, so each chunk is copied out of the buffer as it is sent, rather than the whole
+    buffer being copied up front. The number of chunks is known, so Werkzeug does not treat the body as streamed.
+    """
+
+    __slots__ = ("view", "chunk_size")
+
+    def __init__(self, buffer: Union[bytearray, memoryview], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.view: memoryview = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+        self.chunk_size: int = chunk_size
+
+    def __len__(self) -> int:
+        return -(-self.view.nbytes // self.chunk_size)
+
+    def __iter__(self) -> Iterator[bytes]:
+        view: memoryview = self.view
+        chunk_size: int = self.chunk_size
+        for start in range(0, view.nbytes, chunk_size):
+            yield view[start:start + chunk_size].tobytes()
+
+    def __bytes__(self) -> bytes:
+        return b"".join(self)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.view.nbytes} bytes>"
+
+
+#: Body types sent as they are, without being encoded or copied before the server sends them
+BUFFER_TYPES: tuple = (bytes, bytearray, memoryview, BufferBody)
+
+
+def wsgi_body(body: Union[bytes, bytearray, memoryview, BufferBody]) -> Union[bytes, BufferBody]:
+    """ Returns a buffer as a body WSGI servers accept: bytes and a BufferBody as they are, others as a BufferBody """
+    return body if isinstance(body, (bytes, BufferBody)) else BufferBody(body)
+
+
+def buffer_response(data: Any, status: int, content_type: str) -> Optional["Response"]:
+    """ Returns a Flask response holding a string or buffer body, or None if `data` is neither """
+    flask: ModuleType = flask_module()
+    body: Optional[Union[bytes, memoryview, BufferBody]] = as_buffer(data)
+    if body is None:
+        return None
+    if isinstance(body, bytes):
+        return flask.Response(body, status, content_type=content_type)
+    response: "Response" = flask.Response(wsgi_body(body), status, content_type=content_type)
+    response.headers["Content-Length"] = str(buffer_length(body))
+    return response
@@ -0,0 +1,174 @@
+from .app_settings import AppSettings, app_settings
+from .flask_module import flask_module
+
+from typing import Optional, Any, Dict, Iterable, Iterator, Tuple, Union, TYPE_CHECKING
+from types import ModuleType
+import zlib
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+class _ZlibStream(object):
+    """ Incremental gzip or deflate compressor, flushing after every chunk so clients can decode as they receive """
+
+    __slots__ = ("_compressor",)
+
+    def __init__(self, level: int, wbits: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _ZstdStream(object):
+    """ Incremental zstd compressor, flushing a block after every chunk """
+
+    __slots__ = ("_compressor",)
+
+    def __init__(self, level: int):
+        if zstd is not None:
+            self._compressor = zstd.ZstdCompressor(level=level)
+        else:
+            self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        if zstd is not None:
+            return self._compressor.compress(chunk, zstd.ZstdCompressor.FLUSH_BLOCK)
+        return self._compressor.compress(chunk) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _compress_gzip(data: bytes, level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _compress_deflate(data: bytes, level: int) -> bytes:
+    return zlib.compress(data, level)
+
+
+def _compress_zstd(data: bytes, level: int) -> bytes:
+    if zstd is not None:
+        return zstd.compress(data, level=level)
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+#: Whether zstd can be offered, which needs Python 3.14+ or the zstandard package
+ZSTD_AVAILABLE: bool = zstd is not None or zstandard is not None
+
+_COMPRESSORS: dict = {
+    "zstd": (_compress_zstd, lambda level: _ZstdStream(level)),
+    "gzip": (_compress_gzip, lambda level: _ZlibStream(level, 31)),
+    "deflate": (_compress_deflate, lambda level: _ZlibStream(level, 15)),
+}
+
+#: Statuses which never carry a body worth compressing
+_UNCOMPRESSED_STATUSES: frozenset = frozenset({204, 206, 304})
+
+
+class Compression(object):
+    """ Settings for compression negotiated from the request's Accept-Encoding header
+
+    Example usage:
+        app.config["RESPOND_COMPRESSION"] = Compression(min_size=1024, levels={"gzip": 5})
+        Responder.json.ok(data, compress=True)  # Or per call, with the default settings
+    """
+
+    #: Codecs offered, in order of preference when a client accepts several equally
+    DEFAULT_CODECS: Tuple[str, ...] = ("zstd", "gzip", "deflate")
+
+    #: Compression level used for each codec unless overridden
+    DEFAULT_LEVELS: Dict[str, int] = {"zstd": 3, "gzip": 6, "deflate": 6}
+
+    def __init__(self, min_size: int = 500, levels: Optional[Dict[str, int]] = None,
+                 codecs: Iterable[str] = DEFAULT_CODECS):
+        unknown: set = set(codecs) - set(_COMPRESSORS)
+        if unknown:
+            raise ValueError(f"Unknown codecs {sorted(unknown)!r}, expected some of {sorted(_COMPRESSORS)!r}")
+        self.min_size = min_size
+        self.levels = dict(self.DEFAULT_LEVELS, **(levels or {}))
+        self.codecs = tuple(c for c in codecs if c != "zstd" or ZSTD_AVAILABLE)
+
+    def negotiate(self, accept_encoding: Any) -> Optional[str]:
+        """ Returns the codec to use for a parsed Accept-Encoding header, or None to send the body as is """
+        return accept_encoding.best_match(self.codecs)
+
+    def compress(self, codec: str, data: bytes) -> bytes:
+        return _COMPRESSORS[codec][0](data, self.levels[codec])
+
+    def compress_stream(self, codec: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        stream = _COMPRESSORS[codec][1](self.levels[codec])
+        for chunk in chunks:
+            compressed: bytes = stream.compress(chunk)
+            if compressed:
+                yield compressed
+        yield stream.flush()
+
+
+def _get_compression(compress: Union[None, bool, Compression],
+                     settings: Optional[AppSettings] = None) -> Optional[Compression]:
+    """ Resolves a `compress` option, falling back to the `RESPOND_COMPRESSION` app config value """
+    if compress is None:
+        settings = settings or app_settings()
+        compress = settings.compress if settings is not None else None
+    if compress is True:
+        return _DEFAULT_COMPRESSION
+    return compress or None
+
+
+def compress_response(response: "Response", compress: Union[None, bool, Compression] = None,
+                      settings: Optional[AppSettings] = None) -> "Response":
+    """ Compresses a response's body in place, if compression is enabled and the client accepts it
+
+    Compression is enabled by passing `compress=True`, or a `Compression` instance, or through the
+    `RESPOND_COMPRESSION` app config value. It only applies within a request context. Pass the app's `settings` if
+    they were already looked up for the response.
+    """
+    if compress is False:
+        return response  # Before looking up the request or config, which responses that never compress skip
+    compression: Optional[Compression] = _get_compression(compress, settings)
+    if compression is None or response.status_code in _UNCOMPRESSED_STATUSES or response.status_code < 200 \
+            or response.direct_passthrough or "Content-Encoding" in response.headers:
+        return response
+    flask: ModuleType = flask_module()
+    if not flask.has_request_context():
+        return response
+
+    response.vary.add("Accept-Encoding")
+    if not response.is_streamed and response.content_length is not None \
+            and response.content_length < compression.min_size:
+        return response
+    codec: Optional[str] = compression.negotiate(flask.request.accept_encodings)
+    if codec is None:
+        return response
+
+    if response.is_streamed:
+        response.response = compression.compress_stream(codec, response.response)
+        response.headers.pop("Content-Length", None)
+    else:
+        response.set_data(compression.compress(codec, response.get_data()))
+    response.headers["Content-Encoding"] = codec
+    etag, weak = response.get_etag()
+    if etag is not None and not weak:
+        # The compressed bytes differ from the ones the strong ETag was computed from
+        response.set_etag(etag, weak=True)
+    return response
+
+
+_DEFAULT_COMPRESSION: Compression = Compression()
@@ -0,0 +1,92 @@
+from .flask_module import flask_module
+
+from typing import Optional, Union, Tuple, TYPE_CHECKING
+from types import ModuleType
+from datetime import datetime, timezone
+from http import HTTPStatus
+import hashlib
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
+
+
+def make_etag(body: bytes) -> str:
+    """ Returns an unquoted entity tag computed from a serialized body """
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _as_utc(value: datetime) -> datetime:
+    """ HTTP dates have no microseconds and are in UTC. Naive datetimes are taken to be UTC already """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.replace(microsecond=0)
+
+
+def _is_conditional(status: int) -> bool:
+    flask: ModuleType = flask_module()
+    return status == HTTPStatus.OK and flask.has_request_context() and flask.request.method in ("GET", "HEAD")
+
+
+def _is_current(etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """ Returns True if the client's cached copy, described by If-None-Match or If-Modified-Since, is current
+
+    If-Modified-Since is ignored when If-None-Match is sent, as RFC 7232 requires.
+    """
+    flask: ModuleType = flask_module()
+    if flask.request.if_none_match:
+        return etag is not None and flask.request.if_none_match.contains_weak(etag)
+    if last_modified is not None and flask.request.if_modified_since is not None:
+        return _as_utc(last_modified) <= flask.request.if_modified_since
+    return False
+
+
+def _set_validators(response: "Response", etag: Optional[str], weak: bool, last_modified: Optional[datetime]) -> None:
+    if etag is not None:
+        response.set_etag(etag, weak)
+    if last_modified is not None:
+        response.last_modified = _as_utc(last_modified)
+
+
+def _not_modified(etag: Optional[str], weak: bool, last_modified: Optional[datetime],
+                  headers: Optional[dict]) -> "Response":
+    flask: ModuleType = flask_module()
+    response: "Response" = flask.Response(status=HTTPStatus.NOT_MODIFIED)
+    _set_validators(response, etag, weak, last_modified)
+    if headers:
+        for k, v in headers.items():
+            response.headers.set(k, v)
+    return response
+
+
+def _options(options: dict) -> Tuple[Union[None, bool, str], bool, Optional[datetime]]:
+    return options.get("etag"), options.get("weak_etag", False), options.get("last_modified")
+
+
+def not_modified_response(status: int, headers: Optional[dict], options: dict) -> Optional["Response"]:
+    """ Returns an empty 304 response if a caller supplied `etag` or `last_modified` shows the client is current
+
+    This runs before the body is serialized, so a matching version skips serialization entirely.
+    """
+    etag, weak, last_modified = _options(options)
+    if etag is True or (etag is None and last_modified is None) or not _is_conditional(status):
+        return None
+    if not _is_current(etag, last_modified):
+        return None
+    return _not_modified(etag, weak, last_modified, headers)
+
+
+def conditional_response(response: "Response", headers: Optional[dict], options: dict) -> "Response":
+    """ Sets ETag and Last-Modified on a response, and returns an empty 304 instead if the client is current
+
+    Pass `etag=True` to compute a strong ETag from the serialized body (streamed bodies are skipped), or a string to
+    use as the ETag, `weak_etag=True` to mark it as weak, and `last_modified` as a datetime.
+    """
+    etag, weak, last_modified = _options(options)
+    if etag is True:
+        etag = None if response.is_streamed else make_etag(response.get_data())
+    if etag is None and last_modified is None:
+        return response
+    if _is_conditional(response.status_code) and _is_current(etag, last_modified):
+        return _not_modified(etag, weak, last_modified, headers)
+    _set_validators(response, etag, weak, last_modified)
+    return response
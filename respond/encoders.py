@@ -0,0 +1,199 @@
+from typing import Optional, Any, Callable, List, Union
+from email.utils import format_datetime
+from datetime import date, datetime, time, timezone
+import decimal
+import uuid
+import json
+import abc
+
+try:
+    import dataclasses
+except ImportError:  # pragma: no cover - Python 3.6
+    dataclasses = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+
+def _http_date(value: date) -> str:
+    """ Formats a date or datetime as an RFC 7231 HTTP date, as Flask's jsonify does """
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time(), tzinfo=timezone.utc)
+    elif value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def default(o: Any) -> Any:
+    """ Converts the types jsonify supports, but the json module does not, into serializable values """
+    if isinstance(o, date):
+        return _http_date(o)
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses and dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class RawJSON(object):
+    """ An already encoded JSON value, written into documents as it is rather than encoded again
+
+    The fragment is trusted to be valid JSON; it is not parsed or checked.
+
+    Example usage:
+        Responder.json.ok({"profile": RawJSON(redis.get("profile:1")), "online": True})
+    """
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, encoded: Union[str, bytes, bytearray, memoryview]):
+        self.encoded: bytes = encoded.encode("utf-8") if isinstance(encoded, str) else bytes(encoded)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, RawJSON) and other.encoded == self.encoded
+
+    def __hash__(self) -> int:
+        return hash(self.encoded)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.encoded!r})"
+
+
+class _FragmentSplicer(object):
+    """ A `default` for encoders with no way to write raw JSON, which encode each RawJSON as a placeholder string
+
+    The placeholders, which hold a random token, are then replaced by the fragments in the encoded document.
+    """
+
+    __slots__ = ("default", "fragments", "token")
+
+    def __init__(self, default: Optional[Callable[[Any], Any]]):
+        self.default = default
+        self.fragments: List[bytes] = []
+        self.token: str = ""
+
+    def __call__(self, o: Any) -> Any:
+        if isinstance(o, RawJSON):
+            if not self.token:
+                self.token = uuid.uuid4().hex
+            self.fragments.append(o.encoded)
+            return f"{self.token}:{len(self.fragments) - 1}"
+        if self.default is None:
+            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+        return self.default(o)
+
+    def splice(self, encoded: bytes) -> bytes:
+        """ Returns the encoded document with its placeholders replaced by the fragments """
+        if not self.fragments:
+            return encoded
+        pieces: List[bytes] = encoded.split(b'"' + self.token.encode("ascii") + b":")
+        parts: List[bytes] = [pieces[0]]
+        for piece in pieces[1:]:
+            # Each piece starts with the rest of a placeholder, the fragment's index and a closing quote
+            end: int = piece.index(b'"')
+            parts.append(self.fragments[int(piece[:end])])
+            parts.append(piece[end + 1:])
+        return b"".join(parts)
+
+
+class JSONEncoder(abc.ABC):
+    """ JSONEncoder abstract base class
+
+    An encoder turns a Python object into the UTF-8 encoded bytes of a JSON document, without needing an application
+    context. Assign one to `JSONResponse.encoder`, or to the `RESPOND_JSON_ENCODER` key of a Flask app's config.
+    RawJSON values are written into the document as they are.
+    """
+
+    #: False when the library backing the encoder is not installed
+    available: bool = True
+
+    #: False for encoders which write non-ASCII characters as UTF-8 rather than escaping them
+    ensure_ascii: bool = True
+
+    #: True for encoders which encode dataclasses themselves, faster than JSONResponse's compiled record serializers
+    native_dataclasses: bool = False
+
+    def __init__(self, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = default):
+        self.sort_keys = sort_keys
+        self.default = default
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(sort_keys={self.sort_keys!r})"
+
+
+class StdlibJSONEncoder(JSONEncoder):
+    """ Encodes with the standard library json module, using compact separators """
+
+    def dumps(self, obj: Any) -> bytes:
+        splicer: _FragmentSplicer = _FragmentSplicer(self.default)
+        return splicer.splice(
+            json.dumps(obj, separators=(",", ":"), sort_keys=self.sort_keys, default=splicer).encode("utf-8")
+        )
+
+
+class OrjsonEncoder(JSONEncoder):
+    """ Encodes with orjson, writing bytes directly. RawJSON is written as an orjson Fragment where orjson has them """
+
+    available: bool = orjson is not None
+
+    ensure_ascii: bool = False
+
+    native_dataclasses: bool = True
+
+    def __init__(self, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = default):
+        super().__init__(sort_keys, default)
+        self.option = 0
+        self._fragment: Optional[Callable[[bytes], Any]] = getattr(orjson, "Fragment", None)
+        if orjson is not None:
+            # Hand datetimes back to `default` so dates are formatted the same way jsonify formats them
+            self.option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+            if sort_keys:
+                self.option |= orjson.OPT_SORT_KEYS
+
+    def _default(self, o: Any) -> Any:
+        if isinstance(o, RawJSON):
+            return self._fragment(o.encoded)
+        if self.default is None:
+            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+        return self.default(o)
+
+    def dumps(self, obj: Any) -> bytes:
+        if self._fragment is not None:
+            return orjson.dumps(obj, default=self._default, option=self.option)
+        splicer: _FragmentSplicer = _FragmentSplicer(self.default)
+        return splicer.splice(orjson.dumps(obj, default=splicer, option=self.option))
+
+
+class UJSONEncoder(JSONEncoder):
+    """ Encodes with ujson """
+
+    available: bool = ujson is not None
+
+    ensure_ascii: bool = False
+
+    def dumps(self, obj: Any) -> bytes:
+        splicer: _FragmentSplicer = _FragmentSplicer(self.default)
+        return splicer.splice(ujson.dumps(
+            obj, ensure_ascii=False, escape_forward_slashes=False, sort_keys=self.sort_keys, default=splicer
+        ).encode("utf-8"))
+
+
+def fastest_encoder(sort_keys: bool = False) -> Optional[JSONEncoder]:
+    """ Returns an instance of the fastest installed compiled encoder, or None if none are installed """
+    for encoder_class in (OrjsonEncoder, UJSONEncoder):
+        if encoder_class.available:
+            return encoder_class(sort_keys=sort_keys)
+    return None
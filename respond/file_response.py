@@ -0,0 +1,246 @@
+from .abs_http_response import HTTPResponse
+from .conditional import not_modified_response, make_etag
+from .flask_module import flask_module
+
+from typing import Optional, Any, BinaryIO, Iterator, List, Tuple, Union, TYPE_CHECKING
+from types import ModuleType
+from datetime import datetime, timezone
+from http import HTTPStatus
+import mimetypes
+import secrets
+import mmap
+import os
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
+
+
+def parse_byte_ranges(header: str, length: int) -> Optional[List[Tuple[int, int]]]:
+    """ Parses a Range header into (start, stop) byte offsets, with `stop` exclusive, for a body of `length` bytes
+
+    Returns None if the header is malformed or not in bytes, in which case it must be ignored, and an empty list if
+    no range is satisfiable.
+    """
+    units, _, spec = header.partition("=")
+    if units.strip().lower() != "bytes" or not spec.strip():
+        return None
+    ranges: List[Tuple[int, int]] = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = part.partition("-")
+        first, last = first.strip(), last.strip()
+        if not sep:
+            return None
+        if not first:
+            # A suffix range, such as "-500" for the last 500 bytes
+            if not last.isdigit():
+                return None
+            if int(last) == 0:
+                continue
+            start, stop = max(0, length - int(last)), length
+        else:
+            if not first.isdigit() or (last and not last.isdigit()):
+                return None
+            start = int(first)
+            if last and int(last) < start:
+                return None
+            stop = min(int(last) + 1, length) if last else length
+        if start < length:
+            ranges.append((start, stop))
+    return ranges
+
+
+def _iter_range(source: Union[BinaryIO, mmap.mmap], start: int, stop: int, chunk_size: int) -> Iterator[bytes]:
+    """ Reads bytes `start` to `stop` of a file or mmap, one chunk at a time """
+    source.seek(start)
+    remaining: int = stop - start
+    while remaining > 0:
+        chunk: bytes = source.read(min(chunk_size, remaining))
+        if not chunk:
+            return
+        remaining -= len(chunk)
+        yield chunk
+
+
+def _closing(chunks: Iterator[bytes], source: Union[BinaryIO, mmap.mmap], close: bool) -> Iterator[bytes]:
+    try:
+        yield from chunks
+    finally:
+        if close:
+            source.close()
+
+
+class _OpenedFile(object):
+    """ A file or mmap to be served, with what is known about it """
+
+    __slots__ = ("source", "length", "last_modified", "etag", "content_type", "close", "is_os_file")
+
+    def __init__(self, data: Any, content_type: Optional[str]):
+        self.close: bool = False
+        self.is_os_file: bool = False
+        self.last_modified: Optional[datetime] = None
+        self.etag: Optional[str] = None
+        name: Optional[str] = None
+        if isinstance(data, (str, os.PathLike)):
+            name = os.fspath(data)
+            data = open(name, "rb")
+            self.close = True
+        self.source: Union[BinaryIO, mmap.mmap] = data
+        if isinstance(data, mmap.mmap):
+            self.length: int = len(data)
+        else:
+            name = name or getattr(data, "name", None)
+            try:
+                stat: os.stat_result = os.fstat(data.fileno())
+            except (AttributeError, OSError):
+                # An in-memory file such as io.BytesIO
+                self.length = data.seek(0, os.SEEK_END)
+            else:
+                self.length = stat.st_size
+                self.is_os_file = True
+                self.last_modified = datetime.fromtimestamp(int(stat.st_mtime), timezone.utc)
+                self.etag = make_etag(f"{name}-{stat.st_mtime_ns}-{stat.st_size}".encode("utf-8"))
+        if content_type is None and isinstance(name, str):
+            content_type = mimetypes.guess_type(name)[0]
+        self.content_type: str = content_type or "application/octet-stream"
+
+
+class FileResponse(HTTPResponse):
+    """ Serves a path, an open binary file or an mmap without reading it into memory
+
+    Whole files are handed to the server's `wsgi.file_wrapper`, which may use sendfile. Range requests are answered
+    with a 206 holding one range, or a multipart/byteranges body holding several, or a 416 if no range is satisfiable.
+
+    Example usage:
+        Responder.file.ok("/srv/exports/report.csv", download_name="report.csv")
+    """
+
+    #: Number of bytes read from the file at a time when it is not handed to wsgi.file_wrapper
+    chunk_size: int = 64 * 1024
+
+    #: Requests for more ranges than this are answered with the whole file
+    max_ranges: int = 16
+
+    @classmethod
+    def _ranges(cls, opened: _OpenedFile) -> Optional[List[Tuple[int, int]]]:
+        """ Returns the ranges requested, or None if the whole file should be sent """
+        flask: ModuleType = flask_module()
+        from werkzeug.http import parse_date, quote_etag
+        header: Optional[str] = flask.request.headers.get("Range")
+        if not header or flask.request.method != "GET":
+            return None
+        if_range: Optional[str] = flask.request.headers.get("If-Range")
+        if if_range:
+            if if_range.startswith(('"', "W/")):
+                current: bool = opened.etag is not None and if_range == quote_etag(opened.etag)
+            else:
+                date: Optional[datetime] = parse_date(if_range)
+                current = date is not None and opened.last_modified is not None and date == opened.last_modified
+            if not current:
+                return None
+        ranges: Optional[List[Tuple[int, int]]] = parse_byte_ranges(header, opened.length)
+        if ranges is not None and len(ranges) > cls.max_ranges:
+            return None
+        return ranges
+
+    @classmethod
+    def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ Returns a file response
+
+        Pass `content_type` to override the type guessed from the file name, and `download_name` to send the file as
+        an attachment.
+        """
+        flask: ModuleType = flask_module()
+        if data is None:
+            response: "Response" = flask.Response(b"", status)
+        else:
+            response = cls._make_file_response(status, data, headers, **kwargs)
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
+                return response
+        if kwargs.get("download_name"):
+            response.headers.set("Content-Disposition", "attachment", filename=kwargs["download_name"])
+        if headers:
+            for k, v in headers.items():
+                response.headers.set(k, v)
+        return response
+
+    @classmethod
+    def _make_file_response(cls, status: int, data: Any, headers: Optional[dict], **kwargs) -> "Response":
+        flask: ModuleType = flask_module()
+        opened: _OpenedFile = _OpenedFile(data, kwargs.get("content_type"))
+        validators: dict = {"etag": opened.etag, "last_modified": opened.last_modified}
+        not_modified: Optional["Response"] = not_modified_response(status, headers, validators)
+        if not_modified is not None:
+            if opened.close:
+                opened.source.close()
+            return not_modified
+
+        ranges: Optional[List[Tuple[int, int]]] = None
+        if status in (HTTPStatus.OK, HTTPStatus.PARTIAL_CONTENT) and flask.has_request_context():
+            ranges = cls._ranges(opened)
+
+        if ranges is not None and not ranges:
+            if opened.close:
+                opened.source.close()
+            return cls.requested_range_not_satisfiable(headers={"Content-Range": f"bytes */{opened.length}"})
+        if ranges is None:
+            response: "Response" = cls._whole_file(status, opened)
+        elif len(ranges) == 1:
+            start, stop = ranges[0]
+            response = flask.Response(
+                _closing(_iter_range(opened.source, start, stop, cls.chunk_size), opened.source, opened.close),
+                HTTPStatus.PARTIAL_CONTENT, content_type=opened.content_type, direct_passthrough=True
+            )
+            response.headers["Content-Range"] = f"bytes {start}-{stop - 1}/{opened.length}"
+            response.headers["Content-Length"] = str(stop - start)
+        else:
+            response = cls._multipart(opened, ranges)
+
+        response.headers["Accept-Ranges"] = "bytes"
+        if opened.etag is not None:
+            response.set_etag(opened.etag)
+        if opened.last_modified is not None:
+            response.last_modified = opened.last_modified
+        return response
+
+    @classmethod
+    def _whole_file(cls, status: int, opened: _OpenedFile) -> "Response":
+        flask: ModuleType = flask_module()
+        from werkzeug.wsgi import wrap_file
+        source: Union[BinaryIO, mmap.mmap] = opened.source
+        if opened.is_os_file and flask.has_request_context():
+            source.seek(0)
+            body: Any = wrap_file(flask.request.environ, source, cls.chunk_size)
+        else:
+            body = _closing(_iter_range(source, 0, opened.length, cls.chunk_size), source, opened.close)
+        response: "Response" = flask.Response(body, status, content_type=opened.content_type, direct_passthrough=True)
+        response.headers["Content-Length"] = str(opened.length)
+        return response
+
+    @classmethod
+    def _multipart(cls, opened: _OpenedFile, ranges: List[Tuple[int, int]]) -> "Response":
+        """ Returns a multipart/byteranges response holding each range, with an exact Content-Length """
+        flask: ModuleType = flask_module()
+        boundary: str = secrets.token_hex(16)
+        part_headers: List[bytes] = [
+            (f"\r\n--{boundary}\r\nContent-Type: {opened.content_type}\r\n"
+             f"Content-Range: bytes {start}-{stop - 1}/{opened.length}\r\n\r\n").encode("latin-1")
+            for start, stop in ranges
+        ]
+        closing: bytes = f"\r\n--{boundary}--\r\n".encode("latin-1")
+
+        def parts() -> Iterator[bytes]:
+            for part_header, (start, stop) in zip(part_headers, ranges):
+                yield part_header
+                yield from _iter_range(opened.source, start, stop, cls.chunk_size)
+            yield closing
+
+        length: int = sum(map(len, part_headers)) + sum(stop - start for start, stop in ranges) + len(closing)
+        response: "Response" = flask.Response(
+            _closing(parts(), opened.source, opened.close), HTTPStatus.PARTIAL_CONTENT,
+            content_type=f"multipart/byteranges; boundary={boundary}", direct_passthrough=True
+        )
+        response.headers["Content-Length"] = str(length)
+        return response
@@ -0,0 +1,20 @@
+from types import ModuleType
+from typing import Optional
+
+
+#: The flask module, bound the first time a response needs it rather than when this package is imported
+_flask: Optional[ModuleType] = None
+
+
+def flask_module() -> ModuleType:
+    """ Returns the flask module, importing it on first use
+
+    Raw WSGI and ASGI responses and the status helpers never import Flask, so responses built with it look it up here
+    rather than importing it at module level. Names are read from the module, which costs an attribute lookup per call
+    instead of a pass through the import machinery for every `from flask import ...` run in a function.
+    """
+    global _flask
+    if _flask is None:
+        import flask
+        _flask = flask
+    return _flask
@@ -1,17 +1,243 @@
 from .abs_http_response import HTTPResponse
+from .buffers import buffer_response
+from .compression import compress_response
+from .conditional import not_modified_response, conditional_response
+from .encoders import JSONEncoder, StdlibJSONEncoder, _FragmentSplicer
+from .pagination import Page, iter_page
+from .record_serializer import RecordSerializer, record_fields, record_serializer, is_dataclass
+from .streaming import iter_json_array, iter_ndjson, DEFAULT_CHUNK_SIZE, JSON_ARRAY, NDJSON
+from .app_settings import AppSettings, app_settings
+from .flask_module import flask_module
 
-from flask import jsonify, make_response, Response
+from typing import Optional, Any, Callable, Type, Iterable, Iterator, Tuple, Union, TYPE_CHECKING
+from types import ModuleType
 
-from typing import Optional, Any
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
+
+
+_STDLIB_ENCODER: JSONEncoder = StdlibJSONEncoder()
+
+#: Types of data encoded as one document, checked before the slower isinstance check for iterators and pages
+_DOCUMENT_TYPES: tuple = (dict, list, tuple, str, int, float, bool, type(None))
 
 
 class JSONResponse(HTTPResponse):
 
+    prebuild_empty: bool = True
+
+    content_type: str = "application/json"
+
+    #: Encoder used in place of jsonify. When None, the `RESPOND_JSON_ENCODER` app config value is used instead
+    encoder: Optional[JSONEncoder] = None
+
+    #: When True, dataclasses and slotted records, and lists of them, are encoded by serializers compiled per type
+    compile_records: bool = True
+
+    @classmethod
+    def with_encoder(cls, encoder: Optional[JSONEncoder]) -> Type["JSONResponse"]:
+        """ Returns a subclass of this class that encodes with the given encoder
+
+        Example usage:
+            class APIResponder(Responder):
+                json = JSONResponse.with_encoder(OrjsonEncoder())
+        """
+        return type(cls.__name__, (cls,), {"encoder": encoder})
+
+    @classmethod
+    def _get_encoder(cls, settings: Optional[AppSettings] = None) -> Optional[JSONEncoder]:
+        """ Returns the encoder to use, or None if responses should be built with jsonify
+
+        Pass the app's `settings` if they were already looked up for the response.
+        """
+        encoder: Optional[JSONEncoder] = cls.encoder
+        if encoder is None:
+            settings = settings or app_settings()
+            return settings.encoder if settings is not None else None
+        return encoder if encoder.available else None
+
+    @classmethod
+    def _record_serializer(cls, data: Any, encoder: Optional[JSONEncoder],
+                           settings: Optional[AppSettings] = None) -> Optional[RecordSerializer]:
+        """ Returns the serializer to encode `data` with if it is a record or a list of records, otherwise None
+
+        Records are encoded with the settings and `default` of `encoder`, the one `_get_encoder` returned, or without
+        one, of the app's JSON provider, as jsonify would. Indented documents, providers without a `default`, and
+        Flask before 2.2, which has no provider, are left to jsonify.
+        """
+        if not cls.compile_records:
+            return None
+        first: Any = data[0] if data.__class__ in (list, tuple) and data else data
+        if record_fields(first.__class__) is None:
+            return None
+        if encoder is not None:
+            if encoder.native_dataclasses and is_dataclass(first):
+                return None
+            return record_serializer(encoder.sort_keys, encoder.ensure_ascii, encoder.default)
+        settings = settings or app_settings()
+        if settings is not None:
+            provider: Any = getattr(settings.app, "json", None)
+            default: Optional[Callable[[Any], Any]] = getattr(provider, "default", None)
+            compact: Optional[bool] = getattr(provider, "compact", None)
+            if default is None or (compact is None and settings.app.debug) or compact is False:
+                return None
+            return record_serializer(
+                getattr(provider, "sort_keys", True), getattr(provider, "ensure_ascii", True), default
+            )
+        return record_serializer(_STDLIB_ENCODER.sort_keys, _STDLIB_ENCODER.ensure_ascii, _STDLIB_ENCODER.default)
+
+    @classmethod
+    def _stream_body(cls, data: Iterable[Any], stream: str = JSON_ARRAY, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                     dumps: Optional[Callable[[Any], bytes]] = None) -> Tuple[Iterator[bytes], str]:
+        """ Returns an iterator which encodes `data` item by item with `dumps` as it is sent, and its content type
+
+        Without `dumps`, items are encoded with the configured encoder, or the standard library encoder if there is
+        none, as they are for raw WSGI and ASGI responses, which have no app.
+        """
+        if dumps is None:
+            dumps = (cls._get_encoder() or _STDLIB_ENCODER).dumps
+        if isinstance(data, Page):
+            return iter_page(data, dumps, chunk_size), cls.content_type
+        if stream == NDJSON:
+            return iter_ndjson(data, dumps, chunk_size), "application/x-ndjson"
+        if stream == JSON_ARRAY:
+            return iter_json_array(data, dumps, chunk_size), cls.content_type
+        raise ValueError(f"Unknown stream format {stream!r}, expected {JSON_ARRAY!r} or {NDJSON!r}")
+
+    @staticmethod
+    def _provider_dumps(provider: Any) -> Callable[[Any], bytes]:
+        """ Returns a function encoding one streamed item with an app's JSON provider, its settings and `default`
+
+        Items are compact even when the provider indents its documents, as newline delimited JSON needs each item on
+        a line of its own.
+        """
+        default: Optional[Callable[[Any], Any]] = getattr(provider, "default", None)
+
+        def dumps(item: Any) -> bytes:
+            splicer: _FragmentSplicer = _FragmentSplicer(default)
+            return splicer.splice(provider.dumps(item, default=splicer, separators=(",", ":")).encode("utf-8"))
+
+        return dumps
+
+    @classmethod
+    def _make_stream_response(cls, status: int, data: Iterable[Any], stream: str = JSON_ARRAY,
+                              chunk_size: int = DEFAULT_CHUNK_SIZE,
+                              settings: Optional[AppSettings] = None) -> "Response":
+        """ Returns a response that encodes `data` item by item as it is sent
+
+        Items are encoded with the configured encoder or, when there is none, with the JSON provider of the app the
+        response was made in, as jsonify would encode them. Flask before 2.2 has no provider, so there they are
+        encoded with the standard library encoder.
+        """
+        flask: ModuleType = flask_module()
+        encoder: Optional[JSONEncoder] = cls._get_encoder(settings)
+        provider: Any = getattr(settings.app, "json", None) if settings is not None else None
+        if encoder is not None:
+            dumps: Callable[[Any], bytes] = encoder.dumps
+        elif provider is not None:
+            dumps = cls._provider_dumps(provider)
+        else:
+            dumps = _STDLIB_ENCODER.dumps
+        body, content_type = cls._stream_body(data, stream, chunk_size, dumps)
+        if flask.has_request_context():
+            body = flask.stream_with_context(body)
+        return flask.Response(body, status, content_type=content_type)
+
+    @classmethod
+    def _encode(cls, data: Optional[Any] = None, **kwargs) -> Tuple[Union[bytes, Iterable[bytes]], str]:
+        """ Returns the body and content type of a JSON response, without needing Flask """
+        if kwargs.get("stream") or isinstance(data, (Iterator, Page)):
+            return cls._stream_body(
+                data, kwargs.get("stream") or JSON_ARRAY, kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE)
+            )
+        json_encoder: JSONEncoder = cls._get_encoder() or _STDLIB_ENCODER
+        encoder: Union[JSONEncoder, RecordSerializer] = cls._record_serializer(data, json_encoder) or json_encoder
+        body: Union[bytes, memoryview] = cls._cached_body(
+            kwargs.get("cache_key"), lambda: encoder.dumps(data if data is not None else "")
+        )
+        return body, cls.content_type
+
+    @classmethod
+    def _jsonify(cls, data: Optional[Any], status: int, settings: Optional[AppSettings] = None) -> "Response":
+        """ Returns a response encoded as jsonify would, with the app's JSON provider and its settings
+
+        The provider cannot write RawJSON fragments, so it encodes them as placeholders which are replaced by the
+        fragments afterwards, keeping the document to a single pass of the encoder. Flask before 2.2 has no provider,
+        so there data jsonify fails to encode is encoded with the standard library encoder instead.
+        """
+        flask: ModuleType = flask_module()
+        app: Any = settings.app if settings is not None else flask.current_app
+        provider: Any = getattr(app, "json", None)
+        if provider is None:
+            try:
+                return flask.make_response(flask.jsonify(data if data is not None else ""), status)
+            except TypeError:
+                return flask.Response(_STDLIB_ENCODER.dumps(data), status, mimetype=cls.content_type)
+        splicer: _FragmentSplicer = _FragmentSplicer(getattr(provider, "default", None))
+        compact: Optional[bool] = getattr(provider, "compact", None)
+        if (compact is None and app.debug) or compact is False:
+            encoded: str = provider.dumps(data if data is not None else "", default=splicer, indent=2)
+        else:
+            encoded = provider.dumps(data if data is not None else "", default=splicer, separators=(",", ":"))
+        return app.response_class(
+            splicer.splice(encoded.encode("utf-8")) + b"\n", status, mimetype=getattr(provider, "mimetype", None)
+        )
+
+    @classmethod
+    def _dumps(cls, data: Optional[Any], settings: Optional[AppSettings] = None) -> bytes:
+        """ Returns the body the response would hold for `data`, encoded with the encoder or jsonify """
+        encoder: Optional[JSONEncoder] = cls._get_encoder(settings)
+        serializer: Optional[RecordSerializer] = cls._record_serializer(data, encoder, settings)
+        if encoder is None and serializer is None:
+            return cls._jsonify(data, 200, settings).get_data()
+        return cls._encode_with(data, encoder, serializer)
+
+    @staticmethod
+    def _encode_with(data: Optional[Any], encoder: Optional[JSONEncoder],
+                     serializer: Optional[RecordSerializer]) -> bytes:
+        """ Returns `data` encoded by the record serializer if there is one, otherwise by the encoder
+
+        Records encoded in place of jsonify end in a newline, as jsonify's documents do.
+        """
+        if serializer is None:
+            return encoder.dumps(data if data is not None else "")
+        body: bytes = serializer.dumps(data)
+        return body + b"\n" if encoder is None else body
+
     @classmethod
     def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
-        """ Returns a JSON response """
-        response: Response = make_response(jsonify(data if data is not None else ""), status)
+        """ Returns a JSON response
+
+        Iterators and generators are streamed as a JSON array, and a Page as a {"items": [...], "next": ...} object.
+        Pass `stream="ndjson"` to stream newline delimited JSON instead (any iterable may be streamed this way), and
+        `chunk_size` to set the number of bytes buffered before each write. Pass `cache_key` to reuse the body encoded
+        by an earlier call with the same key.
+        """
+        flask: ModuleType = flask_module()
+        # Validators are only ever passed as options, so calls without any skip the conditional checks
+        not_modified: Optional["Response"] = not_modified_response(status, headers, kwargs) if kwargs else None
+        if not_modified is not None:
+            return not_modified
+        settings: Optional[AppSettings] = app_settings()
+        if kwargs.get("stream") or (data.__class__ not in _DOCUMENT_TYPES and isinstance(data, (Iterator, Page))):
+            response: "Response" = cls._make_stream_response(
+                status, data, kwargs.get("stream") or JSON_ARRAY, kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE), settings
+            )
+        elif kwargs.get("cache_key") is not None:
+            body: Union[bytes, memoryview] = cls._cached_body(kwargs["cache_key"], lambda: cls._dumps(data, settings))
+            response = buffer_response(body, status, cls.content_type)
+        else:
+            encoder: Optional[JSONEncoder] = cls._get_encoder(settings)
+            serializer: Optional[RecordSerializer] = cls._record_serializer(data, encoder, settings)
+            if encoder is None and serializer is None:
+                response = cls._jsonify(data, status, settings)
+            else:
+                response = flask.Response(
+                    cls._encode_with(data, encoder, serializer), status, mimetype=cls.content_type
+                )
         if headers:
             for k, v in headers.items():
                 response.headers.set(k, v)
-        return response
+        if kwargs:
+            response = conditional_response(response, headers, kwargs)
+        return compress_response(response, kwargs.get("compress"), settings)
@@ -0,0 +1,154 @@
+from .buffers import BUFFER_TYPES, buffer_length
+
+from typing import Optional, Any, Dict, List, Sequence, Tuple
+import threading
+import time
+import bisect
+
+
+#: Upper bounds, in seconds, of the serialization time histogram buckets
+DEFAULT_TIME_BUCKETS: Tuple[float, ...] = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0
+)
+
+#: Upper bounds, in bytes, of the body size histogram buckets
+DEFAULT_SIZE_BUCKETS: Tuple[int, ...] = (
+    64, 256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216
+)
+
+
+class Histogram(object):
+    """ A fixed set of buckets, allocated once, counting observations at or below each upper bound """
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds: Tuple[float, ...] = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)  # The last bucket counts everything above the bounds
+        self.total: float = 0
+        self.count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        return {"bounds": list(self.bounds), "counts": list(self.counts), "sum": self.total, "count": self.count}
+
+
+class MetricsCollector(object):
+    """ Counts responses per response class and status, with histograms of serialization time and body size
+
+    Register a collector with `set_collector` to start recording. Streamed bodies, whose size is not known up front,
+    are counted but not added to the size histogram.
+
+    Example usage:
+        collector = MetricsCollector()
+        set_collector(collector)
+        ...
+        collector.snapshot()
+    """
+
+    def __init__(self, time_buckets: Sequence[float] = DEFAULT_TIME_BUCKETS,
+                 size_buckets: Sequence[int] = DEFAULT_SIZE_BUCKETS):
+        self.time_buckets: Tuple[float, ...] = tuple(time_buckets)
+        self.size_buckets: Tuple[int, ...] = tuple(size_buckets)
+        self._lock: threading.Lock = threading.Lock()
+        self._responses: Dict[Tuple[str, int], int] = {}
+        self._times: Dict[str, Histogram] = {}
+        self._sizes: Dict[str, Histogram] = {}
+
+    def record(self, response_class: str, status: int, seconds: float, size: Optional[int]) -> None:
+        """ Records one response """
+        key: Tuple[str, int] = (response_class, status)
+        with self._lock:
+            self._responses[key] = self._responses.get(key, 0) + 1
+            times: Optional[Histogram] = self._times.get(response_class)
+            if times is None:
+                times = self._times[response_class] = Histogram(self.time_buckets)
+                self._sizes[response_class] = Histogram(self.size_buckets)
+            times.observe(seconds)
+            if size is not None:
+                self._sizes[response_class].observe(size)
+
+    def snapshot(self) -> dict:
+        """ Returns a copy of everything recorded so far, as plain dicts and lists """
+        with self._lock:
+            responses: Dict[str, Dict[int, int]] = {}
+            for (response_class, status), count in self._responses.items():
+                responses.setdefault(response_class, {})[status] = count
+            return {
+                "responses": responses,
+                "serialization_seconds": {name: h.snapshot() for name, h in self._times.items()},
+                "body_bytes": {name: h.snapshot() for name, h in self._sizes.items()},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._responses.clear()
+            self._times.clear()
+            self._sizes.clear()
+
+    def to_prometheus(self, prefix: str = "respond") -> str:
+        """ Returns the snapshot in the Prometheus text exposition format """
+        snapshot: dict = self.snapshot()
+        lines: List[str] = [f"# TYPE {prefix}_responses_total counter"]
+        for response_class, statuses in sorted(snapshot["responses"].items()):
+            for status, count in sorted(statuses.items()):
+                lines.append(f'{prefix}_responses_total{{class="{response_class}",status="{status}"}} {count}')
+        for metric, histograms in (("serialization_seconds", snapshot["serialization_seconds"]),
+                                   ("body_bytes", snapshot["body_bytes"])):
+            lines.append(f"# TYPE {prefix}_{metric} histogram")
+            for response_class, histogram in sorted(histograms.items()):
+                cumulative: int = 0
+                labels: str = f'class="{response_class}"'
+                for bound, count in zip(histogram["bounds"] + ["+Inf"], histogram["counts"]):
+                    cumulative += count
+                    lines.append(f'{prefix}_{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{prefix}_{metric}_sum{{{labels}}} {histogram['sum']}")
+                lines.append(f"{prefix}_{metric}_count{{{labels}}} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+#: The registered collector. While it is None, responses are not timed at all
+collector: Optional[MetricsCollector] = None
+
+
+def set_collector(new_collector: Optional[MetricsCollector]) -> None:
+    """ Registers the collector every response is recorded to. Passing None stops recording """
+    global collector
+    collector = new_collector
+
+
+def get_collector() -> Optional[MetricsCollector]:
+    return collector
+
+
+def body_size(response: Any) -> Optional[int]:
+    """ Returns the size of a response's body, or None if it is streamed or unknown """
+    content_length: Optional[int] = getattr(response, "content_length", None)
+    if content_length is not None:
+        return content_length
+    body: Any = getattr(response, "body", None)
+    if isinstance(body, BUFFER_TYPES):
+        return buffer_length(body)
+    return None
+
+
+def response_status(response: Any, default: int) -> int:
+    """ Returns the status a response was actually sent with, which may differ from the one asked for (such as 304) """
+    status: Any = getattr(response, "status_code", None)
+    if status is None:
+        status = getattr(response, "status", default)
+    return int(status) if isinstance(status, int) else int(default)
+
+
+async def record_when_awaited(collector: MetricsCollector, response_class: str, status: int, started: float,
+                              awaitable: Any) -> Any:
+    """ Awaits a response from an async response class, then records it """
+    response: Any = await awaitable
+    collector.record(
+        response_class, response_status(response, status), time.perf_counter() - started, body_size(response)
+    )
+    return response
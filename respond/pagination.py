@@ -0,0 +1,140 @@
+from .streaming import iter_chunks, aiter_chunks, DEFAULT_CHUNK_SIZE
+
+from typing import Optional, Any, AsyncIterator, Callable, Dict, Iterable, Iterator
+from itertools import islice
+import functools
+
+
+#: Default number of rows fetched from a DB-API cursor at a time
+DEFAULT_BATCH_SIZE: int = 500
+
+_MISSING: object = object()
+
+
+class Page(object):
+    """ One page of results, streamed by JSONResponse as a {"items": [...], "next": ...} object
+
+    `rows` may be a DB-API cursor, which is read `batch_size` rows at a time with `fetchmany`, or any iterable or
+    async iterable, read the same way. Each batch is encoded with a single call to the encoder. At most `limit` rows
+    are sent, each passed through `convert` first if it is given. `next_token` is called with the last row sent to make
+    the token of the following page, or "next" is null if there is no following page: when the rows ran out before
+    `limit`, or no rows were sent. Any `metadata` keywords are sent before "items".
+
+    The rows are read while the response is sent, after the view has returned, so a cursor must still be open then.
+    It is closed once the page is sent, unless `close` is False.
+
+    Example usage:
+        cursor.execute("SELECT id, name FROM users WHERE id > ? ORDER BY id", (after,))
+        return Responder.json.ok(Page(cursor, next_token=lambda row: row[0], limit=100, convert=dict_from_row))
+    """
+
+    __slots__ = ("rows", "next_token", "limit", "convert", "batch_size", "close", "metadata")
+
+    def __init__(self, rows: Any, next_token: Optional[Callable[[Any], Any]] = None, limit: Optional[int] = None,
+                 convert: Optional[Callable[[Any], Any]] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 close: bool = True, **metadata):
+        self.rows = rows
+        self.next_token = next_token
+        self.limit = limit
+        self.convert = convert
+        self.batch_size = batch_size
+        self.close = close
+        self.metadata: Dict[str, Any] = metadata
+
+    def _next(self, last: Any, more: bool) -> Any:
+        if self.next_token is None or last is _MISSING or (self.limit is not None and not more):
+            return None
+        return self.next_token(last)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.rows!r}, limit={self.limit!r})"
+
+
+def _take(rows: Iterator[Any], size: int) -> list:
+    return list(islice(rows, size))
+
+
+async def _atake(rows: AsyncIterator[Any], size: int) -> list:
+    batch: list = []
+    async for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            break
+    return batch
+
+
+def _fetch_size(page: Page, remaining: Optional[int]) -> int:
+    """ Returns how many rows to read next: a batch, or one more than are left, to find out if there is a next page """
+    return page.batch_size if remaining is None else min(page.batch_size, remaining + 1)
+
+
+def _encode_batch(page: Page, batch: list, dumps: Callable[[Any], bytes]) -> bytes:
+    """ Encodes a batch of rows in a single call, as the items of a JSON array without its brackets """
+    if page.convert is not None:
+        batch = [page.convert(row) for row in batch]
+    return dumps(batch).strip()[1:-1]
+
+
+def _envelope_start(page: Page, dumps: Callable[[Any], bytes]) -> bytes:
+    return b"{" + b"".join(dumps(k) + b":" + dumps(v) + b"," for k, v in page.metadata.items()) + b'"items":['
+
+
+def _page_parts(page: Page, dumps: Callable[[Any], bytes]) -> Iterator[bytes]:
+    fetch: Callable[[int], list] = (
+        page.rows.fetchmany if hasattr(page.rows, "fetchmany") else functools.partial(_take, iter(page.rows))
+    )
+    try:
+        yield _envelope_start(page, dumps)
+        remaining: Optional[int] = page.limit
+        last: Any = _MISSING
+        more: bool = False
+        while not more:
+            batch: list = fetch(_fetch_size(page, remaining))
+            if not batch:
+                break
+            if remaining is not None:
+                more = len(batch) > remaining
+                del batch[remaining:]
+                remaining -= len(batch)
+            if batch:
+                yield (b"," if last is not _MISSING else b"") + _encode_batch(page, batch, dumps)
+                last = batch[-1]
+        yield b'],"next":' + dumps(page._next(last, more)) + b"}"
+    finally:
+        if page.close and hasattr(page.rows, "close"):
+            page.rows.close()
+
+
+async def _apage_parts(page: Page, dumps: Callable[[Any], bytes]) -> AsyncIterator[bytes]:
+    rows: AsyncIterator[Any] = page.rows.__aiter__()
+    try:
+        yield _envelope_start(page, dumps)
+        remaining: Optional[int] = page.limit
+        last: Any = _MISSING
+        more: bool = False
+        while not more:
+            batch: list = await _atake(rows, _fetch_size(page, remaining))
+            if not batch:
+                break
+            if remaining is not None:
+                more = len(batch) > remaining
+                del batch[remaining:]
+                remaining -= len(batch)
+            if batch:
+                yield (b"," if last is not _MISSING else b"") + _encode_batch(page, batch, dumps)
+                last = batch[-1]
+        yield b'],"next":' + dumps(page._next(last, more)) + b"}"
+    finally:
+        if page.close and hasattr(page.rows, "aclose"):
+            await page.rows.aclose()
+
+
+def iter_page(page: Page, dumps: Callable[[Any], bytes], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterable[bytes]:
+    """ Encodes a page a batch of rows at a time, holding at most one batch and one chunk of output in memory """
+    return iter_chunks(_page_parts(page, dumps), chunk_size)
+
+
+def aiter_page(page: Page, dumps: Callable[[Any], bytes],
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """ Async counterpart of `iter_page`, for pages of async iterables """
+    return aiter_chunks(_apage_parts(page, dumps), chunk_size)
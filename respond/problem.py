@@ -0,0 +1,80 @@
+from .json_response import JSONResponse, _STDLIB_ENCODER
+from .compression import compress_response
+from .encoders import JSONEncoder
+from .status import status_info
+from .flask_module import flask_module
+
+from typing import Optional, Any, Mapping, TYPE_CHECKING
+from types import ModuleType
+from json.encoder import encode_basestring_ascii
+import functools
+import json
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
+
+
+#: Members every problem has, written once per status in its skeleton
+_SKELETON_MEMBERS: frozenset = frozenset(("type", "title", "status"))
+
+
+@functools.lru_cache(maxsize=1024)
+def problem_skeleton(status: int, problem_type: str = "about:blank") -> bytes:
+    """ Returns the encoded members every problem with a status shares, as a JSON object missing its closing brace """
+    info = status_info(status)
+    members: dict = {"type": problem_type, "title": info.phrase, "status": info.code}
+    return json.dumps(members, separators=(",", ":")).encode("utf-8")[:-1]
+
+
+class ProblemResponse(JSONResponse):
+    """ JSONResponse whose 4xx and 5xx responses are RFC 7807 problem details, sent as application/problem+json
+
+    The "type", "title" and "status" members of each status are encoded once and reused, so only what the call adds
+    is encoded: a string is sent as the "detail" member, and a mapping's items as extra members, such as "detail",
+    "instance" or an "errors" list. A mapping with its own "type", "title" or "status" is encoded whole instead.
+    Calls without data reuse a whole response built once per status. Other statuses are sent as plain JSON.
+
+    Example usage:
+        Responder.problem.not_found()
+        Responder.problem.too_many_requests("Try again in 30 seconds", headers={"Retry-After": "30"})
+        Responder.problem.unprocessable_entity({"detail": "Invalid order", "errors": [{"field": "quantity"}]})
+    """
+
+    problem_content_type: str = "application/problem+json"
+
+    #: URI of the "type" member, identifying the kind of problem. "about:blank" means it is just the status
+    problem_type: str = "about:blank"
+
+    @classmethod
+    def _problem_body(cls, status: int, data: Optional[Any] = None) -> bytes:
+        """ Returns the encoded problem for a status, splicing the call's members into the status's skeleton """
+        skeleton: bytes = problem_skeleton(status, cls.problem_type)
+        if data is None:
+            return skeleton + b"}"
+        if isinstance(data, str):
+            return skeleton + b',"detail":' + encode_basestring_ascii(data).encode("ascii") + b"}"
+        if not isinstance(data, (dict, Mapping)):
+            raise TypeError(f"Problem details must be a string or a mapping, not {type(data).__name__}")
+        encoder: JSONEncoder = cls._get_encoder() or _STDLIB_ENCODER
+        if not _SKELETON_MEMBERS.isdisjoint(data):
+            info = status_info(status)
+            return encoder.dumps(dict({"type": cls.problem_type, "title": info.phrase, "status": info.code}, **data))
+        members: bytes = encoder.dumps(data).strip()
+        if len(members) <= 2:
+            return skeleton + b"}"
+        return skeleton + b"," + members[1:]
+
+    @classmethod
+    def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ Returns a problem details response for 4xx and 5xx statuses, and a JSON response otherwise """
+        if status < 400:
+            return super()._make_response(status, data, headers, **kwargs)
+        flask: ModuleType = flask_module()
+        body: bytes = cls._problem_body(status, data)
+        response: "Response" = flask.Response(
+            [body], status, [("Content-Type", cls.problem_content_type), ("Content-Length", str(len(body)))]
+        )
+        if headers:
+            for k, v in headers.items():
+                response.headers.set(k, v)
+        return compress_response(response, kwargs.get("compress"))
@@ -0,0 +1,223 @@
+from .encoders import RawJSON, default as default_converter
+
+from typing import Optional, Any, Callable, Dict, List, Tuple
+from json.encoder import encode_basestring, encode_basestring_ascii
+from datetime import date
+import functools
+import decimal
+import typing
+import json
+import math
+import uuid
+
+try:
+    import dataclasses
+except ImportError:  # pragma: no cover - Python 3.6
+    dataclasses = None
+
+
+#: Types with a JSON representation of their own, or which `default` converts, which are never encoded as records
+#: even if they have __slots__
+_NOT_RECORDS: tuple = (str, bytes, int, float, list, tuple, dict, set, frozenset, date, decimal.Decimal, uuid.UUID,
+                       RawJSON)
+
+_NONE_TYPE: type = type(None)
+
+
+def is_dataclass(obj: Any) -> bool:
+    """ Returns True for dataclasses and their instances """
+    return dataclasses is not None and dataclasses.is_dataclass(obj)
+
+
+@functools.lru_cache(maxsize=1024)
+def record_fields(cls: type) -> Optional[Tuple[str, ...]]:
+    """ Returns the names of the fields encoded for instances of `cls`, or None if it is not a record type
+
+    Records are dataclasses, whose fields are all encoded as `dataclasses.asdict` would, and classes whose every base
+    declares __slots__, whose public slots are encoded. Instances of other classes may hold attributes no slot names.
+    """
+    if is_dataclass(cls):
+        return tuple(f.name for f in dataclasses.fields(cls))
+    if issubclass(cls, _NOT_RECORDS) or cls.__module__ == "builtins" or hasattr(cls, "__html__"):
+        return None
+    names: List[str] = []
+    for base in reversed(cls.__mro__[:-1]):
+        slots: Any = base.__dict__.get("__slots__")
+        if slots is None:
+            return None
+        names.extend(name for name in ((slots,) if isinstance(slots, str) else slots) if not name.startswith("_"))
+    return tuple(names) or None
+
+
+def _annotations(cls: type) -> Dict[str, Any]:
+    try:
+        return typing.get_type_hints(cls)
+    except Exception:
+        return {}
+
+
+def _optional(annotation: Any) -> Tuple[Any, bool]:
+    """ Returns the type an Optional annotation wraps and True, or the annotation and False """
+    if getattr(annotation, "__origin__", None) is typing.Union:
+        args: tuple = tuple(a for a in annotation.__args__ if a is not _NONE_TYPE)
+        if len(args) == 1 and len(annotation.__args__) == 2:
+            return args[0], True
+    return annotation, False
+
+
+def _fstring_text(text: str) -> str:
+    """ Escapes text to be written as it is between the fields of an f-string """
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("{", "{{").replace("}", "}}")
+
+
+class RecordSerializer(object):
+    """ Encodes dataclasses and slotted records with a serializer compiled for each type, on first use
+
+    Each type's field order and pre-escaped keys, and a converter for each field chosen from its annotation, are
+    resolved once into a function building the record's JSON with one f-string. Values which do not have their
+    annotated type are encoded generically, so annotations only decide what is fast, never what is correct. Lists
+    holding a single record type are encoded in a loop over that type's function.
+
+    Other values are encoded as by the standard library encoder, with `default` converting what it cannot.
+    """
+
+    def __init__(self, sort_keys: bool = False, ensure_ascii: bool = True,
+                 default: Optional[Callable[[Any], Any]] = default_converter):
+        self.sort_keys: bool = sort_keys
+        self.ensure_ascii: bool = ensure_ascii
+        self.default: Optional[Callable[[Any], Any]] = default
+        self._str: Callable[[str], str] = encode_basestring_ascii if ensure_ascii else encode_basestring
+        self._compiled: Dict[type, Callable[[Any], str]] = {}
+        self._fallback: Callable[[Any], str] = json.JSONEncoder(
+            separators=(",", ":"), sort_keys=sort_keys, ensure_ascii=ensure_ascii, default=self._default
+        ).encode
+
+    def dumps(self, obj: Any) -> bytes:
+        """ Returns the UTF-8 encoded JSON document of `obj` """
+        return self.encode(obj).encode("utf-8")
+
+    def encode(self, obj: Any) -> str:
+        """ Returns the JSON text of any value, using compiled serializers for records """
+        cls: type = obj.__class__
+        if cls is str:
+            return self._str(obj)
+        if cls is int:
+            return int.__repr__(obj)
+        if obj is None:
+            return "null"
+        if obj is True:
+            return "true"
+        if obj is False:
+            return "false"
+        if cls is float:
+            return _float(obj)
+        if cls is list or cls is tuple:
+            return self._sequence(obj)
+        if cls is dict:
+            return self._mapping(obj)
+        if cls is RawJSON:
+            return obj.encoded.decode("utf-8")
+        encode: Optional[Callable[[Any], str]] = self._compiled.get(cls) or self.compile(cls)
+        if encode is not None:
+            return encode(obj)
+        return self._fallback(obj)
+
+    def compile(self, cls: type) -> Optional[Callable[[Any], str]]:
+        """ Returns the serializer compiled for a record type, compiling it on first use, or None for other types """
+        encode: Optional[Callable[[Any], str]] = self._compiled.get(cls)
+        if encode is not None:
+            return encode
+        fields: Optional[Tuple[str, ...]] = record_fields(cls)
+        if fields is None:
+            return None
+        if self.sort_keys:
+            fields = tuple(sorted(fields))
+        annotations: Dict[str, Any] = _annotations(cls)
+        lines: List[str] = []
+        pieces: List[str] = []
+        separator: str = "{"
+        for i, name in enumerate(fields):
+            lines.append(f"    v{i} = o.{name}")
+            pieces.append(_fstring_text(f"{separator}{self._str(name)}:"))
+            pieces.append("{" + self._converter(f"v{i}", annotations.get(name)) + "}")
+            separator = ","
+        pieces.append("}}" if fields else "{{}}")
+        namespace: Dict[str, Any] = {
+            "_str": self._str, "_int": int.__repr__, "_float": _float, "_any": self.encode,
+        }
+        body: str = "".join(pieces)
+        source: str = "\n".join(["def encode(o):"] + lines + [f'    return f"{body}"'])
+        exec(source, namespace)
+        encode = namespace["encode"]
+        encode.__qualname__ = encode.__name__ = f"encode_{cls.__name__}"
+        self._compiled[cls] = encode
+        return encode
+
+    def _converter(self, var: str, annotation: Any) -> str:
+        """ Returns the expression encoding the variable `var`, specialized for its annotated type """
+        annotation, optional = _optional(annotation)
+        if annotation is str:
+            expression: str = f"_str({var}) if {var}.__class__ is str else _any({var})"
+        elif annotation is int:
+            expression = f"_int({var}) if {var}.__class__ is int else _any({var})"
+        elif annotation is float:
+            expression = f"_float({var}) if {var}.__class__ is float else _any({var})"
+        elif annotation is bool:
+            expression = f"'true' if {var} is True else 'false' if {var} is False else _any({var})"
+        else:
+            return f"_any({var})"
+        if optional:
+            expression = f"'null' if {var} is None else {expression}"
+        return expression
+
+    def _sequence(self, items: Any) -> str:
+        if not items:
+            return "[]"
+        if len(set(map(type, items))) == 1:
+            encode: Optional[Callable[[Any], str]] = self.compile(items[0].__class__)
+            if encode is not None:
+                return f"[{','.join(map(encode, items))}]"
+        return f"[{','.join(map(self.encode, items))}]"
+
+    def _mapping(self, mapping: dict) -> str:
+        keys: List[Any] = sorted(mapping) if self.sort_keys else list(mapping)
+        if not all(k.__class__ is str for k in keys):
+            return self._fallback(mapping)
+        encode: Callable[[Any], str] = self.encode
+        return "{" + ",".join(f"{self._str(k)}:{encode(mapping[k])}" for k in keys) + "}"
+
+    def _default(self, o: Any) -> Any:
+        """ Converts records met inside values handed to the generic encoder into dicts of their fields """
+        fields: Optional[Tuple[str, ...]] = record_fields(o.__class__)
+        if fields is not None:
+            return {name: getattr(o, name) for name in fields}
+        if isinstance(o, RawJSON):
+            return json.loads(o.encoded)
+        if self.default is None:
+            raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+        return self.default(o)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(sort_keys={self.sort_keys!r}, ensure_ascii={self.ensure_ascii!r})"
+
+
+def _float(value: float) -> str:
+    """ Formats a float as the standard library encoder does, including NaN and infinities """
+    if math.isfinite(value):
+        return float.__repr__(value)
+    if value != value:
+        return "NaN"
+    return "Infinity" if value > 0 else "-Infinity"
+
+
+_serializers: Dict[Tuple[bool, bool, Optional[Callable[[Any], Any]]], RecordSerializer] = {}
+
+
+def record_serializer(sort_keys: bool = False, ensure_ascii: bool = True,
+                      default: Optional[Callable[[Any], Any]] = default_converter) -> RecordSerializer:
+    """ Returns the serializer shared by every response encoding with these options, so types compile only once """
+    key: Tuple[bool, bool, Optional[Callable[[Any], Any]]] = (sort_keys, ensure_ascii, default)
+    serializer: Optional[RecordSerializer] = _serializers.get(key)
+    if serializer is None:
+        serializer = _serializers.setdefault(key, RecordSerializer(sort_keys, ensure_ascii, default))
+    return serializer
@@ -1,6 +1,11 @@
 from .json_response import JSONResponse
 from .xml_response import XMLResponse
 from .text_response import TextResponse
+from .file_response import FileResponse
+from .auto_response import AutoResponse
+from .binary_response import MsgpackResponse, CBORResponse
+from .sse import SSEResponse
+from .problem import ProblemResponse
 
 
 class Responder(object):
@@ -12,8 +17,24 @@ class Responder(object):
             Responder.json.bad_request()  # Returns an empty JSON string with an HTTP 400 BAD REQUEST status
         Send a text response:
             Responder.text.ok("some text")
+        Send a file, supporting Range requests:
+            Responder.file.ok("/path/to/file.pdf")
+        Send JSON, XML or text, whichever the request's Accept header prefers:
+            Responder.auto.ok("some data")
+        Send MessagePack or CBOR to other services:
+            Responder.msgpack.ok({"id": 1})
+        Stream Server-Sent Events:
+            Responder.sse.ok(events())
+        Send an RFC 7807 problem details error:
+            Responder.problem.not_found("No user with id 1")
     """
 
     json: JSONResponse = JSONResponse
     xml: XMLResponse = XMLResponse
     text: JSONResponse = TextResponse
+    file: FileResponse = FileResponse
+    auto: AutoResponse = AutoResponse
+    msgpack: MsgpackResponse = MsgpackResponse
+    cbor: CBORResponse = CBORResponse
+    sse: SSEResponse = SSEResponse
+    problem: ProblemResponse = ProblemResponse
@@ -0,0 +1,184 @@
+from .body_cache import BodyCache, DEFAULT_MAXSIZE, DEFAULT_MAX_BYTES
+from .flask_module import flask_module
+
+from typing import Optional, Any, Callable, Dict, Hashable, Iterable, List, Tuple, TYPE_CHECKING
+from types import ModuleType
+import functools
+import threading
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Request, Response
+
+
+#: Default number of seconds a response is kept
+DEFAULT_TTL: float = 60.0
+
+#: Statuses whose responses are stored by default, those RFC 7231 makes cacheable by default less the bodiless ones
+CACHEABLE_STATUSES: frozenset = frozenset((200, 203, 300, 301, 404, 405, 410, 414, 501))
+
+#: Cache-Control directives which keep a response out of a shared cache
+_PRIVATE_DIRECTIVES: tuple = ("no-store", "private", "no-cache")
+
+#: Request headers carrying credentials, whose responses are personal to the client which sent them
+CREDENTIAL_HEADERS: Tuple[str, ...] = ("Authorization", "Cookie")
+
+
+class CachedResponse(object):
+    """ The status, headers and body of a finished response, from which copies of it are stamped out """
+
+    __slots__ = ("response_class", "status", "headers", "body")
+
+    def __init__(self, response_class: type, status: int, headers: List[Tuple[str, str]], body: bytes):
+        self.response_class: type = response_class
+        self.status: int = status
+        self.headers: List[Tuple[str, str]] = headers
+        self.body: bytes = body
+
+    def __call__(self) -> "Response":
+        return self.response_class([self.body], self.status, self.headers)
+
+    def __len__(self) -> int:
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} [{self.status}] {len(self.body)} bytes>"
+
+
+class ResponseCache(BodyCache):
+    """ A thread-safe LRU cache of whole responses to GET and HEAD requests, for Flask views decorated with `cached`
+
+    A response is keyed by the request's host, path and query string, and the values of the request `headers` listed,
+    and kept `ttl` seconds. Once a view has sent a `Vary` header, the values of the request headers it names become part
+    of the key too, so clients sending different values, such as a different Accept-Encoding, get their own copy.
+    Repeat requests get a copy of the stored response without calling the view, so nothing is serialized again, or an
+    empty 304 Not Modified if its ETag or Last-Modified shows the client's copy is current. GET and HEAD requests share
+    responses, as the server drops the body of a response to HEAD.
+    Requests with the same key arriving while the view builds a response to it wait for that response, rather than
+    calling the view too, and get it unless it varies on a header they sent another value of. Those still waiting
+    after `timeout` seconds, if set, call the view themselves.
+
+    Only responses with one of `statuses` are stored, and never streamed or passed-through responses, such as files,
+    responses which set cookies, or responses with a Cache-Control of no-store, private or no-cache, or a Vary of *.
+    Requests with an Authorization or Cookie header are passed to the view, and their responses neither stored nor
+    served from the cache, as RFC 7234 section 3.2 asks of shared caches. Pass `share_credentialed=True` for views whose
+    responses are the same whoever asks; list the header in `headers` instead to keep a copy per credential.
+
+    Example usage:
+        cache = ResponseCache(maxsize=512, ttl=30, headers=("Accept-Language",))
+
+        @app.route("/products")
+        @cache.cached
+        def products():
+            return Responder.json.ok(load_products())
+
+        cache.invalidate_path("/products")
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl: Optional[float] = DEFAULT_TTL, headers: Iterable[str] = (),
+                 statuses: Iterable[int] = CACHEABLE_STATUSES, timeout: Optional[float] = None,
+                 share_credentialed: bool = False):
+        super().__init__(maxsize, max_bytes, ttl)
+        self._flights.timeout = timeout
+        self.headers: Tuple[str, ...] = tuple(headers)
+        self.statuses: frozenset = frozenset(statuses)
+        #: Whether responses to requests carrying credentials are stored and shared
+        self.share_credentialed: bool = share_credentialed
+        keyed: set = {name.lower() for name in self.headers}
+        #: Credential headers which keep a request out of the cache. Those listed in `headers` are part of the key, so
+        #: each client only gets its own responses back
+        self._credential_headers: Tuple[str, ...] = tuple(
+            name for name in CREDENTIAL_HEADERS if name.lower() not in keyed
+        )
+        self._vary_lock: threading.Lock = threading.Lock()
+        #: Each view's namespace to the request headers named by the Vary headers it has sent, lower case
+        self._vary: Dict[Hashable, Tuple[str, ...]] = {}
+
+    def cached(self, view: Callable[..., Any]) -> Callable[..., Any]:
+        """ Decorates a Flask view so its responses are stored and sent again while they are fresh """
+        namespace: str = f"{view.__module__}.{view.__qualname__}"
+
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            flask: ModuleType = flask_module()
+            if flask.request.method not in ("GET", "HEAD") or not self._is_shareable(flask.request):
+                return view(*args, **kwargs)
+            key: Tuple[Any, ...] = self._request_key(flask.request, namespace)
+            cached: Optional[CachedResponse] = self.get(key, namespace)
+            if cached is not None:
+                return cached().make_conditional(flask.request)
+            built: List[Response] = []
+
+            def build() -> Tuple[Optional[CachedResponse], Tuple[Any, ...]]:
+                built.append(flask.make_response(view(*args, **kwargs)))
+                return self._store(flask.request, built[0], namespace), self._request_key(flask.request, namespace)
+
+            try:
+                cached, stored_key = self._flights.do((namespace, key), build)
+            except TimeoutError:
+                cached = None
+            if built:
+                return built[0]
+            if cached is None or self._request_key(flask.request, namespace) != stored_key:
+                # The response this request waited for may not be shared, took too long, or varies on a request
+                # header whose value differs for this request
+                return view(*args, **kwargs)
+            return cached().make_conditional(flask.request)
+
+        return wrapper
+
+    def store(self, request: "Request", response: "Response", namespace: Hashable = None) -> bool:
+        """ Stores a response to a request unless it must not be shared, returning whether it may be shared """
+        return self._store(request, response, namespace) is not None
+
+    def _store(self, request: "Request", response: "Response", namespace: Hashable) -> Optional[CachedResponse]:
+        if not self._is_cacheable(response) or not self._is_shareable(request):
+            return None
+        vary: Tuple[str, ...] = tuple(sorted({v.strip().lower() for v in response.vary}))
+        if vary:
+            with self._vary_lock:
+                known: Tuple[str, ...] = self._vary.get(namespace, ())
+                if not set(vary) <= set(known):
+                    # Entries stored under the shorter key will not be found again, and age out of the LRU
+                    self._vary[namespace] = tuple(sorted(set(known) | set(vary)))
+        cached: CachedResponse = CachedResponse(
+            type(response), response.status_code, list(response.headers.items()), response.get_data()
+        )
+        self.set(self._request_key(request, namespace), cached, namespace)
+        return cached
+
+    def invalidate_path(self, path: str) -> int:
+        """ Removes the responses stored for a path, whatever their host, query string and headers """
+        return self._remove_where(lambda entry_key: entry_key[1][1] == path)
+
+    def clear(self) -> None:
+        """ Removes every response and the Vary headers seen, keeping the counters """
+        super().clear()
+        with self._vary_lock:
+            self._vary.clear()
+
+    def _request_key(self, request: "Request", namespace: Hashable) -> Tuple[Any, ...]:
+        vary: Tuple[str, ...] = self._vary.get(namespace, ())
+        return (
+            request.host, request.path, request.query_string,
+            tuple(request.headers.get(name) for name in self.headers),
+            tuple(request.headers.get(name) for name in vary),
+        )
+
+    def _is_shareable(self, request: "Request") -> bool:
+        return self.share_credentialed or not any(name in request.headers for name in self._credential_headers)
+
+    def _is_cacheable(self, response: "Response") -> bool:
+        if response.status_code not in self.statuses or response.is_streamed or response.direct_passthrough:
+            return False
+        if "Set-Cookie" in response.headers or "*" in response.vary:
+            return False
+        cache_control: str = response.headers.get("Cache-Control", "").lower()
+        return not any(directive in cache_control for directive in _PRIVATE_DIRECTIVES)
+
+    def _sizeof(self, cached: CachedResponse) -> int:
+        return len(cached)
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(maxsize={self.maxsize}, max_bytes={self.max_bytes}, ttl={self.ttl}, "
+                f"headers={self.headers!r})")
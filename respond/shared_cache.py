@@ -0,0 +1,318 @@
+from .body_cache import BodyCache, DEFAULT_MAXSIZE, DEFAULT_MAX_BYTES
+from .buffers import DEFAULT_CHUNK_SIZE, BufferBody, as_buffer, buffer_length
+
+from typing import Optional, Any, Dict, Hashable, Iterator, Tuple, Union
+import threading
+import tempfile
+import hashlib
+import struct
+import mmap
+import time
+import os
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+#: Identifies a cache file, and the layout of its header and index
+_MAGIC: bytes = b"RSPSHM01"
+
+#: Magic, number of sets, slots per set, size of the body area, write position, evictions
+_HEADER: struct.Struct = struct.Struct("<8sIIQQQ")
+
+#: Key digest, digest of the key alone, position the body was written at, length, expiry time (0 for none)
+_SLOT: struct.Struct = struct.Struct("<16s8sQQd")
+
+#: Slots per set of the index. A new body replaces an empty, stale or the oldest slot of its set
+_WAYS: int = 8
+
+_EMPTY_SLOT: bytes = bytes(_SLOT.size)
+
+
+def _default_path(name: str) -> str:
+    directory: str = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, f"respond-{name}.cache")
+
+
+def _namespace_name(namespace: Hashable) -> str:
+    """ Returns a name for a namespace which is the same in every process, such as a response class's import path """
+    if isinstance(namespace, type):
+        return f"{namespace.__module__}.{namespace.__qualname__}"
+    return repr(namespace)
+
+
+class SharedBodyCache(BodyCache):
+    """ A BodyCache held in a memory-mapped file, so every worker process on a host shares the bodies stored in it
+
+    Each body is stored once for all the processes opening the same `name` or `path`, which by default is a file in
+    /dev/shm, and read from the shared memory without being copied whole: `get` returns a SharedBody, which responses
+    send a chunk at a time. Keys must have the same repr in every process, such as strings, numbers and tuples of them.
+    Set `version`, such as a release number, to keep the bodies stored by workers running other code apart.
+
+    Bodies are written one after another to an area of `max_bytes` bytes, and once it is full, overwrite the oldest.
+    `maxsize` bounds the number of bodies the index holds, and bodies expire `ttl` seconds after they are stored, if
+    `ttl` is set. A body is only overwritten once `max_bytes` of newer bodies have been stored. Each chunk is checked
+    to still be live before it is copied out, and a response whose body was overwritten while it was being sent is
+    aborted with a RuntimeError rather than mixing in newer bytes, so make `max_bytes` large enough for no more than
+    that to be stored while the slowest client downloads a body.
+
+    Processes are kept apart with file locks, so this needs fcntl, which is missing on Windows. Hit and miss counters
+    are kept per process; evictions, size and bytes are those of the shared cache.
+
+    Example usage:
+        # In the module gunicorn workers import, or before they fork
+        HTTPResponse.body_cache = SharedBodyCache("api", max_bytes=512 * 1024 * 1024, version=__version__)
+    """
+
+    #: False where file locks are not available, such as on Windows
+    available: bool = fcntl is not None
+
+    def __init__(self, name: str = "bodies", maxsize: int = DEFAULT_MAXSIZE, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl: Optional[float] = None, version: str = "", path: Optional[str] = None):
+        if fcntl is None:  # pragma: no cover - not available on Windows
+            raise RuntimeError("SharedBodyCache needs the fcntl module, which is not available on this platform")
+        super().__init__(maxsize, max_bytes, ttl)
+        self.name: str = name
+        self.version: str = version
+        self.path: str = path or _default_path(name)
+        self._sets: int = max(1, -(-maxsize // _WAYS))
+        self._index_offset: int = _HEADER.size
+        self._data_offset: int = _HEADER.size + self._sets * _WAYS * _SLOT.size
+        self._pid: int = -1
+        self._fd: int = -1
+        self._map: Optional[mmap.mmap] = None
+        self._open()
+
+    def _open(self) -> None:
+        """ Maps the cache file, creating it if it does not exist
+
+        A file made with other limits may still be mapped by processes running older code, so rather than resized
+        under them it is replaced by a new file. Processes forked after the file was opened open it again, as file
+        locks are not shared with a new process.
+        """
+        size: int = self._data_offset + self.max_bytes
+        while True:
+            fd: int = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if self._is_current(fd, size):
+                    break
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+        try:
+            self._map = mmap.mmap(fd, size)
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        self._fd = fd
+        self._pid = os.getpid()
+
+    def _is_current(self, fd: int, size: int) -> bool:
+        """ Returns whether a locked file is the cache file, initializing it if it is new, or removes it if it was
+        made with other limits and returns False
+        """
+        try:
+            if os.stat(self.path).st_ino != os.fstat(fd).st_ino:
+                return False  # Replaced by another process while this one waited for the lock
+        except FileNotFoundError:
+            return False
+        file_size: int = os.fstat(fd).st_size
+        if file_size == 0:
+            os.ftruncate(fd, size)
+            os.pwrite(fd, _HEADER.pack(_MAGIC, self._sets, _WAYS, self.max_bytes, 0, 0), 0)
+            return True
+        header: bytes = os.pread(fd, _HEADER.size, 0)
+        expected: Tuple[bytes, int, int, int] = (_MAGIC, self._sets, _WAYS, self.max_bytes)
+        if file_size == size and len(header) == _HEADER.size and _HEADER.unpack(header)[:4] == expected:
+            return True
+        os.unlink(self.path)
+        return False
+
+    def _locked(self, operation: int) -> "_FileLock":
+        if self._pid != os.getpid():
+            self._lock = threading.Lock()
+            self._open()
+        return _FileLock(self._lock, self._fd, operation)
+
+    def _digests(self, key: Hashable, namespace: Hashable) -> Tuple[bytes, bytes]:
+        key_repr: bytes = repr(key).encode("utf-8")
+        digest: bytes = hashlib.blake2b(
+            repr((self.version, _namespace_name(namespace))).encode("utf-8") + b"\0" + key_repr, digest_size=16
+        ).digest()
+        return digest, hashlib.blake2b(key_repr, digest_size=8).digest()
+
+    def _slot_offset(self, digest: bytes, way: int) -> int:
+        bucket: int = int.from_bytes(digest[:8], "little") % self._sets
+        return self._index_offset + (bucket * _WAYS + way) * _SLOT.size
+
+    def _head(self) -> int:
+        return _HEADER.unpack_from(self._map, 0)[4]
+
+    def _is_live(self, slot: tuple, head: int, now: float) -> bool:
+        """ Returns whether a slot holds a body which has neither been overwritten nor expired """
+        _, _, start, length, expires = slot
+        return length > 0 and start + self.max_bytes >= head and (expires == 0 or expires > now)
+
+    def get(self, key: Hashable, namespace: Hashable = None) -> Optional["SharedBody"]:
+        """ Returns the body stored for `key` in the shared memory, or None if there is none """
+        digest, _ = self._digests(key, namespace)
+        now: float = time.time()
+        with self._locked(fcntl.LOCK_SH):
+            head: int = self._head()
+            for way in range(_WAYS):
+                slot: tuple = _SLOT.unpack_from(self._map, self._slot_offset(digest, way))
+                if slot[0] == digest and self._is_live(slot, head, now):
+                    self.hits += 1
+                    offset: int = self._data_offset + slot[2] % self.max_bytes
+                    return SharedBody(self, memoryview(self._map)[offset:offset + slot[3]], slot[2])
+            self.misses += 1
+            return None
+
+    def _read(self, view: memoryview, start: int, begin: int, end: int) -> bytes:
+        """ Copies part of a body written at `start`, raising RuntimeError if newer bodies have overwritten it """
+        with self._locked(fcntl.LOCK_SH):
+            if start + self.max_bytes < self._head():
+                raise RuntimeError(f"{self!r}: a body was overwritten by newer bodies while it was being sent")
+            return view[begin:end].tobytes()
+
+    def set(self, key: Hashable, body: Union[bytes, memoryview], namespace: Hashable = None) -> None:
+        """ Writes a body to the shared memory, overwriting the oldest bodies to make room for it """
+        view: Optional[Union[bytes, memoryview, BufferBody]] = as_buffer(body)
+        if isinstance(view, BufferBody):
+            view = bytes(view)
+        size: int = buffer_length(view)
+        if size == 0 or size > self.max_bytes or self.maxsize <= 0:
+            return
+        digest, key_digest = self._digests(key, namespace)
+        now: float = time.time()
+        expires: float = now + self.ttl if self.ttl is not None else 0.0
+        with self._locked(fcntl.LOCK_EX):
+            magic, sets, ways, max_bytes, head, evictions = _HEADER.unpack_from(self._map, 0)
+            if head % max_bytes + size > max_bytes:
+                head += max_bytes - head % max_bytes  # Bodies never wrap around the end of the area
+            offset: int = self._data_offset + head % max_bytes
+            self._map[offset:offset + size] = view
+            start: int = head
+            head += size
+
+            target: int = -1
+            oldest: int = -1
+            oldest_start: int = -1
+            for way in range(_WAYS):
+                slot_offset: int = self._slot_offset(digest, way)
+                slot: tuple = _SLOT.unpack_from(self._map, slot_offset)
+                if slot[0] == digest or not self._is_live(slot, head, now):
+                    target = slot_offset
+                    break
+                if oldest_start < 0 or slot[2] < oldest_start:
+                    oldest, oldest_start = slot_offset, slot[2]
+            if target < 0:
+                target = oldest
+                evictions += 1
+            _SLOT.pack_into(self._map, target, digest, key_digest, start, size, expires)
+            _HEADER.pack_into(self._map, 0, magic, sets, ways, max_bytes, head, evictions)
+
+    def invalidate(self, key: Hashable) -> int:
+        """ Removes the bodies stored for `key` by every response class, returning how many were removed """
+        _, key_digest = self._digests(key, None)
+        removed: int = 0
+        with self._locked(fcntl.LOCK_EX):
+            for slot_offset in range(self._index_offset, self._data_offset, _SLOT.size):
+                slot: tuple = _SLOT.unpack_from(self._map, slot_offset)
+                if slot[1] == key_digest and slot[3] > 0:
+                    self._map[slot_offset:slot_offset + _SLOT.size] = _EMPTY_SLOT
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        """ Removes every body, keeping the counters """
+        with self._locked(fcntl.LOCK_EX):
+            self._map[self._index_offset:self._data_offset] = bytes(self._data_offset - self._index_offset)
+
+    def _live_slots(self) -> list:
+        head: int = self._head()
+        now: float = time.time()
+        slots: list = [
+            _SLOT.unpack_from(self._map, offset) for offset in range(self._index_offset, self._data_offset, _SLOT.size)
+        ]
+        return [slot for slot in slots if self._is_live(slot, head, now)]
+
+    def stats(self) -> Dict[str, int]:
+        """ Returns this process's hit, miss and coalesced counters, and the shared evictions, bodies and bytes held """
+        with self._locked(fcntl.LOCK_SH):
+            slots: list = self._live_slots()
+            evictions: int = _HEADER.unpack_from(self._map, 0)[5]
+        return {
+            "hits": self.hits, "misses": self.misses, "evictions": evictions, "coalesced": self._flights.shared,
+            "size": len(slots), "bytes": sum(slot[3] for slot in slots),
+        }
+
+    def close(self) -> None:
+        """ Unmaps the cache file. Views returned by `get` must have been released first """
+        if self._map is not None and self._pid == os.getpid():
+            self._map.close()
+            os.close(self._fd)
+        self._map = None
+        self._pid = -1
+
+    def unlink(self) -> None:
+        """ Closes and deletes the cache file, for every process """
+        self.close()
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __len__(self) -> int:
+        with self._locked(fcntl.LOCK_SH):
+            return len(self._live_slots())
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}({self.name!r}, maxsize={self.maxsize}, max_bytes={self.max_bytes}, "
+                f"ttl={self.ttl}, version={self.version!r})")
+
+
+class SharedBody(BufferBody):
+    """ A body in a SharedBodyCache, which checks it has not been overwritten before copying each chunk out """
+
+    __slots__ = ("cache", "start")
+
+    def __init__(self, cache: SharedBodyCache, view: memoryview, start: int,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        super().__init__(view, chunk_size)
+        self.cache: SharedBodyCache = cache
+        #: Position the body was written at, which later writes are measured against
+        self.start: int = start
+
+    def __iter__(self) -> Iterator[bytes]:
+        size: int = self.view.nbytes
+        for begin in range(0, size, self.chunk_size):
+            yield self.cache._read(self.view, self.start, begin, min(begin + self.chunk_size, size))
+
+
+class _FileLock(object):
+    """ Holds a thread lock, as file locks do not keep apart threads of one process, and a lock on the cache file """
+
+    __slots__ = ("lock", "fd", "operation")
+
+    def __init__(self, lock: threading.Lock, fd: int, operation: int):
+        self.lock: threading.Lock = lock
+        self.fd: int = fd
+        self.operation: int = operation
+
+    def __enter__(self) -> None:
+        self.lock.acquire()
+        try:
+            fcntl.flock(self.fd, self.operation)
+        except BaseException:
+            self.lock.release()
+            raise
+
+    def __exit__(self, *exc_info: Any) -> None:
+        try:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        finally:
+            self.lock.release()
@@ -0,0 +1,105 @@
+from typing import Optional, Any, Awaitable, Callable, Dict, Hashable, Tuple
+import asyncio
+import threading
+
+
+_DEFAULT: Any = object()
+
+#: The running event loop. Python 3.6 has no get_running_loop, but its get_event_loop returns the running loop there
+_running_loop: Callable[[], asyncio.AbstractEventLoop] = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+class _Call(object):
+    """ A computation in flight in one thread, which other threads wait for """
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done: threading.Event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(object):
+    """ Coalesces concurrent computations of the same key, so one runs and every caller gets its result
+
+    The first caller of `do` for a key runs the computation in its own thread, and callers arriving while it runs wait
+    for its result rather than computing it again. If it raises, they all raise the same exception. `do_async` does
+    the same for coroutines, which share a task run on their event loop. Waiters give up after `timeout` seconds, if it
+    is set, raising TimeoutError, and the computation carries on for the callers still waiting.
+
+    Example usage:
+        flights = SingleFlight(timeout=5)
+
+        def report():
+            return flights.do(("report", day), lambda: build_report(day))
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout: Optional[float] = timeout
+        self._lock: threading.Lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], "asyncio.Future"] = {}
+        #: Number of callers which got the result of another caller's computation
+        self.shared: int = 0
+
+    def do(self, key: Hashable, compute: Callable[[], Any], timeout: Optional[float] = _DEFAULT) -> Any:
+        """ Returns `compute()`, or the result of the call of it in flight for `key` in another thread """
+        with self._lock:
+            call: Optional[_Call] = self._calls.get(key)
+            leader: bool = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        if not leader:
+            timeout = self.timeout if timeout is _DEFAULT else timeout
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Timed out after {timeout}s waiting for the computation of {key!r}")
+            with self._lock:
+                self.shared += 1
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = compute()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, compute: Callable[[], Awaitable[Any]],
+                       timeout: Optional[float] = _DEFAULT) -> Any:
+        """ Returns the result of awaiting `compute()`, or of the call of it in flight for `key` on this event loop
+
+        The computation runs as a task of its own, so cancelling or timing out any one caller, the first included,
+        does not cancel it for the others.
+        """
+        loop: asyncio.AbstractEventLoop = _running_loop()
+        task_key: Tuple[asyncio.AbstractEventLoop, Hashable] = (loop, key)
+        task: Optional[asyncio.Future] = self._tasks.get(task_key)
+        if task is None:
+            task = self._tasks[task_key] = asyncio.ensure_future(compute())
+            task.add_done_callback(lambda done: self._task_done(task_key, done))
+        else:
+            self.shared += 1
+        timeout = self.timeout if timeout is _DEFAULT else timeout
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Timed out after {timeout}s waiting for the computation of {key!r}") from None
+
+    def _task_done(self, task_key: Tuple[asyncio.AbstractEventLoop, Hashable], task: "asyncio.Future") -> None:
+        if self._tasks.get(task_key) is task:
+            del self._tasks[task_key]
+        if not task.cancelled():
+            task.exception()  # Retrieved, so a failure every caller gave up on is not logged as never retrieved
+
+    def __len__(self) -> int:
+        """ Returns the number of computations in flight """
+        return len(self._calls) + len(self._tasks)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(timeout={self.timeout!r})"
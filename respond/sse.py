@@ -0,0 +1,221 @@
+from .abs_http_response import HTTPResponse
+from .encoders import JSONEncoder, StdlibJSONEncoder
+from .status import allows_body
+from .flask_module import flask_module
+
+from typing import Optional, Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Tuple, Union, TYPE_CHECKING
+from types import ModuleType
+import asyncio
+import time
+import re
+
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
+
+
+#: Comment written when a stream opens, so the headers reach the client at once, and as the heartbeat
+HEARTBEAT: bytes = b":\n\n"
+
+#: Default number of seconds without a write after which a heartbeat is sent
+DEFAULT_HEARTBEAT: float = 15.0
+
+_LINE_BREAK: "re.Pattern" = re.compile(r"\r\n|\r|\n")
+
+_STDLIB_ENCODER: JSONEncoder = StdlibJSONEncoder()
+
+
+class Event(object):
+    """ One Server-Sent Event. Data which is not a string is sent as JSON
+
+    Sources may also yield plain data, which is sent as an event with no id or name.
+    """
+
+    __slots__ = ("data", "id", "event", "retry")
+
+    def __init__(self, data: Optional[Any] = None, id: Optional[Any] = None, event: Optional[str] = None,
+                 retry: Optional[int] = None):
+        self.data = data
+        self.id = id
+        self.event = event
+        self.retry = retry
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(data={self.data!r}, id={self.id!r}, event={self.event!r})"
+
+
+def _field(name: str, value: Any) -> str:
+    value = str(value)
+    if "\n" in value or "\r" in value or "\0" in value:
+        raise ValueError(f"Event {name} must not contain line breaks or NUL: {value!r}")
+    return f"{name}: {value}\n"
+
+
+def format_event(event: Any, dumps: Callable[[Any], bytes] = _STDLIB_ENCODER.dumps) -> bytes:
+    """ Frames an Event, or plain data, as the bytes of one Server-Sent Event """
+    if isinstance(event, Event):
+        data, event_id, name, retry = event.data, event.id, event.event, event.retry
+    else:
+        data, event_id, name, retry = event, None, None, None
+    lines: List[str] = []
+    if event_id is not None:
+        lines.append(_field("id", event_id))
+    if name:
+        lines.append(_field("event", name))
+    if retry is not None:
+        lines.append(f"retry: {int(retry)}\n")
+    if data is not None:
+        text: str = data if isinstance(data, str) else dumps(data).decode("utf-8")
+        lines.extend(f"data: {line}\n" for line in _LINE_BREAK.split(text))
+    lines.append("\n")
+    return "".join(lines).encode("utf-8")
+
+
+def iter_events(source: Iterable[Any], dumps: Callable[[Any], bytes] = _STDLIB_ENCODER.dumps,
+                heartbeat: Optional[float] = DEFAULT_HEARTBEAT, batch_size: int = 1) -> Iterator[bytes]:
+    """ Frames the events of a synchronous source as they are produced
+
+    A synchronous source cannot be interrupted while it waits for an event, so it should yield None when it has
+    nothing to send, such as when a queue read times out. On None, batched events are written, or a heartbeat if
+    `heartbeat` seconds have passed since the last write. Up to `batch_size` events are joined into one write.
+    """
+    yield HEARTBEAT
+    batch: List[bytes] = []
+    last_write: float = time.monotonic()
+    for event in source:
+        if event is not None:
+            batch.append(format_event(event, dumps))
+            if len(batch) < batch_size:
+                continue
+        if batch:
+            yield b"".join(batch)
+            batch.clear()
+            last_write = time.monotonic()
+        elif heartbeat and time.monotonic() - last_write >= heartbeat:
+            yield HEARTBEAT
+            last_write = time.monotonic()
+    if batch:
+        yield b"".join(batch)
+
+
+async def aiter_events(source: Any, dumps: Callable[[Any], bytes] = _STDLIB_ENCODER.dumps,
+                       heartbeat: Optional[float] = DEFAULT_HEARTBEAT, batch_size: int = 1) -> AsyncIterator[bytes]:
+    """ Frames the events of an async source as they are produced
+
+    A heartbeat is written whenever `heartbeat` seconds pass without an event, while the source is still awaited.
+    Events the source already has ready are joined into one write, up to `batch_size` of them. An idle subscriber
+    costs one pending task and one timer.
+    """
+    iterator: AsyncIterator[Any] = source.__aiter__()
+    pending: Optional[asyncio.Future] = None
+    try:
+        yield HEARTBEAT
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            done, _ = await asyncio.wait((pending,), timeout=heartbeat or None)
+            if not done:
+                yield HEARTBEAT
+                continue
+            batch: List[bytes] = []
+            while done:
+                try:
+                    event: Any = pending.result()
+                except StopAsyncIteration:
+                    pending = None
+                    if batch:
+                        yield b"".join(batch)
+                    return
+                pending = None
+                if event is not None:
+                    batch.append(format_event(event, dumps))
+                if len(batch) >= batch_size:
+                    break
+                # Take the next event too if the source has it ready, without waiting for it
+                pending = asyncio.ensure_future(iterator.__anext__())
+                done, _ = await asyncio.wait((pending,), timeout=0)
+            if batch:
+                yield b"".join(batch)
+    finally:
+        if pending is not None:
+            # The source must finish cancelling before it can be closed
+            pending.cancel()
+            await asyncio.wait((pending,))
+        if hasattr(iterator, "aclose"):
+            await iterator.aclose()
+
+
+def _iterate_async(chunks: AsyncIterator[bytes]) -> Iterator[bytes]:
+    """ Pulls an async stream from a WSGI server's thread, on an event loop of its own """
+    loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(chunks.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(chunks.aclose())
+        loop.close()
+
+
+class SSEResponse(HTTPResponse):
+    """ Streams Server-Sent Events from an iterator or async iterator of events
+
+    Pass a callable instead to resume a stream: it is called with the request's Last-Event-ID header, or None, and
+    returns the events to send. Events are written as the server pulls them, so a slow client slows the source down
+    rather than events piling up in memory.
+
+    Example usage:
+        Responder.sse.ok(lambda last_event_id: updates(since=last_event_id))
+    """
+
+    content_type: str = "text/event-stream"
+
+    #: Headers which keep proxies and browsers from caching or buffering the stream
+    stream_headers: Dict[str, str] = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+    #: Seconds without a write after which a heartbeat comment is sent, or None to send none
+    heartbeat: Optional[float] = DEFAULT_HEARTBEAT
+
+    #: Largest number of events joined into one write
+    batch_size: int = 1
+
+    #: Encoder for event data which is not a string. When None, the standard library encoder is used
+    encoder: Optional[JSONEncoder] = None
+
+    @classmethod
+    def _encode(cls, data: Optional[Any] = None, **kwargs) -> Tuple[Union[Iterator[bytes], AsyncIterator[bytes]], str]:
+        """ Returns the event stream and its content type, without needing Flask
+
+        Pass `last_event_id` to resume a stream outside a Flask request, and `heartbeat` and `batch_size` to override
+        the class defaults.
+        """
+        if callable(data):
+            data = data(kwargs.get("last_event_id"))
+        dumps: Callable[[Any], bytes] = (cls.encoder or _STDLIB_ENCODER).dumps
+        heartbeat: Optional[float] = kwargs.get("heartbeat", cls.heartbeat)
+        batch_size: int = kwargs.get("batch_size", cls.batch_size)
+        if hasattr(data, "__aiter__"):
+            return aiter_events(data, dumps, heartbeat, batch_size), cls.content_type
+        return iter_events(data if data is not None else (), dumps, heartbeat, batch_size), cls.content_type
+
+    @classmethod
+    def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ Returns a streamed event response. Async sources are pulled on an event loop of the response's own """
+        flask: ModuleType = flask_module()
+        if not allows_body(status):
+            response: "Response" = flask.Response(status=status)
+            for k, v in (headers or {}).items():
+                response.headers.set(k, v)
+            return response
+        if "last_event_id" not in kwargs and flask.has_request_context():
+            kwargs["last_event_id"] = flask.request.headers.get("Last-Event-ID")
+        body, content_type = cls._encode(data, **kwargs)
+        if hasattr(body, "__aiter__"):
+            body = _iterate_async(body)
+        if flask.has_request_context():
+            body = flask.stream_with_context(body)
+        response = flask.Response(body, status, content_type=content_type)
+        for k, v in dict(cls.stream_headers, **(headers or {})).items():
+            response.headers.set(k, v)
+        return response
@@ -0,0 +1,67 @@
+from typing import Optional, Mapping, NamedTuple, Tuple
+from types import MappingProxyType
+from http import HTTPStatus
+
+
+class StatusInfo(NamedTuple):
+    """ What every response with a status code shares """
+
+    code: int
+    phrase: str
+    #: The status line sent by WSGI servers, such as "404 Not Found"
+    line: str
+    #: False for statuses which must not carry a body: 1xx, 204 No Content, 205 Reset Content and 304 Not Modified
+    allows_body: bool
+    #: Headers sent with every response of this status, unless the caller sends its own value
+    headers: Tuple[Tuple[str, str], ...] = ()
+
+
+#: Phrases of statuses missing from HTTPStatus in older Python versions
+_PHRASES: Mapping[int, str] = {103: "Early Hints", 418: "I'm a Teapot", 425: "Too Early"}
+
+_BODILESS: frozenset = frozenset((204, 205, 304))
+
+_DEFAULT_HEADERS: Mapping[int, Tuple[Tuple[str, str], ...]] = {
+    205: (("Content-Length", "0"),),
+}
+
+
+def _status_info(code: int, phrase: str) -> StatusInfo:
+    return StatusInfo(
+        code, phrase, f"{code} {phrase}", not (100 <= code < 200 or code in _BODILESS), _DEFAULT_HEADERS.get(code, ())
+    )
+
+
+def _build_table() -> Mapping[int, StatusInfo]:
+    phrases: dict = dict(_PHRASES)
+    phrases.update((status.value, status.phrase) for status in HTTPStatus)
+    return MappingProxyType({code: _status_info(code, phrase) for code, phrase in sorted(phrases.items())})
+
+
+#: Every known status code, built once at import and read-only
+STATUSES: Mapping[int, StatusInfo] = _build_table()
+
+
+def status_info(code: int) -> StatusInfo:
+    """ Returns the table entry for a status code, or an entry with an UNKNOWN phrase for codes not in the table
+
+    Raises ValueError for codes outside 100-599.
+    """
+    info: Optional[StatusInfo] = STATUSES.get(code)
+    if info is not None:
+        return info
+    if not 100 <= code <= 599:
+        raise ValueError(f"{code!r} is not a valid HTTP status code")
+    return _status_info(int(code), "UNKNOWN")
+
+
+def status_line(code: int) -> str:
+    """ Returns the WSGI status line for a status code, such as "404 Not Found" """
+    info: Optional[StatusInfo] = STATUSES.get(code)
+    return info.line if info is not None else f"{int(code)} UNKNOWN"
+
+
+def allows_body(code: int) -> bool:
+    """ Returns False for statuses which must not carry a body """
+    info: Optional[StatusInfo] = STATUSES.get(code)
+    return info.allows_body if info is not None else True
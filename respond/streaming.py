@@ -0,0 +1,101 @@
+from typing import Any, Callable, Iterable, Iterator, AsyncIterable, AsyncIterator
+
+#: Default number of bytes buffered before a chunk is handed to the server
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+#: Stream formats understood by JSONResponse
+JSON_ARRAY: str = "array"
+NDJSON: str = "ndjson"
+
+
+def iter_chunks(parts: Iterable[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """ Joins small byte strings into chunks of at least `chunk_size` bytes, so the server makes fewer writes
+
+    At most one chunk is held in memory at a time, however many parts are streamed.
+    """
+    buffer: list = []
+    buffered: int = 0
+    for part in parts:
+        buffer.append(part)
+        buffered += len(part)
+        if buffered >= chunk_size:
+            yield b"".join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _json_array_parts(items: Iterable[Any], dumps: Callable[[Any], bytes]) -> Iterator[bytes]:
+    yield b"["
+    first: bool = True
+    for item in items:
+        if first:
+            first = False
+        else:
+            yield b","
+        yield dumps(item)
+    yield b"]"
+
+
+def _ndjson_parts(items: Iterable[Any], dumps: Callable[[Any], bytes]) -> Iterator[bytes]:
+    for item in items:
+        yield dumps(item)
+        yield b"\n"
+
+
+def iter_json_array(items: Iterable[Any], dumps: Callable[[Any], bytes],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """ Encodes an iterable item by item as the chunks of a single JSON array """
+    return iter_chunks(_json_array_parts(items, dumps), chunk_size)
+
+
+def iter_ndjson(items: Iterable[Any], dumps: Callable[[Any], bytes],
+                chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """ Encodes an iterable item by item as newline delimited JSON """
+    return iter_chunks(_ndjson_parts(items, dumps), chunk_size)
+
+
+async def aiter_chunks(parts: AsyncIterable[bytes], chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """ Async counterpart of `iter_chunks` """
+    buffer: list = []
+    buffered: int = 0
+    async for part in parts:
+        buffer.append(part)
+        buffered += len(part)
+        if buffered >= chunk_size:
+            yield b"".join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+async def _ajson_array_parts(items: AsyncIterable[Any], dumps: Callable[[Any], bytes]) -> AsyncIterator[bytes]:
+    yield b"["
+    first: bool = True
+    async for item in items:
+        if first:
+            first = False
+        else:
+            yield b","
+        yield dumps(item)
+    yield b"]"
+
+
+async def _andjson_parts(items: AsyncIterable[Any], dumps: Callable[[Any], bytes]) -> AsyncIterator[bytes]:
+    async for item in items:
+        yield dumps(item)
+        yield b"\n"
+
+
+def aiter_json_array(items: AsyncIterable[Any], dumps: Callable[[Any], bytes],
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """ Encodes an async iterable item by item as the chunks of a single JSON array """
+    return aiter_chunks(_ajson_array_parts(items, dumps), chunk_size)
+
+
+def aiter_ndjson(items: AsyncIterable[Any], dumps: Callable[[Any], bytes],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """ Encodes an async iterable item by item as newline delimited JSON """
+    return aiter_chunks(_andjson_parts(items, dumps), chunk_size)
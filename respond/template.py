@@ -0,0 +1,52 @@
+from typing import Optional, Any, Callable, List, Tuple
+import threading
+
+
+class ResponseTemplate(object):
+    """ A response whose status, body and headers never change
+
+    The response is built once, on first use, and its body bytes, Content-Length and header list are frozen. Every
+    call afterwards stamps out a new response object from the frozen parts, skipping serialization entirely.
+
+    Example usage:
+        NOT_FOUND = Responder.json.template(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+        @app.route("/missing")
+        def missing():
+            return NOT_FOUND()
+    """
+
+    __slots__ = ("_factory", "_lock", "response_class", "status", "body", "headers")
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory: Optional[Callable[[], Any]] = factory
+        self._lock: threading.Lock = threading.Lock()
+        self.response_class: Optional[type] = None
+        self.status: int = 0
+        self.body: bytes = b""
+        self.headers: List[Tuple[str, str]] = []
+
+    def _freeze(self) -> None:
+        """ Builds the response and keeps its parts """
+        with self._lock:
+            if self._factory is None:
+                return
+            response = self._factory()
+            body: bytes = response.get_data()
+            if "Content-Length" not in response.headers:
+                response.headers["Content-Length"] = str(len(body))
+            self.response_class = type(response)
+            self.status = response.status_code
+            self.body = body
+            self.headers = list(response.headers.items())
+            self._factory = None
+
+    def __call__(self, headers: Optional[dict] = None):
+        """ Returns a new response, optionally with extra headers set on it """
+        if self._factory is not None:
+            self._freeze()
+        response = self.response_class([self.body], self.status, self.headers)
+        if headers:
+            for k, v in headers.items():
+                response.headers.set(k, v)
+        return response
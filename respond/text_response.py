@@ -1,18 +1,52 @@
 from .abs_http_response import HTTPResponse
+from .compression import compress_response
+from .conditional import not_modified_response, conditional_response
+from .buffers import BUFFER_TYPES, as_buffer, buffer_response
+from .flask_module import flask_module
 
-from flask import make_response, Response
+from typing import Optional, Any, Tuple, Union, Iterable, TYPE_CHECKING
+from types import ModuleType
 
-from typing import Optional, Any
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
 
 
 class TextResponse(HTTPResponse):
 
+    prebuild_empty: bool = True
+
+    content_type: str = "text/plain; charset=utf-8"
+
+    @classmethod
+    def _encode(cls, data: Optional[Any] = None, **kwargs) -> Tuple[Union[bytes, memoryview, Iterable[bytes]], str]:
+        """ Returns the body and content type of a text response, without needing Flask """
+        if data is None:
+            data = ""
+        body: Optional[Union[bytes, memoryview]] = as_buffer(data)
+        return body if body is not None else data, cls.content_type
+
+    @classmethod
+    def _renders(cls, data: Any) -> bool:
+        """ Text is rendered from strings and buffers, but not from data which would have to be serialized first """
+        return data is None or isinstance(data, (str,) + BUFFER_TYPES)
+
     @classmethod
     def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
-        """ Returns a text response """
-        response: Response = make_response(data if data is not None else "", status)
-        response.headers.set("Content-Type", "text/plain; charset=utf-8")
+        """ Returns a text response
+
+        Strings are encoded once. Bytes, bytearrays, memoryviews and other buffers are sent without being copied
+        first, with their Content-Length worked out up front.
+        """
+        flask: ModuleType = flask_module()
+        not_modified: Optional["Response"] = not_modified_response(status, headers, kwargs)
+        if not_modified is not None:
+            return not_modified
+        response: "Response" = buffer_response(data if data is not None else "", status, cls.content_type)
+        if response is None:
+            response = flask.make_response(data, status)
+            response.headers.set("Content-Type", cls.content_type)
         if headers:
             for k, v in headers.items():
                 response.headers.set(k, v)
-        return response
+        response = conditional_response(response, headers, kwargs)
+        return compress_response(response, kwargs.get("compress"))
@@ -0,0 +1,92 @@
+from .abs_http_response import HTTPResponse
+from .json_response import JSONResponse
+from .xml_response import XMLResponse
+from .text_response import TextResponse
+from .status import status_line, allows_body
+from .buffers import BUFFER_TYPES, buffer_length, wsgi_body
+
+from typing import Optional, Any, Callable, Iterable, List, Tuple, Type, Union
+
+
+class RawResponse(object):
+    """ A lightweight response record of a status, a header list and a body
+
+    The record only becomes a WSGI (status, headers, body iterable) triple at the boundary, through `to_wsgi`, or by
+    calling it as a WSGI application. Flask views may also return it directly, as Flask accepts WSGI applications.
+    """
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(self, status: int, headers: List[Tuple[str, str]], body: Union[bytes, Iterable[bytes]] = b""):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def get_data(self) -> bytes:
+        """ Returns the body as bytes, consuming it if it is streamed """
+        if isinstance(self.body, BUFFER_TYPES):
+            return bytes(self.body)
+        self.body = b"".join(self.body)
+        return self.body
+
+    def to_wsgi(self) -> Tuple[str, List[Tuple[str, str]], Iterable[bytes]]:
+        """ Returns the (status, headers, body iterable) triple a WSGI application hands to the server """
+        body: Union[bytes, Iterable[bytes]] = self.body
+        if isinstance(body, BUFFER_TYPES):
+            body = wsgi_body(body)
+            if isinstance(body, bytes):
+                body = (body,)
+        return status_line(self.status), self.headers, body
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        status, headers, body = self.to_wsgi()
+        start_response(status, headers)
+        if environ.get("REQUEST_METHOD") == "HEAD":
+            return ()
+        return body
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} [{self.status}]>"
+
+
+class RawResponseMixin(object):
+    """ Makes an HTTPResponse subclass return RawResponse records, built from its `_encode` method without Flask
+
+    Options that need the request, such as `compress` and `etag`, are not applied to raw responses.
+    """
+
+    prebuild_empty: bool = False
+
+    @classmethod
+    def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
+        """ Returns a RawResponse record """
+        header_list: List[Tuple[str, str]] = []
+        body: Union[bytes, Iterable[bytes]] = b""
+        if allows_body(status):
+            body, content_type = cls._encode(data, **kwargs)
+            header_list.append(("Content-Type", content_type))
+            if isinstance(body, BUFFER_TYPES):
+                header_list.append(("Content-Length", str(buffer_length(body))))
+        if headers:
+            names: set = {k.lower() for k in headers}
+            header_list = [h for h in header_list if h[0].lower() not in names]
+            header_list.extend((k, str(v)) for k, v in headers.items())
+        return RawResponse(int(status), header_list, body)
+
+
+def raw_response_class(response_class: Type[HTTPResponse]) -> Type[HTTPResponse]:
+    """ Returns a subclass of a response class whose status methods return RawResponse records """
+    return type(response_class.__name__, (RawResponseMixin, response_class), {})
+
+
+class WSGIResponder(object):
+    """ Responder for WSGI applications which do not use Flask
+
+    Example usage:
+        def application(environ, start_response):
+            return WSGIResponder.json.ok({"message": "ok"})(environ, start_response)
+    """
+
+    json: JSONResponse = raw_response_class(JSONResponse)
+    xml: XMLResponse = raw_response_class(XMLResponse)
+    text: TextResponse = raw_response_class(TextResponse)
@@ -1,18 +1,85 @@
 from .abs_http_response import HTTPResponse
+from .compression import compress_response
+from .conditional import not_modified_response, conditional_response
+from .buffers import BUFFER_TYPES, as_buffer, buffer_response
+from .streaming import DEFAULT_CHUNK_SIZE
+from .xml_serializer import is_serializable, to_xml, iter_xml, DEFAULT_ROOT, DEFAULT_ITEM
+from .flask_module import flask_module
 
-from flask import make_response, Response
+from typing import Optional, Any, Tuple, Union, Iterable, Iterator, TYPE_CHECKING
+from types import ModuleType
 
-from typing import Optional, Any
+if TYPE_CHECKING:  # pragma: no cover
+    from flask import Response
 
 
 class XMLResponse(HTTPResponse):
 
+    prebuild_empty: bool = True
+
+    content_type: str = "text/xml; charset=utf-8"
+
+    #: Root element of serialized dicts, lists and generators. Pass `root` to override it for one response
+    root_tag: str = DEFAULT_ROOT
+
+    #: Element wrapping each entry of a serialized list or generator which is not itself an element
+    item_tag: str = DEFAULT_ITEM
+
+    @classmethod
+    def _encode(cls, data: Optional[Any] = None, **kwargs) -> Tuple[Union[bytes, memoryview, Iterable[bytes]], str]:
+        """ Returns the body and content type of a XML response, without needing Flask """
+        if data is None:
+            data = ""
+        if is_serializable(data):
+            root: str = kwargs.get("root") or cls.root_tag
+            if kwargs.get("stream") or isinstance(data, Iterator):
+                chunk_size: int = kwargs.get("chunk_size", DEFAULT_CHUNK_SIZE)
+                return iter_xml(data, root, cls.item_tag, chunk_size), cls.content_type
+            body: Union[bytes, memoryview] = cls._cached_body(
+                kwargs.get("cache_key"), lambda: to_xml(data, root, cls.item_tag)
+            )
+            return body, cls.content_type
+        body: Optional[Union[bytes, memoryview]] = as_buffer(data)
+        return body if body is not None else data, cls.content_type
+
+    @classmethod
+    def _renders(cls, data: Any) -> bool:
+        """ XML is rendered from the data the serializer takes, and from strings and bytes which are XML documents """
+        if data is None or is_serializable(data):
+            return True
+        if isinstance(data, str):
+            return data.lstrip().startswith("<")
+        return isinstance(data, (bytes, bytearray)) and data.lstrip().startswith(b"<")
+
     @classmethod
     def _make_response(cls, status: int, data: Optional[Any] = None, headers: Optional[dict] = None, **kwargs):
-        """ Returns an XML response """
-        response: Response = make_response(data if data is not None else "", status)
-        response.headers.set("Content-Type", "text/xml; charset=utf-8")
+        """ Returns an XML response
+
+        Strings are encoded once, and bytes, bytearrays, memoryviews and other buffers are sent without being copied
+        first. Dicts, lists and ElementTree elements are serialized, and generators of elements
+        are streamed as they are serialized, one element at a time. Pass `stream=True` to stream any of these,
+        `chunk_size` to set the number of bytes buffered before each write, and `root` to name the root element.
+        Pass `cache_key` to reuse the document serialized by an earlier call with the same key.
+        """
+        flask: ModuleType = flask_module()
+        not_modified: Optional["Response"] = not_modified_response(status, headers, kwargs)
+        if not_modified is not None:
+            return not_modified
+        if is_serializable(data):
+            body, content_type = cls._encode(data, **kwargs)
+            if isinstance(body, BUFFER_TYPES):
+                response: "Response" = buffer_response(body, status, content_type)
+            else:
+                if flask.has_request_context():
+                    body = flask.stream_with_context(body)
+                response = flask.Response(body, status, content_type=content_type)
+        else:
+            response = buffer_response(data if data is not None else "", status, cls.content_type)
+            if response is None:
+                response = flask.make_response(data, status)
+                response.headers.set("Content-Type", cls.content_type)
         if headers:
             for k, v in headers.items():
                 response.headers.set(k, v)
-        return response
+        response = conditional_response(response, headers, kwargs)
+        return compress_response(response, kwargs.get("compress"))
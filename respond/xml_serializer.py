@@ -0,0 +1,205 @@
+from .streaming import DEFAULT_CHUNK_SIZE
+
+from typing import Any, Iterator, List, Pattern
+from xml.sax.saxutils import escape, quoteattr
+import collections.abc
+import functools
+import re
+
+
+#: Tag used for the root element of serialized dicts, lists and generators
+DEFAULT_ROOT: str = "response"
+
+#: Tag used for each item of a list or generator which is not itself an element
+DEFAULT_ITEM: str = "item"
+
+_DECLARATION: str = '<?xml version="1.0" encoding="UTF-8"?>'
+
+_NAME: Pattern = re.compile(r"[^\W\d][\w.:-]*")
+
+_SCALARS: tuple = (str, int, float)
+_SEQUENCES: tuple = (list, tuple, collections.abc.Iterator)
+
+
+def is_serializable(data: Any) -> bool:
+    """ Returns True for data the serializer turns into XML, rather than data sent as the body as it is """
+    return isinstance(data, (dict,) + _SEQUENCES) or hasattr(data, "tag")
+
+
+@functools.lru_cache(maxsize=1024)
+def _tag(name: Any) -> str:
+    """ Returns a key as a tag name, raising ValueError if it is not a valid XML name """
+    name = str(name)
+    if not _NAME.fullmatch(name):
+        raise ValueError(f"{name!r} is not a valid XML element name")
+    return name
+
+
+def _text(value: Any) -> str:
+    if isinstance(value, str):
+        return escape(value) if "&" in value or "<" in value or ">" in value else value
+    if value is True or value is False:
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return escape(str(value))
+
+
+def _attribute(value: Any) -> str:
+    if value is True or value is False:
+        return '"true"' if value else '"false"'
+    if isinstance(value, (int, float)):
+        return f'"{value}"'
+    return quoteattr(str(value))
+
+
+def _write_element(out: List[str], element: Any) -> None:
+    """ Appends the pieces of an ElementTree element and its tail to `out`
+
+    Elements with namespaces, comments and processing instructions are handed to ElementTree instead.
+    """
+    tag: Any = element.tag
+    if not isinstance(tag, str) or tag[:1] == "{" or any(k[:1] == "{" for k in element.attrib):
+        from xml.etree import ElementTree
+        out.append(ElementTree.tostring(element, encoding="unicode"))
+        return
+    attributes: str = "".join(f" {k}={_attribute(v)}" for k, v in element.attrib.items()) if element.attrib else ""
+    if element.text or len(element):
+        out.append(f"<{tag}{attributes}>")
+        if element.text:
+            out.append(_text(element.text))
+        for child in element:
+            _write_element(out, child)
+        out.append(f"</{tag}>")
+    else:
+        out.append(f"<{tag}{attributes}/>")
+    if element.tail:
+        out.append(_text(element.tail))
+
+
+def _write(out: List[str], tag: str, value: Any, item: str) -> None:
+    """ Appends the pieces of one element named `tag` holding `value` to `out`
+
+    Dict keys become child elements, except keys starting with "@", which become attributes, and "#text", which
+    becomes text. Lists become one element per item, all named `tag`, and lists within them one element each, holding
+    an `item` element per entry.
+    """
+    if isinstance(value, _SCALARS):
+        out.append(f"<{tag}>{_text(value)}</{tag}>")
+    elif isinstance(value, dict):
+        start: int = len(out)
+        out.append("")  # Replaced by the start tag once the attributes are known
+        attributes: List[str] = []
+        for k, v in value.items():
+            if k == "#text":
+                out.append(_text(v))
+            elif isinstance(k, str) and k[:1] == "@":
+                attributes.append(f" {_tag(k[1:])}={_attribute(v)}")
+            else:
+                _write(out, _tag(k), v, item)
+        out[start] = f"<{tag}{''.join(attributes)}>"
+        out.append(f"</{tag}>")
+    elif isinstance(value, _SEQUENCES):
+        for entry in value:
+            _write_item(out, tag, entry, item)
+    elif value is None:
+        out.append(f"<{tag}/>")
+    elif hasattr(value, "tag"):
+        out.append(f"<{tag}>")
+        _write_element(out, value)
+        out.append(f"</{tag}>")
+    else:
+        out.append(f"<{tag}>{_text(value)}</{tag}>")
+
+
+def _write_item(out: List[str], tag: str, entry: Any, item: str) -> None:
+    """ Appends one entry of a list as an element named `tag`
+
+    An entry which is a list itself gets one element, holding an `item` element per entry, rather than its items being
+    flattened into the parent's.
+    """
+    if isinstance(entry, _SEQUENCES):
+        out.append(f"<{tag}>")
+        for inner in entry:
+            _write_item(out, item, inner, item)
+        out.append(f"</{tag}>")
+    else:
+        _write(out, tag, entry, item)
+
+
+def _write_entry(out: List[str], entry: Any, item: str) -> None:
+    if hasattr(entry, "tag"):
+        _write_element(out, entry)
+    else:
+        _write_item(out, item, entry, item)
+
+
+def _document(data: Any, root: str, item: str) -> Iterator[List[str]]:
+    """ Yields the pieces of a document a few at a time, between entries, so it can be sent as it is serialized
+
+    The entries are the items of a list or iterable, or of the lists held by a dict's keys.
+    """
+    out: List[str] = [_DECLARATION]
+    if hasattr(data, "tag"):
+        _write_element(out, data)
+        yield out
+        return
+    root = _tag(root)
+    item = _tag(item)
+    if isinstance(data, dict):
+        # The same as _write(out, root, data, item), but yielding between the items of each list
+        attributes: str = "".join(
+            f" {_tag(k[1:])}={_attribute(v)}" for k, v in data.items() if isinstance(k, str) and k[:1] == "@"
+        )
+        out.append(f"<{root}{attributes}>")
+        for k, v in data.items():
+            if k == "#text":
+                out.append(_text(v))
+            elif isinstance(k, str) and k[:1] == "@":
+                continue
+            elif isinstance(v, _SEQUENCES):
+                tag: str = _tag(k)
+                for entry in v:
+                    _write_item(out, tag, entry, item)
+                    yield out
+            else:
+                _write(out, _tag(k), v, item)
+    else:
+        out.append(f"<{root}>")
+        for entry in data:
+            _write_entry(out, entry, item)
+            yield out
+    out.append(f"</{root}>")
+    yield out
+
+
+def to_xml(data: Any, root: str = DEFAULT_ROOT, item: str = DEFAULT_ITEM) -> bytes:
+    """ Serializes a dict, list, ElementTree element or iterable of elements to a UTF-8 XML document
+
+    Dicts are wrapped in a `root` element. Lists and iterables are too, with each entry that is not an element
+    wrapped in an `item` element. An element is serialized as the document's root.
+    """
+    out: List[str] = []
+    for out in _document(data, root, item):
+        pass
+    return "".join(out).encode("utf-8")
+
+
+def iter_xml(data: Any, root: str = DEFAULT_ROOT, item: str = DEFAULT_ITEM,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """ Serializes the same documents as `to_xml` as they are sent, in chunks of at least `chunk_size` bytes
+
+    For a generator, only the entry being serialized and one chunk are held in memory at a time.
+    """
+    buffered: int = 0
+    counted: int = 0
+    for out in _document(data, root, item):
+        # Only the pieces appended since the last entry are counted
+        buffered += sum(map(len, out[counted:]))
+        counted = len(out)
+        if buffered >= chunk_size:
+            yield "".join(out).encode("utf-8")
+            out.clear()
+            buffered = counted = 0
+    if counted:
+        yield "".join(out).encode("utf-8")
@@ -0,0 +1,127 @@
+from respond.asgi import AsyncResponder, ASGIResponse, get_executor
+from respond.encoders import StdlibJSONEncoder
+
+from http import HTTPStatus
+import unittest
+import asyncio
+import threading
+import json
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def call(response: ASGIResponse, method: str = "GET"):
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await response({"type": "http", "method": method}, None, send)
+    start = messages[0]
+    return start["status"], dict(start["headers"]), b"".join(m.get("body", b"") for m in messages[1:]), messages
+
+
+class TestAsyncResponder(unittest.TestCase):
+
+    def test_json(self):
+
+        response = run(AsyncResponder.json.created({"test": [1, 2, 3]}, headers={"X-Custom": "OK"}))
+        self.assertIsInstance(response, ASGIResponse)
+        status, headers, body, _ = run(call(response))
+        self.assertEqual(status, HTTPStatus.CREATED)
+        self.assertEqual(headers[b"content-type"], b"application/json")
+        self.assertEqual(headers[b"content-length"], str(len(body)).encode())
+        self.assertEqual(headers[b"x-custom"], b"OK")
+        self.assertEqual(json.loads(body), {"test": [1, 2, 3]})
+
+    def test_status_methods(self):
+
+        for method, status in (("too_many_requests", 429), ("no_content", 204), ("im_a_teapot", 418)):
+            response = run(getattr(AsyncResponder.text, method)())
+            self.assertEqual(response.status, status)
+
+    def test_xml_and_text(self):
+
+        _, headers, body, _ = run(call(run(AsyncResponder.xml.ok("<ok/>"))))
+        self.assertEqual(headers[b"content-type"], b"text/xml; charset=utf-8")
+        self.assertEqual(body, b"<ok/>")
+
+        _, headers, body, _ = run(call(run(AsyncResponder.text.ok("Test OK"))))
+        self.assertEqual(body, b"Test OK")
+
+    def test_head(self):
+
+        _, _, body, _ = run(call(run(AsyncResponder.json.ok([1])), method="HEAD"))
+        self.assertEqual(body, b"")
+
+    def test_large_payloads_are_serialized_off_the_loop(self):
+
+        threads = []
+
+        class Recorder(object):
+
+            def __init__(self, value):
+                self.value = value
+
+        def record(o):
+            threads.append(threading.current_thread())
+            return o.value
+
+        response_class = AsyncResponder.json.with_encoder(StdlibJSONEncoder(default=record))
+
+        run(response_class.ok([Recorder(1)]))
+        self.assertEqual(threads, [threading.current_thread()])
+
+        response = run(response_class.ok([Recorder(i) for i in range(300)]))
+        self.assertNotIn(threading.current_thread(), threads[1:])
+        self.assertEqual(json.loads(response.body), list(range(300)))
+
+        threads.clear()
+        response = run(response_class.ok({"items": [Recorder(i) for i in range(300)], "next": None}))
+        self.assertNotIn(threading.current_thread(), threads)
+        self.assertEqual(json.loads(response.body)["items"], list(range(300)))
+
+        threads.clear()
+        run(response_class.ok({"items": [Recorder(1)], "next": None}))
+        self.assertEqual(threads, [threading.current_thread()])
+
+        threads.clear()
+        run(response_class.ok([Recorder(1)], offload=True))
+        self.assertNotEqual(threads, [threading.current_thread()])
+
+    def test_sync_stream(self):
+
+        def rows():
+            for i in range(3):
+                yield {"id": i}
+
+        response = run(AsyncResponder.json.ok(rows(), chunk_size=1))
+        _, headers, body, messages = run(call(response))
+        self.assertNotIn(b"content-length", headers)
+        self.assertTrue(messages[1]["more_body"])
+        self.assertEqual(json.loads(body), [{"id": 0}, {"id": 1}, {"id": 2}])
+
+    def test_async_stream(self):
+
+        async def rows():
+            for i in range(3):
+                await asyncio.sleep(0)
+                yield {"id": i}
+
+        async def respond():
+            response = await AsyncResponder.json.ok(rows(), stream="ndjson")
+            return await call(response)
+
+        _, headers, body, _ = run(respond())
+        self.assertEqual(headers[b"content-type"], b"application/x-ndjson")
+        self.assertEqual([json.loads(line) for line in body.splitlines()], [{"id": 0}, {"id": 1}, {"id": 2}])
+
+    def test_executor_is_bounded(self):
+
+        self.assertLessEqual(get_executor()._max_workers, 4)
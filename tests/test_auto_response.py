@@ -0,0 +1,105 @@
+from flask import Flask
+from respond import Responder
+from respond.auto_response import parse_accept, best_match
+
+from http import HTTPStatus
+import unittest
+
+
+OFFERED = ("application/json", "application/xml", "text/xml", "text/plain")
+
+
+def create_app() -> Flask:
+
+    app = Flask(__name__)
+
+    @app.route("/text")
+    def text():
+        return Responder.auto.ok("Test OK")
+
+    @app.route("/dict")
+    def dict_():
+        return Responder.auto.ok({"message": "OK"})
+
+    @app.route("/document")
+    def document():
+        return Responder.auto.ok("<message>OK</message>")
+
+    @app.route("/empty")
+    def empty():
+        return Responder.auto.not_found()
+
+    return app
+
+
+class TestParseAccept(unittest.TestCase):
+
+    def test_parse(self):
+
+        self.assertEqual(
+            parse_accept("text/html, application/xml;q=0.9, */*;q=0.8, bad"),
+            [("text", "html", 1.0), ("application", "xml", 0.9), ("*", "*", 0.8)]
+        )
+        self.assertEqual(parse_accept("text/plain;q=x"), [("text", "plain", 0.0)])
+
+    def test_best_match(self):
+
+        self.assertEqual(best_match("application/json", OFFERED), 0)
+        self.assertEqual(best_match("text/plain", OFFERED), 3)
+        self.assertEqual(best_match("application/xml;q=0.9, text/plain", OFFERED), 3)
+        self.assertEqual(best_match("text/*", OFFERED), 2)
+        self.assertEqual(best_match("*/*", OFFERED), 0)
+        self.assertEqual(best_match("*/*, application/json;q=0", OFFERED), 1)
+        self.assertIsNone(best_match("image/png", OFFERED))
+
+    def test_cached(self):
+
+        best_match.cache_clear()
+        best_match("text/plain", OFFERED)
+        best_match("text/plain", OFFERED)
+        self.assertEqual(best_match.cache_info().hits, 1)
+
+
+class TestAutoResponse(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_client = create_app().test_client()
+
+    def test_negotiates(self):
+
+        for accept, content_type in (
+            (None, "application/json"),
+            ("application/json", "application/json"),
+            ("text/plain, application/json;q=0.5", "text/plain; charset=utf-8"),
+            ("image/png", "application/json"),
+        ):
+            r = self.test_client.get("/text", headers={"Accept": accept} if accept else {})
+            self.assertEqual(r.status_code, HTTPStatus.OK)
+            self.assertEqual(r.content_type, content_type)
+            self.assertIn("Accept", r.headers["Vary"])
+
+    def test_only_renderable_formats(self):
+
+        r = self.test_client.get("/dict", headers={"Accept": "text/plain, application/json;q=0.5"})
+        self.assertEqual(r.content_type, "application/json")
+        self.assertEqual(r.get_json(), {"message": "OK"})
+
+        r = self.test_client.get("/dict", headers={"Accept": "text/xml"})
+        self.assertEqual(r.content_type, "text/xml; charset=utf-8")
+        self.assertIn(b"<message>OK</message>", r.data)
+
+        r = self.test_client.get("/text", headers={"Accept": "text/xml, text/plain;q=0.5"})
+        self.assertEqual((r.content_type, r.data), ("text/plain; charset=utf-8", b"Test OK"))
+
+        r = self.test_client.get("/text", headers={"Accept": "text/xml"})
+        self.assertEqual((r.content_type, r.get_json()), ("application/json", "Test OK"))
+
+        r = self.test_client.get("/document", headers={"Accept": "text/xml, text/plain;q=0.5"})
+        self.assertEqual((r.content_type, r.data), ("text/xml; charset=utf-8", b"<message>OK</message>"))
+
+    def test_empty(self):
+
+        r = self.test_client.get("/empty", headers={"Accept": "text/plain"})
+        self.assertEqual(r.status_code, HTTPStatus.NOT_FOUND)
+        self.assertEqual(r.content_type, "text/plain; charset=utf-8")
+        self.assertEqual(r.headers["Vary"], "Accept")
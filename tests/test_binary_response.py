@@ -0,0 +1,117 @@
+from flask import Flask
+from respond import Responder, MsgpackResponse, CBORResponse
+from respond.binary_encoders import MsgpackEncoder, PureMsgpackEncoder, CBOREncoder, PureCBOREncoder
+
+from datetime import datetime, date, timezone
+from http import HTTPStatus
+import unittest
+import decimal
+import uuid
+
+
+PAYLOAD: dict = {
+    "none": None, "bools": [True, False], "floats": [1.5, -0.0, 1e300],
+    "ints": [0, 31, 127, 128, 255, 256, 65535, 65536, 2 ** 32, 2 ** 64 - 1, -1, -32, -33, -129, -32769, -2 ** 63],
+    "str": "é" * 40, "long_str": "x" * 70000, "bytes": b"\x00" * 300, "list": list(range(20)),
+    "map": {f"k{i}": i for i in range(20)}, "tuple": (1, 2),
+}
+
+
+def create_app() -> Flask:
+
+    app = Flask(__name__)
+
+    @app.route("/msgpack")
+    def msgpack_ok():
+        return Responder.msgpack.ok({"id": 1, "tags": ["a", "b"]}, headers={"X-Custom": "OK"})
+
+    @app.route("/cbor")
+    def cbor_created():
+        return Responder.cbor.created([1, 2, 3])
+
+    @app.route("/empty")
+    def empty():
+        return Responder.msgpack.not_found()
+
+    return app
+
+
+class TestPureEncoders(unittest.TestCase):
+
+    def test_msgpack(self):
+
+        encoder = PureMsgpackEncoder()
+        self.assertEqual(encoder.dumps({"a": [1, -1, None, True]}), b"\x81\xa1a\x94\x01\xff\xc0\xc3")
+        self.assertEqual(encoder.dumps(1.5), b"\xcb\x3f\xf8\x00\x00\x00\x00\x00\x00")
+        self.assertEqual(encoder.dumps(b"ab"), b"\xc4\x02ab")
+        self.assertEqual(encoder.dumps(decimal.Decimal("1.5")), b"\xa31.5")
+        with self.assertRaises(OverflowError):
+            encoder.dumps(2 ** 64)
+
+    def test_cbor(self):
+
+        encoder = PureCBOREncoder()
+        self.assertEqual(encoder.dumps({"a": [1, -1, None, True]}), b"\xa1\x61a\x84\x01\x20\xf6\xf5")
+        self.assertEqual(encoder.dumps(2 ** 64), b"\xc2\x49\x01" + b"\x00" * 8)
+        self.assertEqual(encoder.dumps(decimal.Decimal("1.25")), b"\xc4\x82\x21\x18\x7d")
+        self.assertEqual(encoder.dumps(datetime(2020, 1, 2, 3, 4, 5)), b"\xc0\x742020-01-02T03:04:05Z")
+        self.assertEqual(encoder.dumps({1}), b"\xd9\x01\x02\x81\x01")
+
+    def test_depth_limit(self):
+
+        nested: list = []
+        for _ in range(1000):
+            nested = [nested]
+        for encoder in (PureMsgpackEncoder(), PureCBOREncoder()):
+            with self.assertRaises(ValueError):
+                encoder.dumps(nested)
+
+    @unittest.skipUnless(MsgpackEncoder.available, "msgpack is not installed")
+    def test_msgpack_matches_compiled(self):
+
+        payload = dict(PAYLOAD, decimal=decimal.Decimal("1.5"), date=datetime(2020, 1, 2))
+        self.assertEqual(PureMsgpackEncoder().dumps(payload), MsgpackEncoder().dumps(payload))
+
+    @unittest.skipUnless(CBOREncoder.available, "cbor2 is not installed")
+    def test_cbor_matches_compiled(self):
+
+        payload = dict(
+            PAYLOAD, big=[2 ** 70, -2 ** 70], nan=float("nan"), decimal=decimal.Decimal("-0.001"),
+            uuid=uuid.UUID(int=1), day=date(2020, 1, 2), naive=datetime(2020, 1, 2),
+            aware=datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+            set={3, 1, 2}, frozenset=frozenset(("b", "a")), empty_set=set(), nested_set=[{(1, 2)}],
+        )
+        self.assertEqual(PureCBOREncoder().dumps(payload), CBOREncoder().dumps(payload))
+
+
+class TestBinaryResponse(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_client = create_app().test_client()
+
+    def test_msgpack(self):
+
+        r = self.test_client.get("/msgpack")
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(r.content_type, "application/msgpack")
+        self.assertEqual(r.headers["X-Custom"], "OK")
+        self.assertEqual(r.data, PureMsgpackEncoder().dumps({"id": 1, "tags": ["a", "b"]}))
+
+    def test_cbor(self):
+
+        r = self.test_client.get("/cbor")
+        self.assertEqual(r.status_code, HTTPStatus.CREATED)
+        self.assertEqual(r.content_type, "application/cbor")
+        self.assertEqual(r.data, b"\x83\x01\x02\x03")
+
+    def test_empty(self):
+
+        r = self.test_client.get("/empty")
+        self.assertEqual(r.status_code, HTTPStatus.NOT_FOUND)
+        self.assertEqual(r.data, b"\xc0")
+
+    def test_with_encoder(self):
+
+        response_class = CBORResponse.with_encoder(PureCBOREncoder())
+        self.assertIsInstance(response_class.encoder, PureCBOREncoder)
+        self.assertIsNot(MsgpackResponse.encoder, response_class.encoder)
@@ -0,0 +1,113 @@
+from flask import Flask
+from respond import Responder, JSONResponse, XMLResponse, MsgpackResponse, BodyCache
+from respond.wsgi import WSGIResponder
+from respond.abs_http_response import HTTPResponse
+
+from unittest import mock
+import unittest
+import json
+import time
+
+
+class CountingEncoder(object):
+
+    available = True
+
+    def __init__(self):
+        self.calls = 0
+
+    def dumps(self, obj) -> bytes:
+        self.calls += 1
+        return json.dumps(obj).encode()
+
+
+class TestBodyCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+
+        cache = BodyCache(maxsize=2)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+        self.assertEqual(cache.get("a"), b"1")  # "b" is now the least recently used
+        cache.set("c", b"3")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), b"1")
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 1, "evictions": 1, "coalesced": 0, "size": 2, "bytes": 2})
+
+    def test_byte_limit(self):
+
+        cache = BodyCache(max_bytes=10)
+        cache.set("a", b"x" * 6)
+        cache.set("b", b"x" * 6)
+        self.assertEqual(len(cache), 1)
+        cache.set("c", b"x" * 11)
+        self.assertIsNone(cache.get("c"))
+        self.assertEqual(cache.stats()["bytes"], 6)
+
+    def test_ttl(self):
+
+        cache = BodyCache(ttl=10)
+        cache.set("a", b"1")
+        self.assertEqual(cache.get("a"), b"1")
+        with mock.patch("respond.body_cache.time.monotonic", return_value=time.monotonic() + 11):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_namespaces_and_invalidation(self):
+
+        cache = BodyCache()
+        cache.set("a", b"json", JSONResponse)
+        cache.set("a", b"xml", XMLResponse)
+        cache.set("b", b"other", JSONResponse)
+        self.assertEqual(cache.get("a", XMLResponse), b"xml")
+        self.assertEqual(cache.invalidate("a"), 2)
+        self.assertIsNone(cache.get("a", JSONResponse))
+        self.assertEqual(cache.get("b", JSONResponse), b"other")
+        cache.clear()
+        self.assertEqual(cache.stats()["size"], 0)
+
+
+class TestCachedResponses(unittest.TestCase):
+
+    def setUp(self):
+        self.encoder = CountingEncoder()
+        self.json = type("JSONResponse", (JSONResponse,), {"encoder": self.encoder, "body_cache": BodyCache()})
+        self.app = Flask(__name__)
+
+    def test_skips_encoding(self):
+
+        with self.app.test_request_context():
+            first = self.json.ok({"big": list(range(10))}, cache_key="big")
+            second = self.json.ok({"ignored": True}, cache_key="big")
+            uncached = self.json.ok({"big": 1})
+        self.assertEqual(self.encoder.calls, 2)
+        self.assertEqual(first.get_data(), second.get_data())
+        self.assertEqual(second.content_type, "application/json")
+        self.assertEqual(uncached.get_json(), {"big": 1})
+        self.assertEqual(self.json.body_cache.stats()["hits"], 1)
+
+        self.json.body_cache.invalidate("big")
+        with self.app.test_request_context():
+            self.assertEqual(self.json.ok({"fresh": True}, cache_key="big").get_json(), {"fresh": True})
+
+    def test_jsonify_and_other_classes(self):
+
+        cache = BodyCache()
+        with mock.patch.object(HTTPResponse, "body_cache", cache), self.app.test_request_context():
+            self.assertEqual(Responder.json.ok([1, 2], cache_key="k").get_json(), [1, 2])
+            self.assertEqual(Responder.json.ok(None, cache_key="k").get_json(), [1, 2])
+            self.assertIn(b"<item>1</item>", Responder.xml.ok([1, 2], cache_key="k").get_data())
+            MsgpackResponse.ok([1, 2], cache_key="k")
+        self.assertEqual(cache.stats()["size"], 3)
+
+    def test_raw_responses(self):
+
+        first = WSGIResponder.json.ok({"a": 1}, cache_key="raw")
+        second = WSGIResponder.json.ok({"b": 2}, cache_key="raw")
+        self.assertEqual(json.loads(second.get_data()), {"a": 1})
+        self.assertIs(first.body, second.body)
+        self.assertEqual(JSONResponse.body_cache.invalidate("raw"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
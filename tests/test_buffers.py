@@ -0,0 +1,114 @@
+from flask import Flask
+from respond import Responder
+from respond.asgi import AsyncResponder
+from respond.buffers import as_buffer, buffer_length, BufferBody
+from respond.wsgi import WSGIResponder
+
+from werkzeug.test import create_environ
+from http import HTTPStatus
+import unittest
+import asyncio
+import array
+
+
+def send(response) -> list:
+    """ Returns the chunks a WSGI server would send, checking they are bytes as PEP 3333 requires """
+    chunks = list(response(create_environ("/"), lambda status, headers, exc_info=None: None))
+    for chunk in chunks:
+        assert type(chunk) is bytes, type(chunk)
+    return chunks
+
+
+class TestBuffers(unittest.TestCase):
+
+    def test_as_buffer(self):
+
+        data = b"abc"
+        self.assertIs(as_buffer(data), data)
+        self.assertEqual(as_buffer("é"), "é".encode("utf-8"))
+        self.assertIsNone(as_buffer(["a"]))
+        self.assertIsNone(as_buffer(None))
+
+        source = bytearray(b"abc")
+        view = as_buffer(source)
+        self.assertIsInstance(view, memoryview)
+        source[0] = ord("x")  # A view, not a copy
+        self.assertEqual(bytes(view), b"xbc")
+
+        numbers = array.array("i", [1, 2, 3])
+        self.assertEqual(buffer_length(as_buffer(numbers)), numbers.itemsize * 3)
+        self.assertEqual(buffer_length(memoryview(numbers)), numbers.itemsize * 3)
+        self.assertEqual(bytes(as_buffer(memoryview(b"abcdef")[::2])), b"ace")
+
+    def test_buffer_body(self):
+
+        body = BufferBody(bytearray(b"x" * 10), chunk_size=4)
+        self.assertEqual(len(body), 3)
+        self.assertEqual(list(body), [b"xxxx", b"xxxx", b"xx"])
+
+
+class TestBufferResponses(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+
+    def test_flask_responses(self):
+
+        numbers = array.array("i", [1, 2, 3])
+        with self.app.test_request_context():
+            for response_class in (Responder.text, Responder.xml):
+                for data, expected in ((b"<a/>", b"<a/>"), (bytearray(b"<a/>"), b"<a/>"),
+                                       (memoryview(b"<a/>"), b"<a/>"), (numbers, numbers.tobytes())):
+                    response = response_class.created(data, headers={"X-Custom": "OK"})
+                    self.assertEqual(response.status_code, HTTPStatus.CREATED)
+                    self.assertEqual(response.headers["Content-Length"], str(len(expected)))
+                    self.assertEqual(response.headers["Content-Type"], response_class.content_type)
+                    self.assertEqual(response.headers["X-Custom"], "OK")
+                    self.assertFalse(response.is_streamed)
+                    self.assertEqual(b"".join(send(response)), expected)
+
+    def test_bytes_are_not_copied(self):
+
+        data = b"x" * 100
+        with self.app.test_request_context():
+            self.assertIs(send(Responder.text.ok(data))[0], data)
+        self.assertIs(send(WSGIResponder.text.ok(data))[0], data)
+
+    def test_conditional_and_compressed(self):
+
+        with self.app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+            response = Responder.text.ok(memoryview(b"x" * 4096), etag=True, compress=True)
+        self.assertEqual(response.headers["Content-Encoding"], "gzip")
+        self.assertIsNotNone(response.get_etag()[0])
+
+    def test_raw_responses(self):
+
+        numbers = array.array("i", range(100))
+        response = WSGIResponder.text.ok(memoryview(numbers))
+        self.assertIn(("Content-Length", str(numbers.itemsize * 100)), response.headers)
+        self.assertEqual(b"".join(send(response)), numbers.tobytes())
+
+    def test_asgi_responses(self):
+
+        async def call():
+            messages = []
+
+            async def send_message(message):
+                messages.append(message)
+
+            response = await AsyncResponder.text.ok(bytearray(b"abc"))
+            await response({"type": "http", "method": "GET"}, None, send_message)
+            return response, messages
+
+        loop = asyncio.new_event_loop()
+        try:
+            response, messages = loop.run_until_complete(call())
+        finally:
+            loop.close()
+        self.assertIn((b"content-length", b"3"), response.headers)
+        self.assertEqual(b"".join(m["body"] for m in messages[1:]), b"abc")
+        self.assertTrue(all(type(m["body"]) is bytes for m in messages[1:]))
+
+
+if __name__ == "__main__":
+    unittest.main()
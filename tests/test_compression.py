@@ -0,0 +1,130 @@
+from flask import Flask
+from respond import Responder
+from respond.compression import Compression, ZSTD_AVAILABLE
+
+from http import HTTPStatus
+import unittest
+import gzip
+import zlib
+import json
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+LARGE_TEXT: str = "respond " * 200
+LARGE_XML: str = "<items>" + "<item>respond</item>" * 100 + "</items>"
+
+
+def create_app() -> Flask:
+
+    app = Flask(__name__)
+
+    @app.route("/text")
+    def text():
+        return Responder.text.ok(LARGE_TEXT, compress=True)
+
+    @app.route("/small")
+    def small():
+        return Responder.text.ok("small", compress=True)
+
+    @app.route("/xml")
+    def xml():
+        return Responder.xml.ok(LARGE_XML)
+
+    @app.route("/json")
+    def json_():
+        return Responder.json.ok({"data": LARGE_TEXT}, compress=Compression(levels={"gzip": 9}))
+
+    @app.route("/stream")
+    def stream():
+        return Responder.json.ok(({"id": i} for i in range(1000)), chunk_size=256, compress=True)
+
+    @app.route("/off")
+    def off():
+        return Responder.text.ok(LARGE_TEXT, compress=False)
+
+    return app
+
+
+class TestCompression(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = create_app()
+        self.test_client = self.app.test_client()
+
+    def test_gzip(self):
+
+        r = self.test_client.get("/text", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(r.headers["Content-Encoding"], "gzip")
+        self.assertEqual(r.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(int(r.headers["Content-Length"]), len(r.data))
+        self.assertEqual(gzip.decompress(r.data).decode(), LARGE_TEXT)
+
+    def test_deflate(self):
+
+        r = self.test_client.get("/json", headers={"Accept-Encoding": "deflate, gzip;q=0.5"})
+        self.assertEqual(r.headers["Content-Encoding"], "deflate")
+        self.assertEqual(json.loads(zlib.decompress(r.data)), {"data": LARGE_TEXT})
+
+    @unittest.skipUnless(ZSTD_AVAILABLE and zstandard, "zstandard is not installed")
+    def test_zstd(self):
+
+        r = self.test_client.get("/text", headers={"Accept-Encoding": "gzip, zstd"})
+        self.assertEqual(r.headers["Content-Encoding"], "zstd")
+        self.assertEqual(zstandard.ZstdDecompressor().decompress(r.data).decode(), LARGE_TEXT)
+
+    def test_not_accepted(self):
+
+        r = self.test_client.get("/text", headers={"Accept-Encoding": "br"})
+        self.assertNotIn("Content-Encoding", r.headers)
+        self.assertEqual(r.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(r.data.decode(), LARGE_TEXT)
+
+    def test_below_min_size(self):
+
+        r = self.test_client.get("/small", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", r.headers)
+        self.assertEqual(r.data, b"small")
+
+    def test_disabled_by_default(self):
+
+        r = self.test_client.get("/xml", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", r.headers)
+        self.assertNotIn("Vary", r.headers)
+
+    def test_app_config(self):
+
+        self.app.config["RESPOND_COMPRESSION"] = Compression(codecs=("deflate",))
+        r = self.test_client.get("/xml", headers={"Accept-Encoding": "gzip, deflate"})
+        self.assertEqual(r.headers["Content-Encoding"], "deflate")
+        self.assertEqual(zlib.decompress(r.data).decode(), LARGE_XML)
+
+        r = self.test_client.get("/off", headers={"Accept-Encoding": "gzip, deflate"})
+        self.assertNotIn("Content-Encoding", r.headers)
+
+    def test_settings_read_once(self):
+
+        self.test_client.get("/xml", headers={"Accept-Encoding": "gzip"})
+        self.app.config["RESPOND_COMPRESSION"] = Compression(codecs=("gzip",))
+        r = self.test_client.get("/xml", headers={"Accept-Encoding": "gzip"})
+        self.assertNotIn("Content-Encoding", r.headers)
+
+        self.app.extensions["respond"].reload()
+        r = self.test_client.get("/xml", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(r.headers["Content-Encoding"], "gzip")
+
+    def test_streamed(self):
+
+        r = self.test_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(r.headers["Content-Encoding"], "gzip")
+        self.assertNotIn("Content-Length", r.headers)
+        self.assertEqual(json.loads(gzip.decompress(r.data)), [{"id": i} for i in range(1000)])
+
+    def test_unknown_codec(self):
+
+        with self.assertRaises(ValueError):
+            Compression(codecs=("br",))
@@ -0,0 +1,114 @@
+from flask import Flask
+from respond import Responder
+from respond.conditional import make_etag
+
+from datetime import datetime, timezone
+from http import HTTPStatus
+import unittest
+import json
+
+
+LAST_MODIFIED: datetime = datetime(2020, 5, 3, 16, 49, 41, tzinfo=timezone.utc)
+
+
+def create_app(calls: list) -> Flask:
+
+    app = Flask(__name__)
+
+    class Expensive(object):
+
+        def __iter__(self):
+            calls.append(1)
+            return iter([1, 2, 3])
+
+    @app.route("/computed")
+    def computed():
+        return Responder.json.ok([1, 2, 3], etag=True, headers={"Cache-Control": "no-cache"})
+
+    @app.route("/weak")
+    def weak():
+        return Responder.text.ok("weak", etag=True, weak_etag=True)
+
+    @app.route("/version")
+    def version():
+        return Responder.json.ok(Expensive(), etag="v42", stream="ndjson")
+
+    @app.route("/modified")
+    def modified():
+        return Responder.xml.ok("<ok/>", last_modified=LAST_MODIFIED)
+
+    @app.route("/created", methods=["GET", "POST"])
+    def created():
+        return Responder.json.created([1], etag="v1")
+
+    return app
+
+
+class TestConditionalResponses(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.calls = []
+        self.test_client = create_app(self.calls).test_client()
+
+    def test_computed_etag(self):
+
+        r = self.test_client.get("/computed")
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        etag = r.headers["ETag"]
+        self.assertEqual(etag, f'"{make_etag(r.data)}"')
+
+        r = self.test_client.get("/computed", headers={"If-None-Match": etag})
+        self.assertEqual(r.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(r.data, b"")
+        self.assertEqual(r.headers["ETag"], etag)
+        self.assertEqual(r.headers["Cache-Control"], "no-cache")
+
+        r = self.test_client.get("/computed", headers={"If-None-Match": '"stale"'})
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(json.loads(r.data), [1, 2, 3])
+
+    def test_weak_etag(self):
+
+        r = self.test_client.get("/weak")
+        self.assertTrue(r.headers["ETag"].startswith('W/"'))
+
+        r = self.test_client.get("/weak", headers={"If-None-Match": r.headers["ETag"]})
+        self.assertEqual(r.status_code, HTTPStatus.NOT_MODIFIED)
+
+    def test_version_skips_serialization(self):
+
+        r = self.test_client.get("/version", headers={"If-None-Match": '"v42"'})
+        self.assertEqual(r.status_code, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(self.calls, [])
+
+        r = self.test_client.get("/version", headers={"If-None-Match": '"v41"'})
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(r.headers["ETag"], '"v42"')
+        self.assertEqual(self.calls, [1])
+
+    def test_if_modified_since(self):
+
+        r = self.test_client.get("/modified")
+        self.assertEqual(r.headers["Last-Modified"], "Sun, 03 May 2020 16:49:41 GMT")
+
+        r = self.test_client.get("/modified", headers={"If-Modified-Since": "Sun, 03 May 2020 16:49:41 GMT"})
+        self.assertEqual(r.status_code, HTTPStatus.NOT_MODIFIED)
+
+        r = self.test_client.get("/modified", headers={"If-Modified-Since": "Sat, 02 May 2020 16:49:41 GMT"})
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+
+    def test_only_ok_get_responses_are_conditional(self):
+
+        r = self.test_client.get("/created", headers={"If-None-Match": '"v1"'})
+        self.assertEqual(r.status_code, HTTPStatus.CREATED)
+        self.assertEqual(r.headers["ETag"], '"v1"')
+
+        r = self.test_client.post("/created", headers={"If-None-Match": '"v1"'})
+        self.assertEqual(r.status_code, HTTPStatus.CREATED)
+
+    def test_compressed_etag_is_weak(self):
+
+        with self.test_client.application.test_request_context(headers={"Accept-Encoding": "gzip"}):
+            r = Responder.text.ok("x" * 1000, etag="abc", compress=True)
+        self.assertEqual(r.headers["Content-Encoding"], "gzip")
+        self.assertEqual(r.headers["ETag"], 'W/"abc"')
@@ -0,0 +1,160 @@
+from flask import Flask, Response
+from respond import Responder, JSONResponse, StdlibJSONEncoder, OrjsonEncoder, RawJSON, fastest_encoder
+from respond.encoders import JSONEncoder
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from http import HTTPStatus
+from unittest import mock
+import unittest
+import json
+
+
+class RecordingEncoder(StdlibJSONEncoder):
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def dumps(self, obj):
+        self.calls += 1
+        return super().dumps(obj)
+
+
+class UnavailableEncoder(JSONEncoder):
+
+    available = False
+
+    def dumps(self, obj):
+        raise AssertionError("unavailable encoders must not be used")
+
+
+class TestJSONEncoders(unittest.TestCase):
+
+    def test_stdlib_encoder_matches_jsonify_types(self):
+
+        encoder = StdlibJSONEncoder()
+        data = {"when": datetime(2020, 5, 3, 16, 49, 41, tzinfo=timezone.utc), "price": Decimal("1.10")}
+        self.assertEqual(
+            json.loads(encoder.dumps(data)), {"when": "Sun, 03 May 2020 16:49:41 GMT", "price": "1.10"}
+        )
+
+    def test_sort_keys(self):
+
+        self.assertEqual(StdlibJSONEncoder(sort_keys=True).dumps({"b": 1, "a": 2}), b'{"a":2,"b":1}')
+
+    @unittest.skipUnless(OrjsonEncoder.available, "orjson is not installed")
+    def test_orjson_encoder(self):
+
+        encoder = OrjsonEncoder()
+        data = {"when": datetime(2020, 5, 3, 16, 49, 41, tzinfo=timezone.utc), "items": [1, 2, 3]}
+        self.assertEqual(json.loads(encoder.dumps(data)), json.loads(StdlibJSONEncoder().dumps(data)))
+
+    def test_fastest_encoder(self):
+
+        encoder = fastest_encoder()
+        self.assertTrue(encoder is None or encoder.available)
+
+
+class TestJSONResponseEncoder(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+
+    def test_with_encoder(self):
+
+        encoder = RecordingEncoder()
+        response_class = JSONResponse.with_encoder(encoder)
+        self.assertTrue(issubclass(response_class, JSONResponse))
+        self.assertIsNone(JSONResponse.encoder)
+
+        with self.app.app_context():
+            r = response_class.created({"data": [1, 2, 3]}, headers={"X-Custom": "OK"})
+
+        self.assertEqual(encoder.calls, 1)
+        self.assertEqual(r.status_code, HTTPStatus.CREATED)
+        self.assertEqual(r.content_type, "application/json")
+        self.assertEqual(r.headers["X-Custom"], "OK")
+        self.assertEqual(json.loads(r.get_data()), {"data": [1, 2, 3]})
+
+    def test_app_config_encoder(self):
+
+        encoder = RecordingEncoder()
+        self.app.config["RESPOND_JSON_ENCODER"] = encoder
+
+        with self.app.app_context():
+            r = Responder.json.ok()
+
+        self.assertEqual(encoder.calls, 1)
+        self.assertEqual(json.loads(r.get_data()), "")
+
+    def test_unavailable_encoder_falls_back_to_jsonify(self):
+
+        self.app.config["RESPOND_JSON_ENCODER"] = UnavailableEncoder()
+
+        with self.app.app_context():
+            r = Responder.json.ok([1, 2, 3])
+
+        self.assertEqual(json.loads(r.get_data()), [1, 2, 3])
+
+
+class TestRawJSON(unittest.TestCase):
+
+    DATA = {"cached": RawJSON('{"id": 1, "tags": ["a"]}'), "rows": [RawJSON(b"[1,2]"), RawJSON("null")], "n": 1}
+    EXPECTED = b'{"cached":{"id": 1, "tags": ["a"]},"rows":[[1,2],null],"n":1}'
+
+    def test_stdlib_encoder(self):
+
+        self.assertEqual(StdlibJSONEncoder().dumps(self.DATA), self.EXPECTED)
+        self.assertEqual(StdlibJSONEncoder().dumps(RawJSON("[1]")), b"[1]")
+
+    def test_placeholder_text_is_not_replaced(self):
+
+        encoder = StdlibJSONEncoder()
+        self.assertEqual(encoder.dumps(["0:0", RawJSON("1")]), b'["0:0",1]')
+
+    @unittest.skipUnless(OrjsonEncoder.available, "orjson is not installed")
+    def test_orjson_encoder(self):
+
+        self.assertEqual(OrjsonEncoder().dumps(self.DATA), self.EXPECTED)
+
+    def test_responses(self):
+
+        app = Flask(__name__)
+        with app.app_context():
+            for response_class in (JSONResponse, JSONResponse.with_encoder(StdlibJSONEncoder())):
+                r = response_class.ok(self.DATA)
+                self.assertEqual(json.loads(r.get_data()), json.loads(self.EXPECTED))
+                self.assertEqual(r.mimetype, "application/json")
+                self.assertEqual(json.loads(response_class.ok(iter([RawJSON("{}")])).get_data()), [{}])
+            self.assertEqual(JSONResponse.with_encoder(StdlibJSONEncoder()).ok(self.DATA).get_data(), self.EXPECTED)
+
+    def test_responses_keep_the_app_json_settings(self):
+
+        app = Flask(__name__)
+        with app.app_context():
+            sorted_keys = b'{"cached":{"id": 1, "tags": ["a"]},"n":1,"rows":[[1,2],null]}\n'
+            self.assertEqual(JSONResponse.ok(self.DATA).get_data(), sorted_keys)
+            app.json.sort_keys = False
+            self.assertEqual(JSONResponse.ok(self.DATA).get_data(), self.EXPECTED + b"\n")
+            app.json.compact = False
+            self.assertEqual(json.loads(JSONResponse.ok(self.DATA).get_data()), json.loads(self.EXPECTED))
+            self.assertIn(b'\n  "cached": {"id": 1', JSONResponse.ok(self.DATA).get_data())
+
+    def test_apps_without_a_json_provider(self):
+
+        def jsonify(data):
+            # As Flask before 2.2, which has no app.json, encodes
+            return Response(json.dumps(data) + "\n", mimetype="application/json")
+
+        app = Flask(__name__)
+        del app.json
+        with app.app_context(), mock.patch("flask.jsonify", jsonify):
+            self.assertEqual(JSONResponse.ok({"n": 1}).get_data(), b'{"n": 1}\n')
+            self.assertEqual(JSONResponse.ok(self.DATA).get_data(), self.EXPECTED)
+
+    def test_unencodable_data_still_raises(self):
+
+        app = Flask(__name__)
+        with app.app_context(), self.assertRaises(TypeError):
+            Responder.json.ok({"raw": RawJSON("1"), "bad": object()})
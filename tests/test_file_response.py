@@ -0,0 +1,139 @@
+from flask import Flask
+from respond import Responder
+from respond.file_response import parse_byte_ranges
+
+from http import HTTPStatus
+import unittest
+import tempfile
+import mmap
+import io
+import os
+
+
+CONTENT: bytes = bytes(range(256)) * 40
+
+
+def create_app(path: str) -> Flask:
+
+    app = Flask(__name__)
+
+    @app.route("/path")
+    def from_path():
+        return Responder.file.ok(path, headers={"X-Custom": "OK"})
+
+    @app.route("/download")
+    def download():
+        return Responder.file.ok(path, download_name="data.bin", content_type="application/x-data")
+
+    @app.route("/fileobj")
+    def fileobj():
+        return Responder.file.ok(io.BytesIO(CONTENT))
+
+    @app.route("/mmap")
+    def from_mmap():
+        with open(path, "rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return Responder.file.ok(mm)
+
+    return app
+
+
+class TestParseByteRanges(unittest.TestCase):
+
+    def test_parse(self):
+
+        self.assertEqual(parse_byte_ranges("bytes=0-9", 100), [(0, 10)])
+        self.assertEqual(parse_byte_ranges("bytes=90-", 100), [(90, 100)])
+        self.assertEqual(parse_byte_ranges("bytes=-5", 100), [(95, 100)])
+        self.assertEqual(parse_byte_ranges("bytes=95-200", 100), [(95, 100)])
+        self.assertEqual(parse_byte_ranges("bytes=0-0, 10-19, -1", 100), [(0, 1), (10, 20), (99, 100)])
+        self.assertEqual(parse_byte_ranges("bytes=100-", 100), [])
+        self.assertIsNone(parse_byte_ranges("bytes=9-5", 100))
+        self.assertIsNone(parse_byte_ranges("items=0-5", 100))
+        self.assertIsNone(parse_byte_ranges("bytes=abc", 100))
+
+
+class TestFileResponse(unittest.TestCase):
+
+    def setUp(self) -> None:
+        fd, self.path = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(CONTENT)
+        self.test_client = create_app(self.path).test_client()
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_whole_file(self):
+
+        r = self.test_client.get("/path")
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(r.data, CONTENT)
+        self.assertEqual(r.content_type, "text/plain")
+        self.assertEqual(r.headers["Content-Length"], str(len(CONTENT)))
+        self.assertEqual(r.headers["Accept-Ranges"], "bytes")
+        self.assertEqual(r.headers["X-Custom"], "OK")
+        self.assertIn("ETag", r.headers)
+        self.assertIn("Last-Modified", r.headers)
+        r.close()
+
+    def test_download(self):
+
+        r = self.test_client.get("/download")
+        self.assertEqual(r.content_type, "application/x-data")
+        self.assertEqual(r.headers["Content-Disposition"], "attachment; filename=data.bin")
+        r.close()
+
+    def test_single_range(self):
+
+        for url in ("/path", "/fileobj", "/mmap"):
+            r = self.test_client.get(url, headers={"Range": "bytes=100-199"})
+            self.assertEqual(r.status_code, HTTPStatus.PARTIAL_CONTENT)
+            self.assertEqual(r.headers["Content-Range"], f"bytes 100-199/{len(CONTENT)}")
+            self.assertEqual(r.headers["Content-Length"], "100")
+            self.assertEqual(r.data, CONTENT[100:200])
+            r.close()
+
+    def test_multiple_ranges(self):
+
+        r = self.test_client.get("/path", headers={"Range": "bytes=0-9,-10"})
+        self.assertEqual(r.status_code, HTTPStatus.PARTIAL_CONTENT)
+        self.assertTrue(r.content_type.startswith("multipart/byteranges; boundary="))
+        self.assertEqual(int(r.headers["Content-Length"]), len(r.data))
+        boundary = r.content_type.split("boundary=")[1].encode()
+        parts = r.data.split(b"--" + boundary)[1:-1]
+        self.assertEqual(len(parts), 2)
+        self.assertIn(f"Content-Range: bytes 0-9/{len(CONTENT)}".encode(), parts[0])
+        self.assertTrue(parts[0].endswith(b"\r\n\r\n" + CONTENT[:10] + b"\r\n"))
+        self.assertTrue(parts[1].endswith(b"\r\n\r\n" + CONTENT[-10:] + b"\r\n"))
+        r.close()
+
+    def test_unsatisfiable_range(self):
+
+        r = self.test_client.get("/path", headers={"Range": f"bytes={len(CONTENT)}-"})
+        self.assertEqual(r.status_code, HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+        self.assertEqual(r.headers["Content-Range"], f"bytes */{len(CONTENT)}")
+
+    def test_if_range(self):
+
+        r = self.test_client.get("/path")
+        etag = r.headers["ETag"]
+        r.close()
+
+        r = self.test_client.get("/path", headers={"Range": "bytes=0-9", "If-Range": etag})
+        self.assertEqual(r.status_code, HTTPStatus.PARTIAL_CONTENT)
+        r.close()
+
+        r = self.test_client.get("/path", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(r.data, CONTENT)
+        r.close()
+
+    def test_not_modified(self):
+
+        r = self.test_client.get("/path")
+        etag = r.headers["ETag"]
+        r.close()
+
+        r = self.test_client.get("/path", headers={"If-None-Match": etag})
+        self.assertEqual(r.status_code, HTTPStatus.NOT_MODIFIED)
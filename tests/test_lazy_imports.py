@@ -0,0 +1,34 @@
+import respond
+
+import subprocess
+import unittest
+import sys
+
+
+def imports_flask(statement: str) -> bool:
+    """ Runs `statement` in a fresh interpreter and returns whether Flask was imported """
+    script: str = f"import sys\n{statement}\nprint('flask' in sys.modules)"
+    return subprocess.run(
+        [sys.executable, "-c", script], stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+        check=True
+    ).stdout.strip() == "True"
+
+
+class TestLazyImports(unittest.TestCase):
+
+    def test_flask_not_imported(self):
+
+        self.assertFalse(imports_flask("import respond"))
+        self.assertFalse(imports_flask("from respond import Responder, MetricsCollector"))
+        self.assertFalse(imports_flask("from respond import WSGIResponder; WSGIResponder.json.ok([1])"))
+        self.assertTrue(imports_flask("from flask import Flask\nfrom respond import Responder\n"
+                                      "with Flask(__name__).app_context(): Responder.json.ok([1])"))
+
+    def test_attributes(self):
+
+        from respond.json_response import JSONResponse
+        self.assertIs(respond.JSONResponse, JSONResponse)
+        self.assertIn("Responder", dir(respond))
+        self.assertEqual(set(respond.__all__) - set(dir(respond)), set())
+        with self.assertRaises(AttributeError):
+            respond.NoSuchResponse
@@ -0,0 +1,87 @@
+from flask import Flask
+from respond import Responder
+from respond.asgi import AsyncResponder
+from respond.metrics import MetricsCollector, Histogram, set_collector, get_collector
+
+import unittest
+import asyncio
+
+
+class TestHistogram(unittest.TestCase):
+
+    def test_observe(self):
+
+        histogram = Histogram((1, 10))
+        for value in (0, 1, 5, 100):
+            histogram.observe(value)
+        self.assertEqual(histogram.snapshot(), {"bounds": [1, 10], "counts": [2, 1, 1], "sum": 106, "count": 4})
+
+
+class TestMetricsCollector(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.collector = MetricsCollector()
+        set_collector(self.collector)
+
+    def tearDown(self) -> None:
+        set_collector(None)
+
+    def test_records_responses(self):
+
+        with self.app.test_request_context("/", headers={"If-None-Match": '"v1"'}):
+            Responder.json.ok([1, 2, 3])
+            Responder.json.ok([1, 2, 3])
+            Responder.json.not_found()
+            Responder.text.ok("Test OK", etag="v1")
+
+        snapshot = self.collector.snapshot()
+        self.assertEqual(snapshot["responses"], {"JSONResponse": {200: 2, 404: 1}, "TextResponse": {304: 1}})
+        self.assertEqual(snapshot["serialization_seconds"]["JSONResponse"]["count"], 3)
+        sizes = snapshot["body_bytes"]["JSONResponse"]
+        self.assertEqual(sizes["count"], 3)
+        self.assertEqual(sum(sizes["counts"]), 3)
+
+    def test_streamed_bodies_are_counted_without_size(self):
+
+        with self.app.test_request_context("/"):
+            Responder.json.ok(iter([1, 2, 3]))
+
+        snapshot = self.collector.snapshot()
+        self.assertEqual(snapshot["responses"], {"JSONResponse": {200: 1}})
+        self.assertEqual(snapshot["body_bytes"]["JSONResponse"]["count"], 0)
+
+    def test_async_responses(self):
+
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(AsyncResponder.text.created("Test OK"))
+        finally:
+            loop.close()
+
+        snapshot = self.collector.snapshot()
+        self.assertEqual(snapshot["responses"], {"AsyncTextResponse": {201: 1}})
+        self.assertEqual(snapshot["body_bytes"]["AsyncTextResponse"]["sum"], 7)
+
+    def test_prometheus(self):
+
+        with self.app.test_request_context("/"):
+            Responder.xml.ok("<ok/>")
+
+        text = self.collector.to_prometheus()
+        self.assertIn('respond_responses_total{class="XMLResponse",status="200"} 1', text)
+        self.assertIn('respond_body_bytes_bucket{class="XMLResponse",le="64"} 1', text)
+        self.assertIn('respond_body_bytes_bucket{class="XMLResponse",le="+Inf"} 1', text)
+        self.assertIn('respond_body_bytes_sum{class="XMLResponse"} 5', text)
+
+    def test_reset_and_unregister(self):
+
+        with self.app.test_request_context("/"):
+            Responder.text.ok()
+            self.collector.reset()
+            self.assertEqual(self.collector.snapshot()["responses"], {})
+
+            set_collector(None)
+            self.assertIsNone(get_collector())
+            Responder.text.ok()
+        self.assertEqual(self.collector.snapshot()["responses"], {})
@@ -0,0 +1,161 @@
+from flask import Flask
+from respond import Responder, Page
+from respond.asgi import AsyncResponder
+from respond.pagination import iter_page
+from respond.wsgi import WSGIResponder
+
+from http import HTTPStatus
+import unittest
+import asyncio
+import sqlite3
+import json
+
+
+def dumps(data) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class FakeCursor(object):
+    """ A DB-API cursor over `rows`, recording each fetchmany call """
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.fetched = []
+        self.closed = False
+
+    def fetchmany(self, size):
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        self.fetched.append(len(batch))
+        return batch
+
+    def close(self):
+        self.closed = True
+
+
+class TestPage(unittest.TestCase):
+
+    def page(self, page) -> dict:
+        return json.loads(b"".join(iter_page(page, dumps)))
+
+    def test_envelope(self):
+
+        self.assertEqual(self.page(Page([])), {"items": [], "next": None})
+        self.assertEqual(self.page(Page(iter(range(3)))), {"items": [0, 1, 2], "next": None})
+        self.assertEqual(
+            self.page(Page([{"id": 1}], next_token=lambda row: row["id"], total=10, after=None)),
+            {"total": 10, "after": None, "items": [{"id": 1}], "next": 1}
+        )
+        self.assertEqual(self.page(Page([1, 2], convert=lambda row: {"n": row})),
+                         {"items": [{"n": 1}, {"n": 2}], "next": None})
+
+    def test_limit_and_next(self):
+
+        token = lambda row: f"after-{row}"  # noqa: E731
+        self.assertEqual(self.page(Page(range(10), token, limit=3)), {"items": [0, 1, 2], "next": "after-2"})
+        self.assertEqual(self.page(Page(range(3), token, limit=3)), {"items": [0, 1, 2], "next": None})
+        self.assertEqual(self.page(Page(range(2), token, limit=3)), {"items": [0, 1], "next": None})
+        self.assertEqual(self.page(Page([], token, limit=3)), {"items": [], "next": None})
+        self.assertEqual(self.page(Page(range(3), token)), {"items": [0, 1, 2], "next": "after-2"})
+
+    def test_reads_one_row_past_the_limit(self):
+
+        rows = iter(range(100))
+        self.page(Page(rows, limit=5))
+        self.assertEqual(next(rows), 6)
+
+    def test_cursor_is_fetched_in_batches(self):
+
+        cursor = FakeCursor(range(25))
+        self.assertEqual(self.page(Page(cursor, batch_size=10))["items"], list(range(25)))
+        self.assertEqual(cursor.fetched, [10, 10, 5, 0])
+        self.assertTrue(cursor.closed)
+
+        cursor = FakeCursor(range(25))
+        self.assertEqual(self.page(Page(cursor, limit=4, batch_size=10, close=False))["items"], list(range(4)))
+        self.assertEqual(cursor.fetched, [5])
+        self.assertFalse(cursor.closed)
+
+    def test_rows_are_read_as_the_body_is_sent(self):
+
+        cursor = FakeCursor(range(10))
+        body = iter_page(Page(cursor, batch_size=2), dumps, chunk_size=1)
+        self.assertEqual(cursor.fetched, [])
+        next(body)
+        next(body)
+        self.assertEqual(cursor.fetched, [2])
+
+    def test_cursor_is_closed_when_the_client_goes_away(self):
+
+        cursor = FakeCursor(range(10))
+        body = iter_page(Page(cursor, batch_size=2), dumps, chunk_size=1)
+        next(body)
+        body.close()
+        self.assertTrue(cursor.closed)
+
+
+class TestPageResponses(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self.connection.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        self.connection.executemany("INSERT INTO users VALUES (?, ?)", [(i, f"user-{i}") for i in range(1, 8)])
+
+    def tearDown(self):
+        self.connection.close()
+
+    def users(self, after: int = 0, limit: int = 3) -> Page:
+        cursor = self.connection.execute("SELECT id, name FROM users WHERE id > ? ORDER BY id", (after,))
+        return Page(cursor, next_token=lambda row: row[0], limit=limit,
+                    convert=lambda row: {"id": row[0], "name": row[1]}, page_size=limit)
+
+    def test_flask_response(self):
+
+        with self.app.test_request_context():
+            response = Responder.json.ok(self.users())
+            self.assertEqual(response.status_code, HTTPStatus.OK)
+            self.assertEqual(response.headers["Content-Type"], Responder.json.content_type)
+            self.assertTrue(response.is_streamed)
+            body = json.loads(response.get_data())
+        self.assertEqual(body["items"], [{"id": 1, "name": "user-1"}, {"id": 2, "name": "user-2"},
+                                         {"id": 3, "name": "user-3"}])
+        self.assertEqual(body["next"], 3)
+
+        with self.app.test_request_context():
+            body = json.loads(Responder.json.ok(self.users(after=body["next"], limit=10)).get_data())
+        self.assertEqual([item["id"] for item in body["items"]], [4, 5, 6, 7])
+        self.assertIsNone(body["next"])
+
+    def test_raw_response(self):
+
+        response = WSGIResponder.json.ok(self.users(after=6))
+        body = json.loads(b"".join(response.body))
+        self.assertEqual(body, {"page_size": 3, "items": [{"id": 7, "name": "user-7"}], "next": None})
+
+    def test_asgi_response(self):
+
+        async def rows():
+            for i in range(5):
+                yield i
+
+        async def call(page):
+            messages = []
+
+            async def send_message(message):
+                messages.append(message)
+
+            response = await AsyncResponder.json.ok(page)
+            await response({"type": "http", "method": "GET"}, None, send_message)
+            return json.loads(b"".join(m["body"] for m in messages[1:]))
+
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(call(Page(rows(), str, limit=2))), {"items": [0, 1], "next": "1"})
+            self.assertEqual(loop.run_until_complete(call(Page(range(2), str, limit=2))),
+                             {"items": [0, 1], "next": None})
+        finally:
+            loop.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+from flask import Flask
+from respond import Responder, ProblemResponse, JSONResponse, StdlibJSONEncoder, RawJSON
+from respond.problem import problem_skeleton
+
+from http import HTTPStatus
+import unittest
+import json
+
+
+class TestProblemResponse(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+
+    def problem(self, response) -> dict:
+        self.assertEqual(response.headers["Content-Type"], "application/problem+json")
+        self.assertEqual(response.headers["Content-Length"], str(len(response.get_data())))
+        return json.loads(response.get_data())
+
+    def test_skeleton(self):
+
+        self.assertEqual(json.loads(problem_skeleton(404) + b"}"),
+                         {"type": "about:blank", "title": "Not Found", "status": 404})
+        self.assertIs(problem_skeleton(404), problem_skeleton(404))
+
+    def test_error_helpers(self):
+
+        with self.app.test_request_context():
+            for name, status in (("bad_request", 400), ("unauthorized", 401), ("not_found", 404),
+                                 ("too_many_requests", 429), ("internal_server_error", 500),
+                                 ("service_unavailable", 503)):
+                response = getattr(Responder.problem, name)()
+                self.assertEqual(response.status_code, status)
+                self.assertEqual(self.problem(response), {
+                    "type": "about:blank", "title": HTTPStatus(status).phrase, "status": status
+                })
+
+    def test_members_are_spliced(self):
+
+        with self.app.test_request_context():
+            body = self.problem(Responder.problem.not_found("No user with id 1"))
+            self.assertEqual(body["detail"], "No user with id 1")
+            self.assertEqual(body["status"], 404)
+
+            body = self.problem(Responder.problem.unprocessable_entity(
+                {"detail": "Invalid order", "instance": "/orders/1", "errors": [{"field": "quantity"}]}
+            ))
+            self.assertEqual(body, {"type": "about:blank", "title": "Unprocessable Entity", "status": 422,
+                                    "detail": "Invalid order", "instance": "/orders/1",
+                                    "errors": [{"field": "quantity"}]})
+
+            self.assertEqual(self.problem(Responder.problem.conflict({})), {
+                "type": "about:blank", "title": "Conflict", "status": 409
+            })
+            self.assertEqual(self.problem(Responder.problem.conflict({"raw": RawJSON(b"[1,2]")}))["raw"], [1, 2])
+
+    def test_skeleton_members_can_be_replaced(self):
+
+        with self.app.test_request_context():
+            body = self.problem(Responder.problem.forbidden({"type": "https://example.com/out-of-credit",
+                                                             "title": "Out of credit"}))
+        self.assertEqual(body, {"type": "https://example.com/out-of-credit", "title": "Out of credit", "status": 403})
+
+        problems = type("Problems", (ProblemResponse,), {"problem_type": "https://example.com/problems"})
+        with self.app.test_request_context():
+            self.assertEqual(self.problem(problems.gone())["type"], "https://example.com/problems")
+            self.assertEqual(self.problem(problems.gone("Moved away"))["type"], "https://example.com/problems")
+
+    def test_headers_and_encoder(self):
+
+        problems = ProblemResponse.with_encoder(StdlibJSONEncoder())
+        with self.app.test_request_context():
+            response = problems.too_many_requests("Slow down", headers={"Retry-After": "30"})
+            self.assertEqual(response.headers["Retry-After"], "30")
+            self.assertEqual(self.problem(response)["detail"], "Slow down")
+
+    def test_invalid_details(self):
+
+        with self.app.test_request_context():
+            with self.assertRaises(TypeError):
+                Responder.problem.bad_request(["not", "a", "problem"])
+
+    def test_other_statuses_are_json(self):
+
+        with self.app.test_request_context():
+            response = Responder.problem.ok({"id": 1})
+            self.assertEqual(response.headers["Content-Type"], JSONResponse.content_type)
+            self.assertEqual(response.get_json(), {"id": 1})
+            self.assertEqual(Responder.problem.no_content().status_code, HTTPStatus.NO_CONTENT)
+
+
+if __name__ == "__main__":
+    unittest.main()
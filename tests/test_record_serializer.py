@@ -0,0 +1,170 @@
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from respond import JSONResponse, StdlibJSONEncoder, OrjsonEncoder, RawJSON
+from respond.encoders import default
+from respond.record_serializer import RecordSerializer, record_fields, record_serializer
+
+from typing import Optional, List
+from datetime import datetime
+import dataclasses
+import unittest
+import uuid
+
+
+@dataclasses.dataclass
+class Tag:
+    name: str
+
+
+@dataclasses.dataclass
+class User:
+    id: int
+    name: str
+    score: float
+    active: bool
+    email: Optional[str]
+    tags: List[Tag]
+    meta: dict
+    joined: datetime
+
+
+class Point(object):
+    __slots__ = ("x", "y", "_cache")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self._cache = None
+
+
+class Point3D(Point):
+    __slots__ = ("z",)
+
+    def __init__(self, x, y, z):
+        super().__init__(x, y)
+        self.z = z
+
+
+class Money(object):
+
+    def __init__(self, amount):
+        self.amount = amount
+
+
+@dataclasses.dataclass
+class Order:
+    id: int
+    total: Money
+
+
+class MoneyProvider(DefaultJSONProvider):
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, Money):
+            return f"${o.amount}"
+        return DefaultJSONProvider.default(o)
+
+
+class Loose(object):
+
+    def __init__(self):
+        self.x = 1
+
+
+def users(count: int) -> List[User]:
+    return [
+        User(i, f'us"er-{i}é', i * 1.5, i % 2 == 0, None if i % 3 else "a@b", [Tag("x"), Tag("{y}")],
+             {"n": [1, None], "nan": float("nan")}, datetime(2020, 1, 2, 3, 4, 5))
+        for i in range(count)
+    ]
+
+
+class TestRecordSerializer(unittest.TestCase):
+
+    def test_record_fields(self):
+
+        self.assertEqual(record_fields(Tag), ("name",))
+        self.assertEqual(record_fields(Point), ("x", "y"))
+        self.assertEqual(record_fields(Point3D), ("x", "y", "z"))
+        for cls in (Loose, dict, int, uuid.UUID, RawJSON, type(None)):
+            self.assertIsNone(record_fields(cls), cls)
+
+    def test_matches_generic_encoder(self):
+
+        data = users(6)
+        data[1].active = 1  # Values which do not match their annotations are encoded generically
+        data[2].id = True
+        data[3].score = 2
+        expected = StdlibJSONEncoder().dumps(data)
+        self.assertEqual(RecordSerializer().dumps(data), expected)
+        self.assertEqual(RecordSerializer().dumps({"users": data, "total": 6}), StdlibJSONEncoder().dumps(
+            {"users": data, "total": 6}
+        ))
+
+    def test_options(self):
+
+        data = users(2)
+        encoded = RecordSerializer(sort_keys=True, ensure_ascii=False).dumps(data)
+        self.assertEqual(encoded, StdlibJSONEncoder(sort_keys=True).dumps(data).replace(b"\\u00e9", "é".encode()))
+
+    def test_slotted_records(self):
+
+        serializer = RecordSerializer()
+        self.assertEqual(serializer.dumps([Point(1, 2), Point3D(1, 2, 3)]), b'[{"x":1,"y":2},{"x":1,"y":2,"z":3}]')
+        self.assertEqual(serializer.dumps({1: Point(0, 0)}), b'{"1":{"x":0,"y":0}}')
+        self.assertEqual(serializer.dumps([RawJSON("[1]"), Point(0, "{}")]), b'[[1],{"x":0,"y":"{}"}]')
+
+    def test_compiles_once(self):
+
+        serializer = record_serializer()
+        self.assertIs(serializer, record_serializer())
+        self.assertIs(serializer.compile(Tag), serializer.compile(Tag))
+        self.assertIsNone(serializer.compile(Loose))
+        with self.assertRaises(TypeError):
+            serializer.dumps(Loose())
+
+
+class TestJSONResponseRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+
+    def test_jsonify_settings(self):
+
+        data = users(3)
+        with self.app.app_context():
+            body = JSONResponse.ok(data).get_data()
+            generic = type("JSONResponse", (JSONResponse,), {"compile_records": False}).ok(data).get_data()
+        self.assertEqual(body, generic)
+        self.assertEqual(body, StdlibJSONEncoder(sort_keys=True, default=default).dumps(data) + b"\n")
+
+    def test_jsonify_provider(self):
+
+        self.app.json = MoneyProvider(self.app)
+        generic = type("JSONResponse", (JSONResponse,), {"compile_records": False})
+        with self.app.app_context():
+            self.assertEqual(JSONResponse.ok(Order(1, Money(5))).get_data(), b'{"id":1,"total":"$5"}\n')
+            self.app.json.compact = False
+            self.assertEqual(JSONResponse.ok(users(2)).get_data(), generic.ok(users(2)).get_data())
+            self.app.json.compact = None
+            self.app.debug = True
+            self.assertEqual(JSONResponse.ok(users(2)).get_data(), generic.ok(users(2)).get_data())
+
+    def test_encoder_settings(self):
+
+        response_class = JSONResponse.with_encoder(StdlibJSONEncoder())
+        with self.app.app_context():
+            self.assertEqual(response_class.ok(Point(1, 2)).get_data(), b'{"x":1,"y":2}')
+            self.assertEqual(response_class.ok([Tag("a")]).get_json(), [{"name": "a"}])
+
+    @unittest.skipUnless(OrjsonEncoder.available, "orjson is not installed")
+    def test_native_dataclasses(self):
+
+        response_class = JSONResponse.with_encoder(OrjsonEncoder())
+        self.assertIsNone(response_class._record_serializer([Tag("a")], response_class.encoder))
+        self.assertIsNotNone(response_class._record_serializer([Point(1, 2)], response_class.encoder))
+
+
+if __name__ == "__main__":
+    unittest.main()
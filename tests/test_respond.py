@@ -83,6 +83,11 @@ def processing():
     return Responder.text.processing()
 
 
+@http_bp.route("/103")
+def early_hints():
+    return Responder.text.early_hints()
+
+
 @http_bp.route("/200")
 def ok():
     return Responder.text.ok()
@@ -288,6 +293,11 @@ def failed_dependency():
     return Responder.text.failed_dependency()
 
 
+@http_bp.route("/425")
+def too_early():
+    return Responder.text.too_early()
+
+
 @http_bp.route("/426")
 def upgrade_required():
     return Responder.text.upgrade_required()
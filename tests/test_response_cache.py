@@ -0,0 +1,177 @@
+from flask import Flask, make_response
+from respond import Responder, ResponseCache, Compression
+
+from http import HTTPStatus
+from unittest import mock
+import unittest
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.cache = ResponseCache(maxsize=8)
+        self.calls = 0
+
+        @self.app.route("/items", methods=["GET", "HEAD", "POST"])
+        @self.cache.cached
+        def items():
+            self.calls += 1
+            return Responder.json.ok({"calls": self.calls})
+
+        self.client = self.app.test_client()
+
+    def view(self, response):
+        """ Adds a /view route returning `response`, which may be a callable building it """
+        @self.app.route("/view")
+        @self.cache.cached
+        def view():
+            self.calls += 1
+            return response() if callable(response) else response
+
+    def test_repeat_requests_skip_the_view(self):
+
+        first = self.client.get("/items")
+        second = self.client.get("/items")
+        self.assertEqual(first.get_json(), {"calls": 1})
+        self.assertEqual(second.get_json(), {"calls": 1})
+        self.assertEqual(second.status_code, HTTPStatus.OK)
+        self.assertEqual(second.headers["Content-Type"], "application/json")
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+        self.assertEqual(self.client.head("/items").status_code, HTTPStatus.OK)
+        self.assertEqual(self.calls, 1)
+
+    def test_conditional_requests(self):
+
+        self.view(lambda: Responder.json.ok({"calls": self.calls}, etag=True))
+        etag = self.client.get("/view").headers["ETag"]
+        hit = self.client.get("/view", headers={"If-None-Match": etag})
+        self.assertEqual((hit.status_code, hit.get_data()), (HTTPStatus.NOT_MODIFIED, b""))
+        self.assertEqual(hit.headers["ETag"], etag)
+        stale = self.client.get("/view", headers={"If-None-Match": '"other"'})
+        self.assertEqual((stale.status_code, stale.get_json()), (HTTPStatus.OK, {"calls": 1}))
+        self.assertEqual(self.calls, 1)
+
+    def test_key(self):
+
+        self.client.get("/items?page=1")
+        self.assertEqual(self.client.get("/items?page=2").get_json(), {"calls": 2})
+        self.assertEqual(self.client.get("/items?page=1").get_json(), {"calls": 1})
+        self.assertEqual(self.client.post("/items").get_json(), {"calls": 3})
+        self.assertEqual(self.client.post("/items").get_json(), {"calls": 4})
+
+    def test_selected_headers(self):
+
+        self.cache.headers = ("Accept-Language",)
+        self.client.get("/items", headers={"Accept-Language": "en"})
+        self.assertEqual(self.client.get("/items", headers={"Accept-Language": "fr"}).get_json(), {"calls": 2})
+        self.assertEqual(self.client.get("/items", headers={"Accept-Language": "en"}).get_json(), {"calls": 1})
+
+    def test_vary(self):
+
+        self.app.config["RESPOND_COMPRESSION"] = Compression(min_size=1)
+        gzipped = self.client.get("/items", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(gzipped.headers["Content-Encoding"], "gzip")
+        plain = self.client.get("/items", headers={"Accept-Encoding": "identity"})
+        self.assertNotIn("Content-Encoding", plain.headers)
+        self.assertEqual(plain.get_json(), {"calls": 2})
+        again = self.client.get("/items", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(again.headers["Content-Encoding"], "gzip")
+        self.assertEqual(self.calls, 2)
+
+    def test_uncacheable_responses(self):
+
+        for response in (
+            lambda: Responder.json.ok({"calls": self.calls}, headers={"Cache-Control": "private"}),
+            lambda: Responder.json.ok({"calls": self.calls}, headers={"Vary": "*"}),
+            lambda: Responder.json.bad_request(),
+            lambda: Responder.json.ok(iter([self.calls])),
+        ):
+            with self.subTest(response=response):
+                self.setUp()
+                self.view(response)
+                self.client.get("/view")
+                self.client.get("/view")
+                self.assertEqual(self.calls, 2)
+                self.assertEqual(len(self.cache), 0)
+
+        self.setUp()
+
+        def with_cookie():
+            response = make_response(Responder.json.ok())
+            response.set_cookie("session", "1")
+            return response
+
+        self.view(with_cookie)
+        self.client.get("/view")
+        self.client.get("/view")
+        self.assertEqual(self.calls, 2)
+
+    def test_credentialed_requests(self):
+
+        for headers in ({"Authorization": "Bearer a"}, {"Cookie": "session=a"}):
+            with self.subTest(headers=headers):
+                self.setUp()
+                self.client = self.app.test_client(use_cookies=False)  # Or the client replaces the Cookie header
+                self.assertEqual(self.client.get("/items", headers=headers).get_json(), {"calls": 1})
+                self.assertEqual(len(self.cache), 0)
+                self.assertEqual(self.client.get("/items").get_json(), {"calls": 2})
+                self.assertEqual(self.client.get("/items", headers=headers).get_json(), {"calls": 3})
+
+        self.setUp()
+        self.cache = ResponseCache(share_credentialed=True)
+        self.view(lambda: Responder.json.ok({"calls": self.calls}))
+        self.client.get("/view", headers={"Authorization": "Bearer a"})
+        self.assertEqual(self.client.get("/view").get_json(), {"calls": 1})
+
+        self.setUp()
+        self.cache = ResponseCache(headers=("Authorization",))
+        self.view(lambda: Responder.json.ok({"calls": self.calls}))
+        self.client.get("/view", headers={"Authorization": "Bearer a"})
+        self.assertEqual(self.client.get("/view", headers={"Authorization": "Bearer b"}).get_json(), {"calls": 2})
+        self.assertEqual(self.client.get("/view", headers={"Authorization": "Bearer a"}).get_json(), {"calls": 1})
+
+    def test_not_found_is_cached(self):
+
+        self.view(lambda: Responder.json.not_found({"id": 1}))
+        self.client.get("/view")
+        self.assertEqual(self.client.get("/view").status_code, HTTPStatus.NOT_FOUND)
+        self.assertEqual(self.calls, 1)
+
+    def test_ttl(self):
+
+        self.cache.ttl = 10
+        with mock.patch("respond.body_cache.time.monotonic", return_value=100.0):
+            self.client.get("/items")
+        with mock.patch("respond.body_cache.time.monotonic", return_value=105.0):
+            self.assertEqual(self.client.get("/items").get_json(), {"calls": 1})
+        with mock.patch("respond.body_cache.time.monotonic", return_value=111.0):
+            self.assertEqual(self.client.get("/items").get_json(), {"calls": 2})
+
+    def test_lru_and_size(self):
+
+        for page in range(10):
+            self.client.get(f"/items?page={page}")
+        self.assertEqual(len(self.cache), 8)
+        self.assertEqual(self.cache.stats()["evictions"], 2)
+        self.assertGreater(self.cache.stats()["bytes"], 0)
+
+        small = ResponseCache(max_bytes=10)
+        with self.app.test_request_context("/"):
+            from flask import request
+            self.assertTrue(small.store(request, Responder.json.ok({"large": "x" * 100})))
+        self.assertEqual(len(small), 0)
+
+    def test_invalidate(self):
+
+        self.client.get("/items")
+        self.client.get("/items?page=2")
+        self.assertEqual(self.cache.invalidate_path("/items"), 2)
+        self.assertEqual(self.client.get("/items").get_json(), {"calls": 3})
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,196 @@
+from flask import Flask
+from respond import Responder, JSONResponse, SharedBodyCache
+from respond.shared_cache import SharedBody
+from respond.abs_http_response import HTTPResponse
+from respond.wsgi import WSGIResponder
+
+from werkzeug.test import create_environ
+from unittest import mock
+import multiprocessing
+import unittest
+import tempfile
+import shutil
+import json
+import os
+
+
+def _store_in_child(path: str) -> None:
+    cache = SharedBodyCache(path=path, maxsize=64, max_bytes=4096)
+    cache.set("from-child", b"stored by another process", JSONResponse)
+
+
+@unittest.skipUnless(SharedBodyCache.available, "File locks are not available")
+class TestSharedBodyCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "bodies.cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def cache(self, **kwargs) -> SharedBodyCache:
+        kwargs.setdefault("maxsize", 64)
+        kwargs.setdefault("max_bytes", 4096)
+        return SharedBodyCache(path=self.path, **kwargs)
+
+    def test_get_and_set(self):
+
+        cache = self.cache()
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", b"body")
+        body = cache.get("a")
+        self.assertIsInstance(body, SharedBody)
+        self.assertEqual(bytes(body), b"body")
+        self.assertIsNone(cache.get("a", namespace=JSONResponse))
+        self.assertEqual(cache.get_or_set("b", lambda: b"encoded"), b"encoded")
+        self.assertEqual(bytes(cache.get_or_set("b", lambda: b"again")), b"encoded")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"], stats["bytes"]), (2, 3, 2, 11))
+        self.assertEqual(len(cache), 2)
+
+    def test_shared_between_instances_and_processes(self):
+
+        cache = self.cache()
+        other = self.cache()
+        cache.set("key", b"shared", JSONResponse)
+        self.assertEqual(bytes(other.get("key", JSONResponse)), b"shared")
+
+        process = multiprocessing.get_context("fork").Process(target=_store_in_child, args=(self.path,))
+        process.start()
+        process.join(10)
+        self.assertEqual(process.exitcode, 0)
+        self.assertEqual(bytes(cache.get("from-child", JSONResponse)), b"stored by another process")
+
+    def test_forked_processes_reopen_the_file(self):
+
+        cache = self.cache()
+        cache.set("before-fork", b"1")
+        reader, writer = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            try:
+                body = cache.get("before-fork")
+                cache.set("after-fork", b"2")
+                os.write(writer, bytes(body) if body is not None else b"-")
+            finally:
+                os._exit(0)
+        os.close(writer)
+        self.assertEqual(os.read(reader, 10), b"1")
+        os.close(reader)
+        os.waitpid(pid, 0)
+        self.assertEqual(bytes(cache.get("after-fork")), b"2")
+
+    def test_versions(self):
+
+        self.cache(version="1.0").set("key", b"old")
+        self.assertIsNone(self.cache(version="2.0").get("key"))
+        self.assertEqual(bytes(self.cache(version="1.0").get("key")), b"old")
+
+    def test_oldest_bodies_are_overwritten(self):
+
+        cache = self.cache(max_bytes=100)
+        for i in range(10):
+            cache.set(i, bytes([i]) * 30)
+        self.assertEqual([i for i in range(10) if cache.get(i) is not None], [7, 8, 9])
+        self.assertEqual(bytes(cache.get(9)), b"\x09" * 30)
+        self.assertLessEqual(cache.stats()["bytes"], 100)
+
+        cache.set("too large", b"x" * 101)
+        self.assertIsNone(cache.get("too large"))
+
+    def test_bodies_overwritten_while_sent(self):
+
+        cache = self.cache(max_bytes=64)
+        cache.set("a", b"A" * 40)
+        body = cache.get("a")
+        body.chunk_size = 8
+        chunks = iter(body)
+        self.assertEqual(next(chunks), b"A" * 8)
+        self.assertEqual(len(cache.get("a")), 1)
+
+        cache.set("b", b"B" * 40)
+        cache.set("c", b"C" * 40)
+        with self.assertRaises(RuntimeError):
+            next(chunks)
+        self.assertIsNone(cache.get("a"))
+
+        app = Flask(__name__)
+        cache.set("d", b"D" * 40, JSONResponse)
+        with mock.patch.object(HTTPResponse, "body_cache", cache):
+            with app.test_request_context():
+                response = Responder.json.ok(None, cache_key="d")
+                cache.set("e", b"E" * 40)
+                cache.set("f", b"F" * 40)
+                with self.assertRaises(RuntimeError):
+                    response.get_data()
+
+    def test_index_is_bounded(self):
+
+        cache = self.cache(maxsize=8)
+        for i in range(100):
+            cache.set(i, b"x")
+        self.assertLessEqual(len(cache), 8)
+        self.assertGreater(cache.stats()["evictions"], 0)
+        self.assertIsNotNone(cache.get(99))
+
+    def test_ttl(self):
+
+        cache = self.cache(ttl=10)
+        with mock.patch("respond.shared_cache.time.time", return_value=1000.0):
+            cache.set("key", b"body")
+        with mock.patch("respond.shared_cache.time.time", return_value=1005.0):
+            self.assertIsNotNone(cache.get("key"))
+        with mock.patch("respond.shared_cache.time.time", return_value=1011.0):
+            self.assertIsNone(cache.get("key"))
+
+    def test_invalidate_and_clear(self):
+
+        cache = self.cache()
+        cache.set("key", b"1", JSONResponse)
+        cache.set("key", b"2")
+        cache.set("other", b"3")
+        self.assertEqual(cache.invalidate("key"), 2)
+        self.assertIsNone(cache.get("key"))
+        cache.clear()
+        self.assertIsNone(cache.get("other"))
+
+    def test_other_limits_replace_the_file(self):
+
+        small = self.cache()
+        small.set("key", b"body")
+        large = self.cache(max_bytes=8192)
+        self.assertIsNone(large.get("key"))
+        self.assertEqual(bytes(small.get("key")), b"body")  # Still mapping the file it opened
+
+    def test_responses(self):
+
+        cache = self.cache(max_bytes=64 * 1024)
+        app = Flask(__name__)
+        data = {"items": list(range(100))}
+        with mock.patch.object(HTTPResponse, "body_cache", cache):
+            with app.test_request_context():
+                first = Responder.json.ok(data, cache_key="items")
+                second = Responder.json.ok(None, cache_key="items", headers={"X-Custom": "1"})
+                self.assertEqual(first.get_json(), data)
+                self.assertEqual(second.get_json(), data)
+                self.assertEqual(second.headers["Content-Length"], str(len(first.get_data())))
+                self.assertEqual(second.headers["Content-Type"], "application/json")
+                self.assertEqual(second.headers["X-Custom"], "1")
+
+                Responder.xml.ok(data, cache_key="items")
+                self.assertIn(b"<items>99</items>", Responder.xml.ok({"stale": True}, cache_key="items").get_data())
+                Responder.msgpack.ok(data, cache_key="items")
+                self.assertEqual(Responder.msgpack.ok(None, cache_key="items").get_data(),
+                                 Responder.msgpack.ok(data).get_data())
+
+            WSGIResponder.json.ok(data, cache_key="items")
+            raw = WSGIResponder.json.ok(None, cache_key="items")
+            chunks = list(raw(create_environ("/"), lambda status, headers, exc_info=None: None))
+        self.assertTrue(all(type(chunk) is bytes for chunk in chunks))
+        self.assertEqual(json.loads(b"".join(chunks)), data)
+        self.assertEqual(cache.stats()["size"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
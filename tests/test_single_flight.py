@@ -0,0 +1,236 @@
+from flask import Flask
+from respond import Responder, ResponseCache, BodyCache, SingleFlight
+
+from concurrent.futures import ThreadPoolExecutor
+import unittest
+import threading
+import asyncio
+import time
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def run_threads(self, count, target):
+        with ThreadPoolExecutor(count) as executor:
+            futures = [executor.submit(target) for _ in range(count)]
+        return [future.exception() or future.result() for future in futures]
+
+    def slow(self, started: threading.Event, release: threading.Event, result=None, error=None):
+        """ Returns a computation which blocks until `release` is set, counting its calls """
+        self.calls = 0
+
+        def compute():
+            self.calls += 1
+            started.set()
+            release.wait(5)
+            if error is not None:
+                raise error
+            return result
+
+        return compute
+
+    def coalesce(self, flights, compute, count=8):
+        """ Starts one call, then `count - 1` more while it is in flight, returning every caller's result """
+        started, release = threading.Event(), threading.Event()
+        compute = self.slow(started, release, **compute)
+        with ThreadPoolExecutor(count) as executor:
+            futures = [executor.submit(flights.do, "key", compute)]
+            started.wait(5)
+            futures.extend(executor.submit(flights.do, "key", compute) for _ in range(count - 1))
+            time.sleep(0.05)  # Long enough for the other calls to start waiting
+            release.set()
+        return [future.exception() or future.result() for future in futures]
+
+    def test_threads_share_one_computation(self):
+
+        flights = SingleFlight()
+        result = object()
+        self.assertEqual(self.coalesce(flights, {"result": result}), [result] * 8)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(flights.shared, 7)
+        self.assertEqual(len(flights), 0)
+        self.assertEqual(flights.do("key", lambda: 2), 2)
+
+    def test_errors_are_raised_by_every_caller(self):
+
+        error = ValueError("failed")
+        self.assertEqual(self.coalesce(SingleFlight(), {"error": error}), [error] * 8)
+        self.assertEqual(self.calls, 1)
+
+    def test_waiters_time_out(self):
+
+        flights = SingleFlight(timeout=0.01)
+        started, release = threading.Event(), threading.Event()
+        compute = self.slow(started, release, result=1)
+        with ThreadPoolExecutor(2) as executor:
+            leader = executor.submit(flights.do, "key", compute)
+            started.wait(5)
+            with self.assertRaises(TimeoutError):
+                flights.do("key", compute)
+            release.set()
+            self.assertEqual(leader.result(), 1)
+
+    def test_different_keys_run_separately(self):
+
+        flights = SingleFlight()
+        keys = iter(range(8))
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                key = next(keys)
+            return flights.do(key, lambda: key)
+
+        self.assertEqual(sorted(self.run_threads(8, call)), list(range(8)))
+
+
+class TestSingleFlightAsync(unittest.TestCase):
+
+    def run_async(self, coroutine):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def test_tasks_share_one_computation(self):
+
+        calls = []
+
+        async def compute():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "result"
+
+        async def main():
+            flights = SingleFlight()
+            results = await asyncio.gather(*(flights.do_async("key", compute) for _ in range(8)))
+            return flights, results
+
+        flights, results = self.run_async(main())
+        self.assertEqual(results, ["result"] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flights.shared, 7)
+        self.assertEqual(len(flights), 0)
+
+    def test_errors_and_timeouts(self):
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "late"
+
+        async def main():
+            flights = SingleFlight()
+            errors = await asyncio.gather(*(flights.do_async("fail", fail) for _ in range(3)),
+                                          return_exceptions=True)
+            first = asyncio.ensure_future(flights.do_async("slow", slow, timeout=0.01))
+            second = asyncio.ensure_future(flights.do_async("slow", slow))
+            with self.assertRaises(TimeoutError):
+                await first
+            return errors, await second
+
+        errors, late = self.run_async(main())
+        self.assertTrue(all(isinstance(error, ValueError) for error in errors))
+        self.assertEqual(late, "late")
+
+    def test_cancelling_the_first_caller(self):
+
+        async def slow():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def main():
+            flights = SingleFlight()
+            first = asyncio.ensure_future(flights.do_async("key", slow))
+            second = asyncio.ensure_future(flights.do_async("key", slow))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(self.run_async(main()), "done")
+
+
+class TestCoalescedCaches(unittest.TestCase):
+
+    def test_body_cache(self):
+
+        cache = BodyCache()
+        calls = []
+
+        def encode():
+            calls.append(1)
+            time.sleep(0.05)
+            return b"body"
+
+        with ThreadPoolExecutor(8) as executor:
+            bodies = list(executor.map(lambda _: cache.get_or_set("key", encode), range(8)))
+        self.assertEqual(bodies, [b"body"] * 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.stats()["coalesced"] + cache.stats()["hits"], 7)
+
+    def test_response_cache(self):
+
+        app = Flask(__name__)
+        cache = ResponseCache()
+        calls = []
+
+        @app.route("/report")
+        @cache.cached
+        def report():
+            calls.append(1)
+            time.sleep(0.05)
+            return Responder.json.ok({"total": 1})
+
+        @app.route("/private")
+        @cache.cached
+        def private():
+            calls.append(1)
+            time.sleep(0.05)
+            return Responder.json.ok({"user": 1}, headers={"Cache-Control": "private"})
+
+        def get(path):
+            response = app.test_client().get(path)
+            return response.status_code, response.get_json()
+
+        with ThreadPoolExecutor(8) as executor:
+            responses = list(executor.map(get, ["/report"] * 8))
+        self.assertEqual(responses, [(200, {"total": 1})] * 8)
+        self.assertEqual(len(calls), 1)
+
+        calls.clear()
+        with ThreadPoolExecutor(4) as executor:
+            responses = list(executor.map(get, ["/private"] * 4))
+        self.assertEqual(responses, [(200, {"user": 1})] * 4)
+        self.assertEqual(len(calls), 4)
+
+    def test_response_cache_vary(self):
+
+        app = Flask(__name__)
+        app.config["RESPOND_COMPRESSION"] = True
+        cache = ResponseCache()
+        started = threading.Event()
+
+        @app.route("/rows")
+        @cache.cached
+        def rows():
+            started.set()
+            time.sleep(0.05)
+            return Responder.json.ok({"rows": ["row"] * 200})
+
+        def get(encoding):
+            response = app.test_client().get("/rows", headers={"Accept-Encoding": encoding})
+            return response.headers.get("Content-Encoding", "identity")
+
+        with ThreadPoolExecutor(2) as executor:
+            gzip = executor.submit(get, "gzip")
+            started.wait(5)
+            identity = executor.submit(get, "identity")
+        self.assertEqual((gzip.result(), identity.result()), ("gzip", "identity"))
+
+
+if __name__ == "__main__":
+    unittest.main()
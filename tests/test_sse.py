@@ -0,0 +1,229 @@
+from flask import Flask
+from respond import Responder, SSEResponse, Event
+from respond.asgi import AsyncResponder, ASGIResponse, set_executor
+from respond.sse import HEARTBEAT, format_event, iter_events, aiter_events
+
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+import unittest
+import asyncio
+import threading
+import time
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(chunks) -> list:
+    return [chunk async for chunk in chunks]
+
+
+async def numbers(count: int, delay: float = 0):
+    for i in range(count):
+        if delay:
+            await asyncio.sleep(delay)
+        yield Event({"n": i}, id=i)
+
+
+def create_app() -> Flask:
+
+    app = Flask(__name__)
+
+    @app.route("/events")
+    def events():
+        return Responder.sse.ok(iter([Event("hello", id=1, event="greeting"), {"a": 1}]), headers={"X-Custom": "OK"})
+
+    @app.route("/resume")
+    def resume():
+        return Responder.sse.ok(lambda last_event_id: (Event(i, id=i) for i in range(int(last_event_id or 0) + 1, 4)))
+
+    @app.route("/async")
+    def async_events():
+        return Responder.sse.ok(numbers(2))
+
+    @app.route("/empty")
+    def empty():
+        return Responder.sse.no_content()
+
+    return app
+
+
+class TestFraming(unittest.TestCase):
+
+    def test_fields(self):
+
+        self.assertEqual(
+            format_event(Event({"a": 1}, id=7, event="update", retry=3000)),
+            b'id: 7\nevent: update\nretry: 3000\ndata: {"a":1}\n\n'
+        )
+        self.assertEqual(format_event({"data": "x"}), b'data: {"data":"x"}\n\n')
+        self.assertEqual(format_event("plain"), b"data: plain\n\n")
+
+    def test_multiline_data(self):
+
+        self.assertEqual(format_event("one\ntwo\r\nthree\rfour"), b"data: one\ndata: two\ndata: three\ndata: four\n\n")
+
+    def test_invalid_fields(self):
+
+        with self.assertRaises(ValueError):
+            format_event(Event("x", id="1\n2"))
+        with self.assertRaises(ValueError):
+            format_event(Event("x", event="a\rb"))
+
+
+class TestSyncStream(unittest.TestCase):
+
+    def test_heartbeat_on_idle_ticks(self):
+
+        chunks = list(iter_events([None, "a", None], heartbeat=0))
+        self.assertEqual(chunks, [HEARTBEAT, b"data: a\n\n"])
+
+        def idle():
+            for _ in range(2):
+                time.sleep(0.01)
+                yield None
+
+        self.assertEqual(list(iter_events(idle(), heartbeat=0.005)), [HEARTBEAT, HEARTBEAT, HEARTBEAT])
+
+    def test_batching(self):
+
+        chunks = list(iter_events(["a", "b", "c", None, "d"], batch_size=2))
+        self.assertEqual(chunks, [HEARTBEAT, b"data: a\n\ndata: b\n\n", b"data: c\n\n", b"data: d\n\n"])
+
+
+class TestAsyncStream(unittest.TestCase):
+
+    def test_events(self):
+
+        chunks = run(collect(aiter_events(numbers(2))))
+        self.assertEqual(chunks, [HEARTBEAT, b'id: 0\ndata: {"n":0}\n\n', b'id: 1\ndata: {"n":1}\n\n'])
+
+    def test_heartbeat_while_waiting(self):
+
+        chunks = run(collect(aiter_events(numbers(1, delay=0.05), heartbeat=0.01)))
+        self.assertGreaterEqual(chunks.count(HEARTBEAT), 3)
+        self.assertEqual(chunks[-1], b'id: 0\ndata: {"n":0}\n\n')
+
+    def test_batches_ready_events(self):
+
+        chunks = run(collect(aiter_events(numbers(5), batch_size=2)))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(b"".join(chunks[1:]).count(b"data:"), 5)
+
+    def test_closes_source(self):
+
+        closed = []
+
+        async def source():
+            try:
+                while True:
+                    await asyncio.sleep(1)
+                    yield "never"
+            finally:
+                closed.append(True)
+
+        async def first_chunks():
+            stream = aiter_events(source(), heartbeat=0.01)
+            chunks = [await stream.__anext__(), await stream.__anext__()]
+            await stream.aclose()
+            return chunks
+
+        self.assertEqual(run(first_chunks()), [HEARTBEAT, HEARTBEAT])
+        self.assertEqual(closed, [True])
+
+
+class TestSSEResponse(unittest.TestCase):
+
+    def setUp(self):
+        self.app = create_app()
+        self.client = self.app.test_client()
+
+    def test_events(self):
+
+        response = self.client.get("/events")
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertEqual(response.mimetype, SSEResponse.content_type)
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+        self.assertEqual(response.headers["X-Custom"], "OK")
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.data, HEARTBEAT + b'id: 1\nevent: greeting\ndata: hello\n\ndata: {"a":1}\n\n')
+
+    def test_resume_from_last_event_id(self):
+
+        self.assertEqual(self.client.get("/resume").data.count(b"id:"), 3)
+        response = self.client.get("/resume", headers={"Last-Event-ID": "2"})
+        self.assertEqual(response.data, HEARTBEAT + b"id: 3\ndata: 3\n\n")
+
+    def test_async_source(self):
+
+        self.assertEqual(self.client.get("/async").data.count(b"data:"), 2)
+
+    def test_bodiless_status(self):
+
+        response = self.client.get("/empty")
+        self.assertEqual(response.status_code, HTTPStatus.NO_CONTENT)
+        self.assertEqual(response.data, b"")
+
+
+class TestAsyncSSEResponse(unittest.TestCase):
+
+    def test_async_source(self):
+
+        async def respond():
+            messages = []
+
+            async def send(message):
+                messages.append(message)
+
+            response = await AsyncResponder.sse.ok(numbers(2), last_event_id=None)
+            self.assertIsInstance(response, ASGIResponse)
+            await response({"type": "http", "method": "GET"}, None, send)
+            return messages
+
+        messages = run(respond())
+        headers = dict(messages[0]["headers"])
+        self.assertEqual(headers[b"content-type"], b"text/event-stream")
+        self.assertEqual(headers[b"cache-control"], b"no-cache")
+        self.assertNotIn(b"content-length", headers)
+        self.assertEqual(b"".join(m["body"] for m in messages[1:]).count(b"data:"), 2)
+
+    def test_sync_source_leaves_the_pool_free(self):
+
+        pool = ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        threads = []
+
+        def events():
+            threads.append(threading.current_thread())
+            yield Event("x")
+
+        async def respond():
+            busy = asyncio.get_event_loop().run_in_executor(pool, release.wait)
+            try:
+                response = await AsyncResponder.sse.ok(events(), heartbeat=None, last_event_id=None)
+                return await asyncio.wait_for(collect(response.body), 5)
+            finally:
+                release.set()
+                await busy
+
+        set_executor(pool)
+        try:
+            self.assertEqual(run(respond())[-1], b"data: x\n\n")
+        finally:
+            set_executor(None)
+            pool.shutdown()
+        self.assertTrue(threads[0].name.startswith("respond-stream"))
+
+    def test_resume(self):
+
+        events = run(AsyncResponder.sse.ok(lambda last_event_id: [Event("x", id=last_event_id)], last_event_id="9"))
+        self.assertEqual(run(collect(events.body))[-1], b"id: 9\ndata: x\n\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from flask import Flask
+from respond import Responder, STATUSES
+from respond.status import status_info, status_line, allows_body
+from respond.wsgi import WSGIResponder
+from respond.asgi import AsyncResponder
+
+from http import HTTPStatus
+import unittest
+import asyncio
+
+
+class TestStatusTable(unittest.TestCase):
+
+    def test_table(self):
+
+        for status in HTTPStatus:
+            self.assertEqual(STATUSES[status].line, f"{status.value} {status.phrase}")
+        self.assertEqual(STATUSES[418].line, "418 I'm a Teapot")
+        self.assertEqual(STATUSES[205].headers, (("Content-Length", "0"),))
+        with self.assertRaises(TypeError):
+            STATUSES[200] = None
+
+    def test_allows_body(self):
+
+        for code in (100, 103, 204, 205, 304):
+            self.assertFalse(allows_body(code))
+        for code in (200, 404, 599):
+            self.assertTrue(allows_body(code))
+
+    def test_status_info(self):
+
+        self.assertIs(status_info(404), STATUSES[404])
+        self.assertEqual(status_info(599).line, "599 UNKNOWN")
+        self.assertEqual(status_line(599), "599 UNKNOWN")
+        for code in (99, 600):
+            with self.assertRaises(ValueError):
+                status_info(code)
+
+
+class TestStatusMethod(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+
+    def test_status(self):
+
+        with self.app.test_request_context("/"):
+            r = Responder.json.status(404, {"error": "not found"})
+            self.assertEqual(r.status_code, HTTPStatus.NOT_FOUND)
+            self.assertEqual(r.get_json(), {"error": "not found"})
+            self.assertEqual(Responder.text.status(HTTPStatus.CREATED).status_code, HTTPStatus.CREATED)
+            self.assertEqual(Responder.text.status(599, "Upstream").status_code, 599)
+            with self.assertRaises(ValueError):
+                Responder.json.status(1000)
+
+    def test_bodiless_statuses_skip_serialization(self):
+
+        class Unserializable(object):
+            pass
+
+        with self.app.test_request_context("/"):
+            r = Responder.json.status(204, Unserializable(), stream="ndjson")
+            self.assertEqual(r.status_code, HTTPStatus.NO_CONTENT)
+            r = Responder.json.not_modified(Unserializable(), headers={"ETag": '"v1"'})
+            self.assertEqual(r.headers["ETag"], '"v1"')
+            r = Responder.text.reset_content("ignored")
+            self.assertEqual(r.headers["Content-Length"], "0")
+
+    def test_bodiless_statuses_send_empty_bodies(self):
+
+        with self.app.test_request_context("/"):
+            for responder in (Responder.json, Responder.msgpack, Responder.problem, Responder.xml, Responder.text):
+                for headers in (None, {"X-Custom": "1"}):
+                    r = responder.reset_content({"ignored": True}, headers=headers)
+                    self.assertEqual((r.get_data(), r.headers["Content-Length"]), (b"", "0"), responder)
+                    self.assertEqual(responder.no_content(headers=headers).get_data(), b"", responder)
+
+    def test_bodiless_raw_responses(self):
+
+        r = WSGIResponder.json.no_content({"ignored": True})
+        self.assertEqual((r.headers, r.body), ([], b""))
+
+        loop = asyncio.new_event_loop()
+        try:
+            r = loop.run_until_complete(AsyncResponder.json.not_modified({"ignored": True}))
+        finally:
+            loop.close()
+        self.assertEqual((r.headers, r.body), ([], b""))
@@ -0,0 +1,109 @@
+from flask import Flask
+from respond import Responder, RawJSON
+from respond.streaming import iter_chunks, iter_json_array
+
+from http import HTTPStatus
+import unittest
+import json
+
+
+def rows(n: int):
+    for i in range(n):
+        yield {"id": i}
+
+
+def create_app() -> Flask:
+
+    app = Flask(__name__)
+
+    @app.route("/array")
+    def array():
+        return Responder.json.ok(rows(1000), chunk_size=512)
+
+    @app.route("/empty")
+    def empty():
+        return Responder.json.ok(iter(()))
+
+    @app.route("/ndjson")
+    def ndjson():
+        return Responder.json.created([{"id": 1}, {"id": 2}], stream="ndjson", headers={"X-Custom": "OK"})
+
+    return app
+
+
+class TestStreamingHelpers(unittest.TestCase):
+
+    def test_iter_chunks(self):
+
+        chunks = list(iter_chunks((b"ab" for _ in range(10)), chunk_size=5))
+        self.assertEqual(chunks, [b"ababab", b"ababab", b"ababab", b"ab"])
+
+    def test_iter_json_array_is_lazy(self):
+
+        consumed = []
+
+        def items():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        chunks = iter_json_array(items(), lambda o: json.dumps(o).encode(), chunk_size=1)
+        self.assertEqual(consumed, [])
+        self.assertEqual(next(chunks), b"[")
+        self.assertEqual(b"".join(chunks), b"0,1,2]")
+
+
+class TestStreamingJSONResponse(unittest.TestCase):
+
+    def setUp(self) -> None:
+        app = create_app()
+        self.test_client = app.test_client()
+
+    def test_json_array_stream(self):
+
+        r = self.test_client.get("/array")
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(r.content_type, "application/json")
+        self.assertTrue(r.is_streamed)
+        self.assertEqual(json.loads(r.data), [{"id": i} for i in range(1000)])
+
+    def test_empty_stream(self):
+
+        r = self.test_client.get("/empty")
+        self.assertEqual(json.loads(r.data), [])
+
+    def test_ndjson_stream(self):
+
+        r = self.test_client.get("/ndjson")
+        self.assertEqual(r.status_code, HTTPStatus.CREATED)
+        self.assertEqual(r.content_type, "application/x-ndjson")
+        self.assertEqual(r.headers["X-Custom"], "OK")
+        self.assertEqual([json.loads(line) for line in r.data.splitlines()], [{"id": 1}, {"id": 2}])
+
+    @unittest.skipUnless(hasattr(Flask, "json_provider_class"), "Flask before 2.2 has no JSON providers")
+    def test_app_json_provider(self):
+
+        from flask.json.provider import DefaultJSONProvider
+
+        class SetProvider(DefaultJSONProvider):
+            sort_keys = False
+
+            @staticmethod
+            def default(o):
+                return sorted(o) if isinstance(o, set) else DefaultJSONProvider.default(o)
+
+        app = Flask(__name__)
+        app.json = SetProvider(app)
+        app.debug = True
+
+        @app.route("/sets")
+        def sets():
+            return Responder.json.ok(iter([{"b": {2, 1}, "a": RawJSON(b'{"x":1}')}]), stream="ndjson")
+
+        r = app.test_client().get("/sets")
+        self.assertEqual(r.data, b'{"b":[1,2],"a":{"x":1}}\n')
+
+    def test_unknown_stream_format(self):
+
+        with self.assertRaises(ValueError):
+            Responder.json.ok([], stream="csv")
@@ -0,0 +1,68 @@
+from flask import Flask
+from respond import Responder, JSONResponse, TextResponse
+from respond.template import ResponseTemplate
+
+from http import HTTPStatus
+import unittest
+import json
+
+
+class TestResponseTemplate(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+
+    def test_template_builds_once(self):
+
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return TextResponse._make_response(HTTPStatus.NOT_FOUND, "Not found", {"X-Custom": "OK"})
+
+        template = ResponseTemplate(factory)
+        with self.app.app_context():
+            first = template()
+            second = template(headers={"X-Extra": "1"})
+
+        self.assertEqual(len(calls), 1)
+        self.assertIsNot(first, second)
+        for r in (first, second):
+            self.assertEqual(r.status_code, HTTPStatus.NOT_FOUND)
+            self.assertEqual(r.get_data(), b"Not found")
+            self.assertEqual(r.headers["Content-Length"], "9")
+            self.assertEqual(r.headers["Content-Type"], "text/plain; charset=utf-8")
+            self.assertEqual(r.headers["X-Custom"], "OK")
+        self.assertNotIn("X-Extra", first.headers)
+        self.assertEqual(second.headers["X-Extra"], "1")
+
+    def test_declared_template(self):
+
+        template = Responder.json.template(HTTPStatus.GONE, {"error": "Gone"})
+        with self.app.app_context():
+            r = template()
+
+        self.assertEqual(r.status_code, HTTPStatus.GONE)
+        self.assertEqual(r.content_type, "application/json")
+        self.assertEqual(json.loads(r.get_data()), {"error": "Gone"})
+
+    def test_no_data_calls_use_templates(self):
+
+        class CountingJSONResponse(JSONResponse):
+            calls = 0
+
+            @classmethod
+            def _make_response(cls, status, data=None, headers=None, **kwargs):
+                cls.calls += 1
+                return super()._make_response(status, data, headers, **kwargs)
+
+        with self.app.app_context():
+            for _ in range(3):
+                r = CountingJSONResponse.not_found()
+                self.assertEqual(r.status_code, HTTPStatus.NOT_FOUND)
+                self.assertEqual(json.loads(r.get_data()), "")
+            self.assertEqual(CountingJSONResponse.calls, 1)
+
+            CountingJSONResponse.not_found({"error": "Not found"})
+            CountingJSONResponse.not_found(headers={"X-Custom": "OK"})
+            self.assertEqual(CountingJSONResponse.calls, 3)
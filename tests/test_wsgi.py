@@ -0,0 +1,93 @@
+from flask import Flask
+from respond.wsgi import WSGIResponder, RawResponse, status_line
+from werkzeug.test import Client
+
+from http import HTTPStatus
+import unittest
+import json
+
+
+def application(environ, start_response):
+    path = environ["PATH_INFO"]
+    if path == "/json":
+        response = WSGIResponder.json.ok({"test": [1, 2, 3]})
+    elif path == "/stream":
+        response = WSGIResponder.json.ok(({"id": i} for i in range(3)), stream="ndjson")
+    elif path == "/xml":
+        response = WSGIResponder.xml.created("<ok/>", headers={"X-Custom": "xml"})
+    elif path == "/text":
+        response = WSGIResponder.text.ok(b"bytes", headers={"Content-Type": "text/csv"})
+    else:
+        response = WSGIResponder.json.not_found()
+    return response(environ, start_response)
+
+
+class TestRawResponse(unittest.TestCase):
+
+    def test_status_line(self):
+
+        self.assertEqual(status_line(HTTPStatus.NOT_FOUND), "404 Not Found")
+        self.assertEqual(status_line(418), "418 I'm a Teapot")
+        self.assertEqual(status_line(599), "599 UNKNOWN")
+
+    def test_to_wsgi(self):
+
+        response = WSGIResponder.text.ok("Test OK")
+        self.assertIsInstance(response, RawResponse)
+        status, headers, body = response.to_wsgi()
+        self.assertEqual(status, "200 OK")
+        self.assertEqual(
+            headers, [("Content-Type", "text/plain; charset=utf-8"), ("Content-Length", "7")]
+        )
+        self.assertEqual(list(body), [b"Test OK"])
+
+
+class TestWSGIResponder(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.client = Client(application)
+
+    def test_json(self):
+
+        r = self.client.get("/json")
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(r.headers["Content-Type"], "application/json")
+        self.assertEqual(json.loads(r.data), {"test": [1, 2, 3]})
+
+    def test_empty(self):
+
+        r = self.client.get("/missing")
+        self.assertEqual(r.status_code, HTTPStatus.NOT_FOUND)
+        self.assertEqual(json.loads(r.data), "")
+
+    def test_stream(self):
+
+        r = self.client.get("/stream")
+        self.assertEqual(r.headers["Content-Type"], "application/x-ndjson")
+        self.assertNotIn("Content-Length", r.headers)
+        self.assertEqual([json.loads(line) for line in r.data.splitlines()], [{"id": 0}, {"id": 1}, {"id": 2}])
+
+    def test_headers(self):
+
+        r = self.client.get("/xml")
+        self.assertEqual(r.status_code, HTTPStatus.CREATED)
+        self.assertEqual(r.headers["Content-Type"], "text/xml; charset=utf-8")
+        self.assertEqual(r.headers["X-Custom"], "xml")
+
+        r = self.client.get("/text")
+        self.assertEqual(r.headers.getlist("Content-Type"), ["text/csv"])
+        self.assertEqual(r.data, b"bytes")
+
+    def test_head(self):
+
+        r = self.client.head("/json")
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(r.data, b"")
+
+    def test_flask_view(self):
+
+        app = Flask(__name__)
+        app.add_url_rule("/", "index", lambda: WSGIResponder.json.accepted([1]))
+        r = app.test_client().get("/")
+        self.assertEqual(r.status_code, HTTPStatus.ACCEPTED)
+        self.assertEqual(json.loads(r.data), [1])
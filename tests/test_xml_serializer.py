@@ -0,0 +1,115 @@
+from flask import Flask
+from respond import Responder
+from respond.wsgi import WSGIResponder
+from respond.xml_serializer import to_xml, iter_xml
+
+from xml.etree import ElementTree
+from http import HTTPStatus
+import unittest
+
+
+DECLARATION: bytes = b'<?xml version="1.0" encoding="UTF-8"?>'
+
+
+def users(n: int):
+    for i in range(n):
+        user = ElementTree.Element("user", id=str(i))
+        user.text = f"user-{i}"
+        yield user
+
+
+def create_app() -> Flask:
+
+    app = Flask(__name__)
+
+    @app.route("/dict")
+    def from_dict():
+        return Responder.xml.ok({"user": {"@id": 1, "name": "respond"}}, root="users")
+
+    @app.route("/stream")
+    def stream():
+        return Responder.xml.ok(users(500), root="users", chunk_size=256)
+
+    @app.route("/string")
+    def string():
+        return Responder.xml.ok("<ok/>")
+
+    return app
+
+
+class TestXMLSerializer(unittest.TestCase):
+
+    def test_dict(self):
+
+        data = {"user": [{"@id": 1, "name": "a & b", "active": True}, {"@id": '"2"', "#text": "x"}], "none": None}
+        self.assertEqual(
+            to_xml(data),
+            DECLARATION + b'<response><user id="1"><name>a &amp; b</name><active>true</active></user>'
+                          b'<user id=\'"2"\'>x</user><none/></response>'
+        )
+
+    def test_list_and_elements(self):
+
+        element = ElementTree.fromstring('<a x="1">t</a>')
+        self.assertEqual(to_xml([1, element], root="list"), DECLARATION + b'<list><item>1</item><a x="1">t</a></list>')
+        self.assertEqual(to_xml(element), DECLARATION + b'<a x="1">t</a>')
+        self.assertEqual(
+            to_xml({"wrapped": element}), DECLARATION + b'<response><wrapped><a x="1">t</a></wrapped></response>'
+        )
+
+    def test_nested_lists(self):
+
+        self.assertEqual(
+            to_xml({"a": [[1, 2], [3]]}),
+            DECLARATION + b"<response><a><item>1</item><item>2</item></a><a><item>3</item></a></response>"
+        )
+        self.assertEqual(
+            to_xml([[1, 2], 3], item="row"),
+            DECLARATION + b"<response><row><row>1</row><row>2</row></row><row>3</row></response>"
+        )
+        self.assertEqual(b"".join(iter_xml({"a": iter([[1, 2], [3]])})), to_xml({"a": [[1, 2], [3]]}))
+
+    def test_invalid_name(self):
+
+        for key in ("1st", "a b", "", "#note"):
+            with self.assertRaises(ValueError):
+                to_xml({key: 1})
+            with self.assertRaises(ValueError):
+                to_xml({"a": {key: 1}})
+
+    def test_iter_xml(self):
+
+        chunks = list(iter_xml(users(100), root="users", chunk_size=128))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), to_xml(list(users(100)), root="users"))
+        self.assertEqual(len(ElementTree.fromstring(b"".join(chunks))), 100)
+
+
+class TestXMLResponseSerialization(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.test_client = create_app().test_client()
+
+    def test_dict(self):
+
+        r = self.test_client.get("/dict")
+        self.assertEqual(r.status_code, HTTPStatus.OK)
+        self.assertEqual(r.content_type, "text/xml; charset=utf-8")
+        self.assertEqual(r.data, DECLARATION + b'<users><user id="1"><name>respond</name></user></users>')
+
+    def test_stream(self):
+
+        r = self.test_client.get("/stream")
+        self.assertTrue(r.is_streamed)
+        self.assertNotIn("Content-Length", r.headers)
+        root = ElementTree.fromstring(r.data)
+        self.assertEqual((root.tag, len(root), root[499].text), ("users", 500, "user-499"))
+
+    def test_string_unchanged(self):
+
+        self.assertEqual(self.test_client.get("/string").data, b"<ok/>")
+
+    def test_raw(self):
+
+        r = WSGIResponder.xml.ok({"id": 1})
+        self.assertEqual(r.body, DECLARATION + b"<response><id>1</id></response>")